@@ -5,7 +5,7 @@ A system for managing multiple Claude Code instances in parallel,
 enabling coordinated task distribution and execution.
 """
 
-from .orchestrator import Orchestrator, Task, TaskResult
+from .orchestrator import Orchestrator, Task, TaskResult, create_task
 from .agent import ClaudeAgent, AgentConfig
 from .protocol import Agent2AgentProtocol, AgentMessage, MessageType
 
@@ -16,6 +16,7 @@ __all__ = [
     "Orchestrator",
     "Task",
     "TaskResult", 
+    "create_task",
     "ClaudeAgent",
     "AgentConfig",
     "Agent2AgentProtocol",
@@ -10,6 +10,7 @@ import time
 import json
 import os
 import signal
+import sys
 from dataclasses import dataclass, asdict
 from typing import Optional, Dict, Any, List, Tuple
 import logging
@@ -47,7 +48,10 @@ class CommandResult:
     exit_code: int
     timestamp: float
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class Task:
     """Task definition"""
     task_id: str
@@ -58,12 +62,16 @@ class Task:
     subtasks: Optional[List[Dict[str, Any]]] = None
     priority: int = 5  # 1-10, 10 is highest
     timeout: float = 300.0  # 5 minutes
+    queue_time: float = 0.0  # Set by task queues when the task is dequeued
     
     def __post_init__(self):
         if self.files is None:
             self.files = []
+        # Task types come from a small set; interned keys compare by identity
+        if type(self.task_type) is str:
+            self.task_type = sys.intern(self.task_type)
 
-@dataclass
+@dataclass(**_SLOTS)
 class TaskResult:
     """Task execution result"""
     task_id: str
@@ -77,6 +85,20 @@ class TaskResult:
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = time.time()
+        if type(self.status) is str:
+            self.status = sys.intern(self.status)
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Field values as a dict, without asdict's deep copy"""
+        return {
+            "task_id": self.task_id,
+            "agent_id": self.agent_id,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "execution_time": self.execution_time,
+            "timestamp": self.timestamp
+        }
 
 class ClaudeCodeWrapper:
     """Wrapper for Claude Code processes"""
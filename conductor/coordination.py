@@ -8,7 +8,7 @@ import uuid
 import threading
 import queue
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Any, Callable, Set
+from typing import Dict, List, Optional, Any, Callable, Set, Tuple
 from enum import Enum
 import logging
 
@@ -465,18 +465,18 @@ def create_enhanced_dashboard_app() -> FastAPI:
             tracing = get_tracing_middleware()
             
             # Look in active traces first
-            if trace_id in tracing.active_traces:
-                trace = tracing.active_traces[trace_id]
+            trace = tracing.get_active_trace(trace_id)
+            if trace is not None:
                 return JSONResponse(content={
-                    'trace': asdict(trace),
+                    'trace': trace.to_dict(),
                     'status': 'active'
                 })
             
             # Look in completed traces
-            for trace in tracing.completed_traces:
+            for trace in tracing.get_completed_traces():
                 if trace.trace_id == trace_id:
                     return JSONResponse(content={
-                        'trace': asdict(trace),
+                        'trace': trace.to_dict(),
                         'status': 'completed'
                     })
             
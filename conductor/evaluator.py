@@ -7,7 +7,7 @@ LLM-as-judge評価システム
 import time
 import json
 import sqlite3
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Union, Tuple, Callable
 from enum import Enum
 from datetime import datetime, timedelta
@@ -70,6 +70,17 @@ class CriteriaScore:
     def weighted_score(self) -> float:
         """重み付きスコア"""
         return (self.score / self.max_score) * self.weight * 100
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書に変換（asdict の再帰的な deepcopy を避ける）"""
+        return {
+            "criteria": self.criteria,
+            "score": self.score,
+            "max_score": self.max_score,
+            "weight": self.weight,
+            "feedback": self.feedback,
+            "suggestions": list(self.suggestions)
+        }
 
 @dataclass
 class EvaluationResult:
@@ -98,6 +109,21 @@ class EvaluationResult:
             return "D"
         else:
             return "F"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書に変換"""
+        return {
+            "task_id": self.task_id,
+            "agent_id": self.agent_id,
+            "task_type": self.task_type,
+            "overall_score": self.overall_score,
+            "criteria_scores": [score.to_dict() for score in self.criteria_scores],
+            "overall_feedback": self.overall_feedback,
+            "improvement_suggestions": list(self.improvement_suggestions),
+            "evaluation_timestamp": self.evaluation_timestamp,
+            "evaluator_id": self.evaluator_id,
+            "confidence_level": self.confidence_level
+        }
 
 @dataclass
 class QualityTrend:
@@ -111,6 +137,20 @@ class QualityTrend:
     best_score: float
     worst_score: float
     common_issues: List[str]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書に変換"""
+        return {
+            "agent_id": self.agent_id,
+            "task_type": self.task_type,
+            "time_period": self.time_period,
+            "average_score": self.average_score,
+            "score_trend": self.score_trend,
+            "evaluation_count": self.evaluation_count,
+            "best_score": self.best_score,
+            "worst_score": self.worst_score,
+            "common_issues": list(self.common_issues)
+        }
 
 class LLMJudgeEvaluator:
     """LLM-as-judge評価システム"""
@@ -911,8 +951,8 @@ class LLMJudgeEvaluator:
             "generated_at": datetime.now().isoformat(),
             "time_period": time_period,
             "overall_stats": self.evaluation_stats,
-            "quality_trends": [asdict(trend) for trend in trends],
-            "recent_evaluations": [asdict(eval_result) for eval_result in recent_evaluations[:20]],
+            "quality_trends": [trend.to_dict() for trend in trends],
+            "recent_evaluations": [eval_result.to_dict() for eval_result in recent_evaluations[:20]],
             "summary": {
                 "total_evaluations": len(recent_evaluations),
                 "average_score": sum(e.overall_score for e in recent_evaluations) / len(recent_evaluations) if recent_evaluations else 0,
@@ -10,7 +10,7 @@ import time
 import threading
 import psutil
 import json
-from typing import Dict, Any, List, Optional, Callable, Union
+from typing import Dict, Any, Iterable, Optional, Callable, Tuple, Union
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
@@ -134,7 +134,7 @@ class MetricsCollector:
         # Internal tracking
         self._agent_states: Dict[str, Dict[str, Any]] = {}
         self._error_patterns: Dict[str, int] = defaultdict(int)
-        self._queue_metrics: Dict[str, List[float]] = defaultdict(list)
+        self._queue_metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=60))  # Last 60 measurements
         self._api_response_times: deque = deque(maxlen=1000)
         
     def _init_prometheus_metrics(self):
@@ -376,54 +376,64 @@ class MetricsCollector:
                     self.queue_length.labels(priority_level='all').set(queue_length)
             
             # Calculate throughput (tasks per second)
-            if len(self._queue_metrics['total']) >= 2:
-                recent_times = list(self._queue_metrics['total'])[-60:]  # Last 60 measurements
-                if len(recent_times) >= 2:
-                    time_span = recent_times[-1] - recent_times[0]
-                    if time_span > 0:
-                        throughput = len(recent_times) / time_span
-                        if self.enable_prometheus:
-                            self.queue_throughput.set(throughput)
+            recent_times = self._queue_metrics['total']
+            if len(recent_times) >= 2:
+                time_span = recent_times[-1] - recent_times[0]
+                if time_span > 0:
+                    throughput = len(recent_times) / time_span
+                    if self.enable_prometheus:
+                        self.queue_throughput.set(throughput)
     
     def record_api_request(self, method: str, endpoint: str, status_code: int, duration: float):
         """Record API request metrics"""
+        self.record_api_requests(((method, endpoint, status_code, duration),))
+    
+    def record_api_requests(self, requests: Iterable[Tuple[str, str, int, float]]):
+        """Record a batch of (method, endpoint, status_code, duration) requests under one lock"""
+        now = time.time()
         with self.lock:
-            self._api_response_times.append({
-                'timestamp': time.time(),
-                'method': method,
-                'endpoint': endpoint,
-                'status_code': status_code,
-                'duration': duration
-            })
-            
-            if self.enable_prometheus:
-                self.api_request_counter.labels(
-                    method=method,
-                    endpoint=endpoint,
-                    status_code=str(status_code)
-                ).inc()
+            for method, endpoint, status_code, duration in requests:
+                self._api_response_times.append({
+                    'timestamp': now,
+                    'method': method,
+                    'endpoint': endpoint,
+                    'status_code': status_code,
+                    'duration': duration
+                })
                 
-                self.api_request_duration.labels(
-                    method=method,
-                    endpoint=endpoint,
-                    status_code=str(status_code)
-                ).observe(duration)
+                if self.enable_prometheus:
+                    self.api_request_counter.labels(
+                        method=method,
+                        endpoint=endpoint,
+                        status_code=str(status_code)
+                    ).inc()
+                    
+                    self.api_request_duration.labels(
+                        method=method,
+                        endpoint=endpoint,
+                        status_code=str(status_code)
+                    ).observe(duration)
     
     def record_error(self, error_type: str, component: str, severity: str = 'error', 
                     message: str = None, context: Dict[str, Any] = None):
         """Record error occurrence"""
+        self.record_errors(((error_type, component, severity),))
+    
+    def record_errors(self, errors: Iterable[Tuple[str, str, str]]):
+        """Record a batch of (error_type, component, severity) errors under one lock"""
         with self.lock:
-            error_key = f"{component}:{error_type}"
-            self._error_patterns[error_key] += 1
-            
-            if self.enable_prometheus:
-                self.error_counter.labels(
-                    error_type=error_type,
-                    component=component,
-                    severity=severity
-                ).inc()
-            
-            logger.debug(f"Recorded error: {error_type} in {component} ({severity})")
+            for error_type, component, severity in errors:
+                error_key = f"{component}:{error_type}"
+                self._error_patterns[error_key] += 1
+                
+                if self.enable_prometheus:
+                    self.error_counter.labels(
+                        error_type=error_type,
+                        component=component,
+                        severity=severity
+                    ).inc()
+                
+                logger.debug(f"Recorded error: {error_type} in {component} ({severity})")
     
     def update_system_metrics(self):
         """Update system-level metrics"""
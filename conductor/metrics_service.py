@@ -275,15 +275,15 @@ class MetricsAPI:
                 if active_only:
                     traces = list(self.tracing.active_traces.values())
                 else:
-                    traces = list(self.tracing.completed_traces)
+                    traces = self.tracing.get_completed_traces()
                 
                 # Sort by start time (most recent first)
                 traces.sort(key=lambda t: t.start_time, reverse=True)
                 
                 return JSONResponse(content={
-                    "traces": [asdict(trace) for trace in traces[:limit]],
+                    "traces": [trace.to_dict() for trace in traces[:limit]],
                     "total_count": len(traces),
-                    "active_traces": len(self.tracing.active_traces),
+                    "active_traces": self.tracing.active_trace_count(),
                     "completed_traces": len(self.tracing.completed_traces),
                     "active_only": active_only
                 })
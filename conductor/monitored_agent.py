@@ -6,17 +6,20 @@ This module extends the base ClaudeAgent with comprehensive performance monitori
 resource tracking, and detailed execution metrics.
 """
 
+import re
+import sys
 import time
 import threading
 import logging
 import psutil
 import os
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
-from collections import defaultdict, deque
-import uuid
+from dataclasses import dataclass, asdict, field
+from collections import defaultdict, deque, namedtuple
+from itertools import islice
 
 from .agent import ClaudeAgent, Task, TaskResult
+from .utils import RWLock, next_correlation_id
 from .metrics import get_metrics_collector, MetricsCollector
 from .monitoring import (
     AgentMonitoringMixin, traced, get_tracing_middleware,
@@ -41,11 +44,7 @@ class TaskExecutionDetail:
     memory_usage_end: int = 0
     container_stats: Dict[str, Any] = None
     error_details: Optional[str] = None
-    correlation_id: str = ""
-    
-    def __post_init__(self):
-        if not self.correlation_id:
-            self.correlation_id = str(uuid.uuid4())
+    correlation_id: str = field(default_factory=next_correlation_id)
 
 
 @dataclass
@@ -58,11 +57,7 @@ class AgentPerformanceProfile:
     resource_efficiency: float  # CPU/memory efficiency score
     reliability_score: float  # Based on health checks and errors
     throughput_score: float  # Tasks completed per unit time
-    last_updated: float = 0.0
-    
-    def __post_init__(self):
-        if self.last_updated == 0.0:
-            self.last_updated = time.time()
+    last_updated: float = field(default_factory=time.time)
 
 
 class MonitoredAgent(AgentMonitoringMixin, ClaudeAgent):
@@ -90,12 +85,12 @@ class MonitoredAgent(AgentMonitoringMixin, ClaudeAgent):
             throughput_score=0.0
         )
         
-        # Resource monitoring
-        self.process_monitor = ProcessMonitor(agent_id)
+        # Resource monitoring (process-level sampler is shared by all agents in this process)
+        self.process_monitor = get_process_monitor()
+        self._monitor_acquired = False  # Whether this agent holds a process monitor reference
         self.container_monitor: Optional[ContainerMonitor] = None
         
         # Performance tracking
-        self.task_performance_cache: Dict[str, List[TaskExecutionDetail]] = defaultdict(list)
         self.real_time_metrics = {
             'current_cpu_usage': 0.0,
             'current_memory_usage': 0,
@@ -119,8 +114,10 @@ class MonitoredAgent(AgentMonitoringMixin, ClaudeAgent):
         """Start agent with enhanced monitoring"""
         logger.info(f"Starting MonitoredAgent {self.agent_id}")
         
-        # Start process monitoring
-        self.process_monitor.start()
+        # Start process monitoring (one reference per agent, however often started)
+        if not self._monitor_acquired:
+            self._monitor_acquired = True
+            self.process_monitor.start()
         
         # Setup container monitoring if using containers
         if self.config.container_name:
@@ -152,7 +149,9 @@ class MonitoredAgent(AgentMonitoringMixin, ClaudeAgent):
         self._generate_agent_performance_report()
         
         # Stop monitoring
-        self.process_monitor.stop()
+        if self._monitor_acquired:
+            self._monitor_acquired = False
+            self.process_monitor.stop()
         if self.container_monitor:
             self.container_monitor.stop()
         
@@ -217,7 +216,6 @@ class MonitoredAgent(AgentMonitoringMixin, ClaudeAgent):
             
             # Add execution to history
             self.execution_history.append(execution_detail)
-            self.task_performance_cache[task.task_type].append(execution_detail)
             
             # Update performance profile
             self._update_performance_profile(task.task_type, execution_detail, result.status == 'success')
@@ -258,7 +256,6 @@ class MonitoredAgent(AgentMonitoringMixin, ClaudeAgent):
             
             # Add to history even on failure
             self.execution_history.append(execution_detail)
-            self.task_performance_cache[task.task_type].append(execution_detail)
             
             # Update performance profile (failure case)
             self._update_performance_profile(task.task_type, execution_detail, False)
@@ -351,9 +348,9 @@ class MonitoredAgent(AgentMonitoringMixin, ClaudeAgent):
             profile.reliability_score = max(0.0, profile.reliability_score - 0.05)
         
         # Calculate throughput score
-        recent_tasks = list(self.execution_history)[-10:]  # Last 10 tasks
+        recent_tasks = list(islice(reversed(self.execution_history), 10))  # Last 10 tasks, newest first
         if len(recent_tasks) >= 2:
-            time_span = recent_tasks[-1].end_time - recent_tasks[0].start_time
+            time_span = recent_tasks[0].end_time - recent_tasks[-1].start_time
             if time_span > 0:
                 profile.throughput_score = len(recent_tasks) / time_span
         
@@ -454,17 +451,6 @@ class MonitoredAgent(AgentMonitoringMixin, ClaudeAgent):
         max_age = 24 * 3600  # 24 hours
         cutoff_time = time.time() - max_age
         
-        # Clean up task performance cache
-        for task_type in list(self.task_performance_cache.keys()):
-            self.task_performance_cache[task_type] = [
-                detail for detail in self.task_performance_cache[task_type]
-                if detail.start_time > cutoff_time
-            ]
-            
-            # Remove empty entries
-            if not self.task_performance_cache[task_type]:
-                del self.task_performance_cache[task_type]
-        
         # Clean up optimization suggestions
         recent_suggestions = [
             s for s in self.optimization_suggestions
@@ -493,6 +479,10 @@ class MonitoredAgent(AgentMonitoringMixin, ClaudeAgent):
             }
         }
     
+    def get_task_type_executions(self, task_type: str) -> List[TaskExecutionDetail]:
+        """Get recorded executions of a task type, oldest first"""
+        return [e for e in self.execution_history if e.task_type == task_type]
+    
     def _get_task_type_distribution(self) -> Dict[str, int]:
         """Get distribution of task types executed"""
         distribution = defaultdict(int)
@@ -506,7 +496,8 @@ class MonitoredAgent(AgentMonitoringMixin, ClaudeAgent):
             return 1.0
         
         # Calculate average resource usage per task
-        recent_executions = list(self.execution_history)[-50:]  # Last 50 tasks
+        # Snapshot first: task threads append to the history while this runs
+        recent_executions = list(islice(reversed(self.execution_history), 50))  # Last 50 tasks
         
         total_cpu_usage = 0
         total_memory_usage = 0
@@ -539,18 +530,25 @@ class MonitoredAgent(AgentMonitoringMixin, ClaudeAgent):
         try:
             report = self.get_agent_performance_summary()
             
-            # Add detailed execution history
-            report['detailed_execution_history'] = [
-                asdict(execution) for execution in list(self.execution_history)[-100:]  # Last 100 executions
-            ]
+            # Add detailed execution history (last 100 executions, oldest first)
+            recent_executions = list(islice(reversed(self.execution_history), 100))
+            recent_executions.reverse()
+            report['detailed_execution_history'] = [asdict(execution) for execution in recent_executions]
             
-            # Save to file
+            # Save to file; written to a temp file first so a failed dump never leaves a truncated report
             import json
             timestamp = int(time.time())
             report_file = f"/tmp/claude_agent_{self.agent_id}_performance_report_{timestamp}.json"
+            temp_file = f"{report_file}.tmp"
             
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+            try:
+                with open(temp_file, 'w') as f:
+                    json.dump(report, f, indent=2, default=str)
+                os.replace(temp_file, report_file)
+            except BaseException:
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+                raise
             
             logger.info(f"Agent performance report saved to {report_file}")
             
@@ -568,38 +566,59 @@ class MonitoredAgent(AgentMonitoringMixin, ClaudeAgent):
 
 
 class ProcessMonitor:
-    """Monitor process-level resource usage"""
+    """Monitor process-level resource usage
+    
+    Process statistics are identical for every agent living in the same process,
+    so a single monitor per pid is shared (see ``get_process_monitor``) and its
+    sampler thread runs while at least one agent holds it.
+    """
     
-    def __init__(self, agent_id: str):
-        self.agent_id = agent_id
+    def __init__(self, pid: int):
+        self.pid = pid
         self.monitoring = False
         self.current_stats = {}
         self.lock = threading.RLock()
+        self._users = 0
+        # Bumped on every start and stop; a loop exits once its generation is stale
+        self._generation = 0
     
     def start(self):
         """Start process monitoring"""
-        self.monitoring = True
-        thread = threading.Thread(target=self._monitor_loop, daemon=True)
+        with self.lock:
+            self._users += 1
+            if self.monitoring:
+                return
+            self.monitoring = True
+            self._generation += 1
+            generation = self._generation
+        thread = threading.Thread(target=self._monitor_loop, args=(generation,), daemon=True)
         thread.start()
     
     def stop(self):
         """Stop process monitoring"""
-        self.monitoring = False
+        with self.lock:
+            self._users = max(0, self._users - 1)
+            if self._users == 0 and self.monitoring:
+                self.monitoring = False
+                self._generation += 1
     
     def get_current_stats(self) -> Dict[str, Any]:
         """Get current process statistics"""
         with self.lock:
             return self.current_stats.copy()
     
-    def _monitor_loop(self):
+    def _monitor_loop(self, generation: int):
         """Process monitoring loop"""
         try:
-            process = psutil.Process()
+            process = psutil.Process(self.pid)
         except psutil.NoSuchProcess:
-            logger.error(f"Cannot monitor process for agent {self.agent_id}")
+            logger.error(f"Cannot monitor process {self.pid}")
+            with self.lock:
+                if self._generation == generation:
+                    self.monitoring = False
             return
         
-        while self.monitoring:
+        while self._generation == generation:
             try:
                 with process.oneshot():
                     cpu_percent = process.cpu_percent()
@@ -624,6 +643,28 @@ class ProcessMonitor:
                 time.sleep(5)
 
 
+# Process monitors keyed by pid (a forked child gets its own sampler)
+_process_monitors: Dict[int, ProcessMonitor] = {}
+_process_monitors_lock = threading.Lock()
+
+
+def get_process_monitor() -> ProcessMonitor:
+    """Get or create the shared process monitor for the current process"""
+    pid = os.getpid()
+    
+    with _process_monitors_lock:
+        monitor = _process_monitors.get(pid)
+        if monitor is None:
+            monitor = ProcessMonitor(pid)
+            _process_monitors[pid] = monitor
+        return monitor
+
+
+# Memory sizes such as "512", "12.5MB" or "1.9GiB" (binary multiples either way)
+_SIZE_RE = re.compile(r'\s*(\d+(?:\.\d*)?|\.\d+)\s*([KMGT]?)I?B?\s*', re.IGNORECASE)
+_UNIT_MULTIPLIERS = {'': 1, 'K': 1024, 'M': 1024**2, 'G': 1024**3, 'T': 1024**4}
+
+
 class ContainerMonitor:
     """Monitor container-level resource usage"""
     
@@ -723,18 +764,30 @@ class ContainerMonitor:
     def _parse_memory_size(self, size_str: str) -> int:
         """Parse memory size string to bytes"""
         try:
-            size_str = size_str.strip()
-            multipliers = {'B': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3}
-            
-            for unit, multiplier in multipliers.items():
-                if size_str.endswith(unit):
-                    number = float(size_str[:-len(unit)])
-                    return int(number * multiplier)
-            
-            return int(float(size_str))
-            
-        except (ValueError, AttributeError):
+            match = _SIZE_RE.fullmatch(size_str)
+        except TypeError:
+            return 0
+        
+        if not match:
             return 0
+        return int(float(match.group(1)) * _UNIT_MULTIPLIERS[match.group(2).upper()])
+
+
+# (needle, label) rules in precedence order; labels are interned since they
+# are stored per record and used as dict keys
+_ERROR_RULES = tuple(
+    (needle, sys.intern(label)) for needle, label in (
+        ('timeout', 'timeout_error'),
+        ('memory', 'memory_error'),
+        ('connection', 'connection_error'),
+        ('permission', 'permission_error'),
+        ('not found', 'not_found_error'),
+    )
+)
+
+
+# Compact error record; timestamp is time.monotonic_ns()
+ErrorRecord = namedtuple('ErrorRecord', 'timestamp task_type error_message execution_time error_type')
 
 
 class ErrorTracker:
@@ -742,48 +795,44 @@ class ErrorTracker:
     
     def __init__(self):
         self.error_history: deque = deque(maxlen=1000)
-        self.error_patterns: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-        self.lock = threading.RLock()
+        self.error_patterns: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
+        self.lock = RWLock()
+        
+        # Reference point for converting monotonic timestamps to wall-clock time
+        self._wall_time_base = time.time()
+        self._monotonic_ns_base = time.monotonic_ns()
     
     def record_error(self, task_type: str, error_message: str, execution_time: float):
         """Record an error occurrence"""
-        with self.lock:
-            error_record = {
-                'timestamp': time.time(),
-                'task_type': task_type,
-                'error_message': error_message,
-                'execution_time': execution_time,
-                'error_type': self._classify_error(error_message)
-            }
-            
+        error_record = ErrorRecord(
+            time.monotonic_ns(),
+            sys.intern(task_type),
+            error_message,
+            execution_time,
+            self._classify_error(error_message)
+        )
+        
+        with self.lock.write_lock():
             self.error_history.append(error_record)
-            self.error_patterns[error_record['error_type']].append(error_record)
-            
-            # Keep pattern lists manageable
-            for error_type in self.error_patterns:
-                if len(self.error_patterns[error_type]) > 100:
-                    self.error_patterns[error_type] = self.error_patterns[error_type][-100:]
+            self.error_patterns[error_record.error_type].append(error_record)
     
     def _classify_error(self, error_message: str) -> str:
         """Classify error based on message content"""
         error_message_lower = error_message.lower()
-        
-        if 'timeout' in error_message_lower:
-            return 'timeout_error'
-        elif 'memory' in error_message_lower:
-            return 'memory_error'
-        elif 'connection' in error_message_lower:
-            return 'connection_error'
-        elif 'permission' in error_message_lower:
-            return 'permission_error'
-        elif 'not found' in error_message_lower:
-            return 'not_found_error'
-        else:
-            return 'unknown_error'
+        return next(
+            (label for needle, label in _ERROR_RULES if needle in error_message_lower),
+            'unknown_error'
+        )
     
     def get_summary(self) -> Dict[str, Any]:
         """Get error tracking summary"""
-        with self.lock:
+        with self.lock.read_lock():
+            recent_errors = [
+                self._record_to_dict(record)
+                for record in islice(reversed(self.error_history), 10)
+            ]
+            recent_errors.reverse()
+            
             return {
                 'total_errors': len(self.error_history),
                 'error_types': len(self.error_patterns),
@@ -791,8 +840,14 @@ class ErrorTracker:
                     error_type: len(errors) 
                     for error_type, errors in self.error_patterns.items()
                 },
-                'recent_errors': list(self.error_history)[-10:]  # Last 10 errors
+                'recent_errors': recent_errors  # Last 10 errors
             }
+    
+    def _record_to_dict(self, record: ErrorRecord) -> Dict[str, Any]:
+        """Convert an error record to a dict with a wall-clock timestamp"""
+        error_dict = record._asdict()
+        error_dict['timestamp'] = self._wall_time_base + (record.timestamp - self._monotonic_ns_base) / 1e9
+        return error_dict
 
 
 # Factory function for easy creation
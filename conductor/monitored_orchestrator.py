@@ -6,13 +6,18 @@ This module extends the base Orchestrator with comprehensive performance monitor
 metrics collection, distributed tracing, and resource tracking capabilities.
 """
 
+import json
 import time
 import threading
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-import uuid
-from collections import defaultdict, deque
+import heapq
+import itertools
+import queue
+import sys
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, asdict
+from collections import defaultdict, deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, wait
 
 from .orchestrator import Orchestrator
 from .agent import Task, TaskResult
@@ -22,11 +27,22 @@ from .monitoring import (
     PerformanceInterceptor, ResourceMonitor
 )
 from .metrics_service import MetricsService, create_metrics_service
+from .utils import RWLock
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class QueueMetrics:
     """Task queue metrics tracking"""
     total_tasks: int = 0
@@ -44,24 +60,116 @@ class QueueMetrics:
             self.priority_distribution = defaultdict(int)
 
 
+class MetricsEventWriter:
+    """Forward metrics collector calls from a dedicated writer thread
+    
+    Callers enqueue fire-and-forget events instead of calling the collector
+    (and taking its locks) on the task execution path. While the writer is
+    not running, events are recorded synchronously so none are stranded.
+    """
+    
+    def __init__(self, metrics_collector: MetricsCollector):
+        self.metrics_collector = metrics_collector
+        self.events: queue.SimpleQueue = queue.SimpleQueue()
+        self.thread: Optional[threading.Thread] = None
+        self.running = False
+        self._state_lock = threading.Lock()  # Serializes start()/stop(); record() never takes it
+    
+    def record(self, method_name: str, *args, **kwargs):
+        """Queue a call to ``metrics_collector.<method_name>``"""
+        if self.running:
+            self.events.put_nowait((method_name, args, kwargs))
+            # stop() may have finished between the check and the put; apply it here then
+            if not self.running:
+                self._drain()
+            return
+        self._apply(method_name, args, kwargs)
+    
+    def start(self):
+        """Start the writer thread"""
+        with self._state_lock:
+            if self.running:
+                return
+            self.thread = threading.Thread(target=self._writer_loop, daemon=True)
+            self.thread.start()
+            self.running = True
+    
+    def stop(self, timeout: float = 5.0):
+        """Flush queued events and stop the writer thread"""
+        with self._state_lock:
+            if not self.running:
+                return
+            self.running = False
+            self.events.put_nowait(None)
+        self.thread.join(timeout=timeout)
+        self.thread = None
+        # Events queued behind the sentinel by record() calls that raced with stop()
+        self._drain()
+    
+    def _apply(self, method_name: str, args: tuple, kwargs: dict):
+        """Call ``metrics_collector.<method_name>``, logging any error"""
+        try:
+            getattr(self.metrics_collector, method_name)(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"Error recording metrics event {method_name}: {e}")
+    
+    def _drain(self):
+        """Apply queued events on the calling thread, leaving the writer's stop sentinel queued"""
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                return
+            if event is None:
+                self.events.put_nowait(None)
+                return
+            self._apply(*event)
+    
+    def _writer_loop(self):
+        """Drain queued events into the metrics collector"""
+        while True:
+            event = self.events.get()
+            if event is None:
+                break
+            self._apply(*event)
+
+
+# Columns of the resource usage history, in report order
+RESOURCE_USAGE_FIELDS = (
+    'timestamp', 'cpu_percent', 'memory_percent', 'memory_used', 'active_agents', 'queue_length'
+)
+# One sample of the history; appended whole so readers never see a partial row
+ResourceUsagePoint = namedtuple('ResourceUsagePoint', RESOURCE_USAGE_FIELDS)
+
+
 class EnhancedTaskQueue:
     """Enhanced task queue with comprehensive metrics tracking"""
     
-    def __init__(self, max_size: int = 1000):
+    def __init__(self, max_size: int = 1000, metrics_writer: Optional[MetricsEventWriter] = None):
         self.max_size = max_size
-        self.queue: List[Task] = []
+        self.queue: List[Tuple[int, int, Task]] = []  # Heap of (-priority, sequence, task)
+        self._sequence = itertools.count()  # FIFO tie-break within a priority
+        self._priority_counts: Dict[int, int] = defaultdict(int)  # Queued tasks per priority
         self.processing: Dict[str, Task] = {}
         self.completed: deque = deque(maxlen=1000)  # Keep last 1000 completed tasks
         self.metrics_collector = get_metrics_collector()
-        self.lock = threading.RLock()
+        self.metrics_writer = metrics_writer
+        self.lock = RWLock()  # Metrics readers share the lock; queue mutations are exclusive
         
         # Queue timing tracking
         self.enqueue_times: Dict[str, float] = {}
         self.processing_start_times: Dict[str, float] = {}
         
+        # Running aggregates over the most recent completions
+        self._recent_completions: deque = deque(maxlen=100)
+        self._recent_queue_time_sum = 0.0
+        self._recent_queue_time_count = 0
+        self._recent_processing_time_sum = 0.0
+        self._recent_failed_count = 0
+        
     def enqueue(self, task: Task, priority: int = 5) -> bool:
         """Add task to queue with priority"""
-        with self.lock:
+        with self.lock.write_lock():
             if len(self.queue) >= self.max_size:
                 logger.warning(f"Task queue is full ({self.max_size}), rejecting task {task.task_id}")
                 return False
@@ -69,19 +177,12 @@ class EnhancedTaskQueue:
             task.priority = priority
             task.queue_time = 0.0  # Will be calculated when dequeued
             
-            # Insert in priority order
-            inserted = False
-            for i, queued_task in enumerate(self.queue):
-                if priority > queued_task.priority:
-                    self.queue.insert(i, task)
-                    inserted = True
-                    break
-            
-            if not inserted:
-                self.queue.append(task)
+            # Highest priority first, FIFO within the same priority
+            heapq.heappush(self.queue, (-priority, next(self._sequence), task))
+            self._priority_counts[priority] += 1
             
             # Track timing
-            self.enqueue_times[task.task_id] = time.time()
+            self.enqueue_times[task.task_id] = time.monotonic()
             
             # Update metrics
             self._update_queue_metrics()
@@ -89,22 +190,45 @@ class EnhancedTaskQueue:
             logger.debug(f"Enqueued task {task.task_id} with priority {priority}")
             return True
     
+    def reserve_for_execution(self, task: Task, priority: int = 5) -> Optional[Task]:
+        """Admit a task and move it straight to processing, bypassing the heap"""
+        with self.lock.write_lock():
+            # Reserved tasks never enter the heap, so bound the tasks in flight instead
+            if len(self.processing) >= self.max_size:
+                logger.warning(f"Too many tasks in progress ({self.max_size}), rejecting task {task.task_id}")
+                return None
+            
+            task.priority = priority
+            task.queue_time = 0.0  # Never waits in the queue
+            
+            # Move to processing
+            self.processing[task.task_id] = task
+            self.processing_start_times[task.task_id] = time.monotonic()
+            
+            # Update metrics
+            self._update_queue_metrics()
+            
+            return task
+    
     def dequeue(self) -> Optional[Task]:
         """Remove and return highest priority task"""
-        with self.lock:
+        with self.lock.write_lock():
             if not self.queue:
                 return None
             
-            task = self.queue.pop(0)
+            neg_priority, _, task = heapq.heappop(self.queue)
+            self._priority_counts[-neg_priority] -= 1
+            if not self._priority_counts[-neg_priority]:
+                del self._priority_counts[-neg_priority]
             
             # Calculate queue time
+            now = time.monotonic()
             if task.task_id in self.enqueue_times:
-                task.queue_time = time.time() - self.enqueue_times[task.task_id]
-                del self.enqueue_times[task.task_id]
+                task.queue_time = now - self.enqueue_times.pop(task.task_id)
             
             # Move to processing
             self.processing[task.task_id] = task
-            self.processing_start_times[task.task_id] = time.time()
+            self.processing_start_times[task.task_id] = now
             
             # Update metrics
             self._update_queue_metrics()
@@ -113,87 +237,112 @@ class EnhancedTaskQueue:
     
     def complete_task(self, task_id: str, result: TaskResult):
         """Mark task as completed"""
-        with self.lock:
+        with self.lock.write_lock():
             if task_id in self.processing:
                 task = self.processing.pop(task_id)
                 
                 # Calculate processing time
+                now = time.monotonic()
                 if task_id in self.processing_start_times:
-                    processing_time = time.time() - self.processing_start_times[task_id]
-                    del self.processing_start_times[task_id]
+                    processing_time = now - self.processing_start_times.pop(task_id)
                 else:
                     processing_time = 0.0
                 
-                # Store completion data
+                # Store completion data (completion_time is monotonic, used for throughput)
                 completion_data = {
                     'task': task,
                     'result': result,
-                    'completion_time': time.time(),
-                    'processing_time': processing_time
+                    'completion_time': now,
+                    'processing_time': processing_time,
+                    'queue_time': getattr(task, 'queue_time', None)
                 }
                 self.completed.append(completion_data)
+                self._add_recent_completion(completion_data)
                 
                 # Update metrics
                 self._update_queue_metrics()
                 
                 # Record queue metrics in metrics collector
-                self.metrics_collector.record_task_completion(
+                self._record_metrics(
+                    'record_task_completion',
                     task_id,
                     result.status,
                     getattr(result, 'error_type', None),
                     getattr(result, 'error', None)
                 )
     
+    def _add_recent_completion(self, completion_data: Dict[str, Any]):
+        """Slide the recent-completion window, keeping its running aggregates current"""
+        recent = self._recent_completions
+        if len(recent) == recent.maxlen:
+            self._adjust_recent_aggregates(recent[0], -1)
+        recent.append(completion_data)
+        self._adjust_recent_aggregates(completion_data, 1)
+    
+    def _adjust_recent_aggregates(self, completion_data: Dict[str, Any], sign: int):
+        """Add (sign=1) or remove (sign=-1) a completion from the running aggregates"""
+        if completion_data['queue_time'] is not None:
+            self._recent_queue_time_sum += sign * completion_data['queue_time']
+            self._recent_queue_time_count += sign
+        self._recent_processing_time_sum += sign * completion_data['processing_time']
+        if completion_data['result'].status == 'failed':
+            self._recent_failed_count += sign
+    
     def get_metrics(self) -> QueueMetrics:
-        """Get current queue metrics"""
-        with self.lock:
-            # Calculate averages from recent completions
-            recent_completions = list(self.completed)[-100:]  # Last 100 tasks
-            
-            avg_queue_time = 0.0
-            avg_processing_time = 0.0
-            if recent_completions:
-                queue_times = [c['task'].queue_time for c in recent_completions if hasattr(c['task'], 'queue_time')]
-                processing_times = [c['processing_time'] for c in recent_completions]
-                
-                if queue_times:
-                    avg_queue_time = sum(queue_times) / len(queue_times)
-                if processing_times:
-                    avg_processing_time = sum(processing_times) / len(processing_times)
-            
-            # Calculate throughput (tasks per minute)
-            throughput_per_minute = 0.0
-            if len(recent_completions) >= 2:
-                time_span = recent_completions[-1]['completion_time'] - recent_completions[0]['completion_time']
-                if time_span > 0:
-                    throughput_per_minute = (len(recent_completions) / time_span) * 60
-            
-            # Priority distribution
-            priority_dist = defaultdict(int)
-            for task in self.queue:
-                priority_dist[task.priority] += 1
-            
-            return QueueMetrics(
-                total_tasks=len(self.queue) + len(self.processing) + len(self.completed),
-                queued_tasks=len(self.queue),
-                processing_tasks=len(self.processing),
-                completed_tasks=len(self.completed),
-                failed_tasks=len([c for c in recent_completions if c['result'].status == 'failed']),
-                avg_queue_time=avg_queue_time,
-                avg_processing_time=avg_processing_time,
-                throughput_per_minute=throughput_per_minute,
-                priority_distribution=dict(priority_dist)
-            )
+        """Get a snapshot of the current queue metrics
+        
+        Every field comes from counters kept up to date by the queue
+        operations, so a fresh snapshot is cheap and callers own it.
+        """
+        with self.lock.read_lock():
+            return self._compute_metrics()
     
-    def _update_queue_metrics(self):
-        """Update queue metrics in metrics collector"""
-        metrics = self.get_metrics()
+    def _compute_metrics(self) -> QueueMetrics:
+        """Compute queue metrics; the caller must hold the lock"""
+        # Averages over the last 100 completions come from running sums
+        recent_completions = self._recent_completions
+        
+        avg_queue_time = 0.0
+        avg_processing_time = 0.0
+        if self._recent_queue_time_count:
+            avg_queue_time = self._recent_queue_time_sum / self._recent_queue_time_count
+        if recent_completions:
+            avg_processing_time = self._recent_processing_time_sum / len(recent_completions)
         
+        # Calculate throughput (tasks per minute)
+        throughput_per_minute = 0.0
+        if len(recent_completions) >= 2:
+            time_span = recent_completions[-1]['completion_time'] - recent_completions[0]['completion_time']
+            if time_span > 0:
+                throughput_per_minute = (len(recent_completions) / time_span) * 60
+        
+        return QueueMetrics(
+            total_tasks=len(self.queue) + len(self.processing) + len(self.completed),
+            queued_tasks=len(self.queue),
+            processing_tasks=len(self.processing),
+            completed_tasks=len(self.completed),
+            failed_tasks=self._recent_failed_count,
+            avg_queue_time=avg_queue_time,
+            avg_processing_time=avg_processing_time,
+            throughput_per_minute=throughput_per_minute,
+            priority_distribution=dict(self._priority_counts)
+        )
+    
+    def _update_queue_metrics(self):
+        """Update queue metrics in metrics collector; the caller must hold the write lock"""
         # Update Prometheus metrics
-        self.metrics_collector.update_queue_metrics(
-            queue_length=metrics.queued_tasks,
-            priority_breakdown=metrics.priority_distribution
+        self._record_metrics(
+            'update_queue_metrics',
+            queue_length=len(self.queue),
+            priority_breakdown=dict(self._priority_counts)
         )
+    
+    def _record_metrics(self, method_name: str, *args, **kwargs):
+        """Send a metrics call through the writer thread, or directly without one"""
+        if self.metrics_writer:
+            self.metrics_writer.record(method_name, *args, **kwargs)
+        else:
+            getattr(self.metrics_collector, method_name)(*args, **kwargs)
 
 
 class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
@@ -207,17 +356,23 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
         # Initialize base orchestrator
         super().__init__(config_path)
         
+        # Metrics calls on the task path are forwarded by a writer thread
+        self.metrics_writer = MetricsEventWriter(self.metrics_collector)
+        
         # Replace simple task queue with enhanced queue
         self.task_queue = EnhancedTaskQueue(
-            max_size=self.config.get('task_queue', {}).get('max_size', 1000)
+            max_size=self.config.get('task_queue', {}).get('max_size', 1000),
+            metrics_writer=self.metrics_writer
         )
         
         # Enhanced statistics tracking
         self.detailed_stats = {
             'agent_utilization': defaultdict(float),
-            'task_type_performance': defaultdict(list),
+            # Per task type: (execution_time, status, timestamp, category) tuples
+            'task_type_performance': defaultdict(lambda: deque(maxlen=1000)),
             'error_patterns': defaultdict(int),
-            'resource_usage_history': deque(maxlen=1440),  # 24 hours at 1-minute intervals
+            # ResourceUsagePoint samples (24 hours at 1-minute intervals)
+            'resource_usage_history': deque(maxlen=1440),
             'peak_performance_metrics': {
                 'max_concurrent_tasks': 0,
                 'peak_cpu_usage': 0.0,
@@ -278,6 +433,9 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
             except Exception as e:
                 logger.error(f"Failed to start metrics service: {e}")
         
+        # Start metrics writer before any task can complete
+        self.metrics_writer.start()
+        
         # Start base orchestrator
         super().start()
         
@@ -302,6 +460,9 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
         # Stop base orchestrator
         super().stop()
         
+        # Flush pending metrics events
+        self.metrics_writer.stop()
+        
         # Stop metrics service
         if self.metrics_service:
             try:
@@ -318,8 +479,7 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
     @traced("orchestrator.execute_task")
     def execute_task(self, task: Task) -> TaskResult:
         """Execute task with comprehensive monitoring"""
-        correlation_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Start task metrics tracking
         task_metrics = self.metrics_collector.record_task_start(
@@ -330,8 +490,9 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
             queue_time=0.0  # Will be calculated by queue
         )
         
-        # Add to enhanced queue instead of simple list
-        if not self.task_queue.enqueue(task, getattr(task, 'priority', 5)):
+        # Admit the task directly into processing (one lock acquisition)
+        queued_task = self.task_queue.reserve_for_execution(task, getattr(task, 'priority', 5))
+        if not queued_task:
             # Queue is full
             error_result = TaskResult(
                 task_id=task.task_id,
@@ -342,7 +503,8 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
                 execution_time=0.0
             )
             
-            self.metrics_collector.record_task_completion(
+            self.metrics_writer.record(
+                'record_task_completion',
                 task.task_id,
                 "failed",
                 error_type="QueueFullError",
@@ -352,16 +514,11 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
             return error_result
         
         try:
-            # Get task from queue (this calculates queue time)
-            queued_task = self.task_queue.dequeue()
-            if not queued_task:
-                raise Exception("Task disappeared from queue")
-            
             # Update metrics with queue time
             task_metrics.queue_time = queued_task.queue_time
             
             # Find available agent
-            agent = self._get_available_agent()
+            agent = self._find_available_agent()
             if not agent:
                 error_result = TaskResult(
                     task_id=task.task_id,
@@ -369,7 +526,7 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
                     status="failed",
                     result={},
                     error="No available agents",
-                    execution_time=time.time() - start_time
+                    execution_time=time.monotonic() - start_time
                 )
                 
                 self.task_queue.complete_task(task.task_id, error_result)
@@ -381,21 +538,16 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
             task_metrics.agent_id = agent.agent_id
             
             # Execute task with timeout and monitoring
-            future = self.executor.submit(agent.execute_task, queued_task)
-            
             try:
-                result = future.result(timeout=queued_task.timeout)
-                
-                # Update agent utilization
-                self._update_agent_utilization(agent.agent_id, result.execution_time)
-                
-                # Record successful completion
-                self.task_queue.complete_task(task.task_id, result)
-                self._update_detailed_stats(queued_task, result, "success")
-                
-                return result
-                
-            except TimeoutError:
+                future = self.executor.submit(agent.execute_task, queued_task)
+            except Exception:
+                # The done callback never gets attached, so hand the agent back here
+                self._release_agent(agent.agent_id)
+                raise
+            future.add_done_callback(lambda _, agent_id=agent.agent_id: self._release_agent(agent_id))
+            done, _ = wait((future,), timeout=queued_task.timeout, return_when=FIRST_COMPLETED)
+            
+            if not done:
                 future.cancel()
                 result = TaskResult(
                     task_id=task.task_id,
@@ -410,9 +562,20 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
                 self._update_detailed_stats(queued_task, result, "timeout")
                 
                 return result
+            
+            result = future.result()
+            
+            # Update agent utilization
+            self._update_agent_utilization(agent.agent_id, result.execution_time)
+            
+            # Record successful completion
+            self.task_queue.complete_task(task.task_id, result)
+            self._update_detailed_stats(queued_task, result, "success")
+            
+            return result
                 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             error_result = TaskResult(
                 task_id=task.task_id,
                 agent_id="orchestrator",
@@ -434,13 +597,13 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
     
     def _update_agent_utilization(self, agent_id: str, execution_time: float):
         """Update agent utilization metrics"""
-        # Simple utilization calculation (can be enhanced)
-        current_util = self.detailed_stats['agent_utilization'][agent_id]
-        # Exponential moving average
-        self.detailed_stats['agent_utilization'][agent_id] = 0.9 * current_util + 0.1 * execution_time
+        # Simple utilization calculation (can be enhanced): exponential moving average
+        utilization = self.detailed_stats['agent_utilization']
+        utilization[agent_id] = 0.9 * utilization.get(agent_id, 0.0) + 0.1 * execution_time
         
         # Update metrics collector
-        self.metrics_collector.update_agent_status(
+        self.metrics_writer.record(
+            'update_agent_status',
             agent_id=agent_id,
             is_running=True,
             current_tasks=0,  # Will be updated by agent monitoring
@@ -449,30 +612,20 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
     
     def _update_detailed_stats(self, task: Task, result: TaskResult, category: str):
         """Update detailed performance statistics"""
-        # Task type performance tracking
-        self.detailed_stats['task_type_performance'][task.task_type].append({
-            'execution_time': result.execution_time,
-            'status': result.status,
-            'timestamp': time.time(),
-            'category': category
-        })
-        
-        # Keep only recent performance data
-        max_entries = 1000
-        if len(self.detailed_stats['task_type_performance'][task.task_type]) > max_entries:
-            self.detailed_stats['task_type_performance'][task.task_type] = \
-                self.detailed_stats['task_type_performance'][task.task_type][-max_entries:]
+        # Task type performance tracking; interned so repeated keys compare by identity
+        self.detailed_stats['task_type_performance'][sys.intern(task.task_type)].append(
+            (result.execution_time, sys.intern(result.status), time.time(), sys.intern(category))
+        )
         
         # Update peak performance metrics
         peaks = self.detailed_stats['peak_performance_metrics']
         
-        if result.execution_time < peaks['fastest_task_completion'] and result.status == 'success':
-            peaks['fastest_task_completion'] = result.execution_time
+        if result.status == 'success':
+            peaks['fastest_task_completion'] = min(peaks['fastest_task_completion'], result.execution_time)
         
         # Calculate current throughput
         queue_metrics = self.task_queue.get_metrics()
-        if queue_metrics.throughput_per_minute > peaks['highest_throughput']:
-            peaks['highest_throughput'] = queue_metrics.throughput_per_minute
+        peaks['highest_throughput'] = max(peaks['highest_throughput'], queue_metrics.throughput_per_minute)
     
     def _start_monitoring_thread(self):
         """Start background monitoring thread"""
@@ -508,16 +661,14 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
             from .utils import get_system_stats
             system_stats = get_system_stats()
             
-            resource_point = {
-                'timestamp': time.time(),
-                'cpu_percent': system_stats.get('cpu_percent', 0),
-                'memory_percent': system_stats.get('memory_percent', 0),
-                'memory_used': system_stats.get('memory_used', 0),
-                'active_agents': len([a for a in self.agents.values() if a.is_running]),
-                'queue_length': len(self.task_queue.queue) if hasattr(self.task_queue, 'queue') else 0
-            }
-            
-            self.detailed_stats['resource_usage_history'].append(resource_point)
+            self.detailed_stats['resource_usage_history'].append(ResourceUsagePoint(
+                timestamp=time.time(),
+                cpu_percent=system_stats.get('cpu_percent', 0),
+                memory_percent=system_stats.get('memory_percent', 0),
+                memory_used=system_stats.get('memory_used', 0),
+                active_agents=sum(1 for a in self.agents.values() if a.is_running),
+                queue_length=len(self.task_queue.queue) if hasattr(self.task_queue, 'queue') else 0
+            ))
             
         except Exception as e:
             logger.error(f"Error recording resource usage: {e}")
@@ -529,20 +680,24 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
             
             # Current concurrent tasks
             current_concurrent = len(self.task_queue.processing) if hasattr(self.task_queue, 'processing') else 0
-            if current_concurrent > peaks['max_concurrent_tasks']:
-                peaks['max_concurrent_tasks'] = current_concurrent
+            peaks['max_concurrent_tasks'] = max(peaks['max_concurrent_tasks'], current_concurrent)
             
             # CPU and memory usage
-            if self.detailed_stats['resource_usage_history']:
-                latest = self.detailed_stats['resource_usage_history'][-1]
-                if latest['cpu_percent'] > peaks['peak_cpu_usage']:
-                    peaks['peak_cpu_usage'] = latest['cpu_percent']
-                if latest['memory_percent'] > peaks['peak_memory_usage']:
-                    peaks['peak_memory_usage'] = latest['memory_percent']
+            history = self.detailed_stats['resource_usage_history']
+            if history:
+                latest = history[-1]
+                peaks['peak_cpu_usage'] = max(peaks['peak_cpu_usage'], latest.cpu_percent)
+                peaks['peak_memory_usage'] = max(peaks['peak_memory_usage'], latest.memory_percent)
                     
         except Exception as e:
             logger.error(f"Error updating peak metrics: {e}")
     
+    def _get_resource_usage_trend(self, points: int) -> List[Dict[str, Any]]:
+        """The most recent resource usage points as dicts, oldest first"""
+        # Snapshot the newest rows first; each row is one complete sample
+        latest = list(itertools.islice(reversed(self.detailed_stats['resource_usage_history']), points))
+        return [point._asdict() for point in reversed(latest)]
+    
     def get_comprehensive_performance_report(self) -> Dict[str, Any]:
         """Get comprehensive performance report"""
         base_stats = self.get_statistics() if hasattr(self, 'get_statistics') else {}
@@ -552,9 +707,9 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
         task_type_averages = {}
         for task_type, performances in self.detailed_stats['task_type_performance'].items():
             if performances:
-                successful = [p for p in performances if p['status'] == 'success']
+                successful = [execution_time for execution_time, status, _, _ in performances if status == 'success']
                 if successful:
-                    avg_time = sum(p['execution_time'] for p in successful) / len(successful)
+                    avg_time = sum(successful) / len(successful)
                     success_rate = len(successful) / len(performances)
                     task_type_averages[task_type] = {
                         'avg_execution_time': avg_time,
@@ -563,16 +718,19 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
                         'successful_tasks': len(successful)
                     }
         
+        # Deliver buffered method metrics so the summary below is current
+        self.performance_interceptor.flush_metrics()
+        
         return {
             'timestamp': time.time(),
             'base_statistics': base_stats,
-            'queue_metrics': queue_metrics.__dict__,
+            'queue_metrics': asdict(queue_metrics),
             'detailed_statistics': {
                 'agent_utilization': dict(self.detailed_stats['agent_utilization']),
                 'task_type_performance': task_type_averages,
                 'error_patterns': dict(self.detailed_stats['error_patterns']),
                 'peak_metrics': self.detailed_stats['peak_performance_metrics'],
-                'resource_usage_trend': list(self.detailed_stats['resource_usage_history'])[-100:]  # Last 100 points
+                'resource_usage_trend': self._get_resource_usage_trend(100)
             },
             'monitoring_service_status': self.metrics_service.get_status() if self.metrics_service else None,
             'metrics_summary': self.metrics_collector.get_metrics_summary(),
@@ -585,12 +743,19 @@ class MonitoredOrchestrator(OrchestratorMonitoringMixin, Orchestrator):
             report = self.get_comprehensive_performance_report()
             
             # Save to file
-            import json
             timestamp = int(time.time())
             report_file = f"/tmp/claude_conductor_performance_report_{timestamp}.json"
             
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+            if ORJSON_AVAILABLE:
+                with open(report_file, 'wb') as f:
+                    f.write(orjson.dumps(
+                        report,
+                        default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                    ))
+            else:
+                with open(report_file, 'w') as f:
+                    json.dump(report, f, indent=2, default=str)
             
             logger.info(f"Performance report saved to {report_file}")
             
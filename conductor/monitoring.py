@@ -6,14 +6,19 @@ This module provides middleware and integration points for comprehensive
 performance monitoring throughout the Claude Conductor system.
 """
 
+import os
+import sys
 import time
+import itertools
 import threading
 import functools
 import logging
-import uuid
-from typing import Dict, Any, Optional, Callable, List, Union
+import weakref
+from typing import Dict, Any, Optional, Callable, List, Tuple, Union
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from collections import deque
+from contextvars import ContextVar, Token
 import json
 import traceback
 from concurrent.futures import ThreadPoolExecutor
@@ -21,10 +26,29 @@ from concurrent.futures import ThreadPoolExecutor
 from .metrics import get_metrics_collector, MetricsCollector, TaskMetrics, PerformanceMonitor
 from .utils import get_system_stats
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Runtime instrumentation switches; when off, traced and intercepted calls
+# go straight to the wrapped function
+_TRACING_ENABLED = True
+_INTERCEPT_ENABLED = True
+
+# Trace and span ids only need to be unique per process: prefix + counter
+_TRACE_ID_PREFIX = f"{os.getpid():x}-{int(time.time()):x}-"
+_trace_counter = itertools.count()
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class TraceContext:
     """Distributed tracing context"""
     trace_id: str
@@ -34,6 +58,7 @@ class TraceContext:
     start_time: float = 0.0
     tags: Dict[str, str] = None
     logs: List[Dict[str, Any]] = None
+    start_ns: int = 0  # time.monotonic_ns() at start, for the duration
     
     def __post_init__(self):
         if self.tags is None:
@@ -42,21 +67,86 @@ class TraceContext:
             self.logs = []
         if self.start_time == 0.0:
             self.start_time = time.time()
+        if self.start_ns == 0:
+            self.start_ns = time.monotonic_ns()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_span_id': self.parent_span_id,
+            'operation_name': self.operation_name,
+            'start_time': self.start_time,
+            'tags': dict(self.tags),
+            'logs': list(self.logs),
+            'start_ns': self.start_ns
+        }
+
+
+# Trace of the innermost @traced call in the current thread or asyncio task
+_current_trace: ContextVar[Optional[TraceContext]] = ContextVar('current_trace', default=None)
+
+
+def get_current_trace() -> Optional[TraceContext]:
+    """Get the trace of the innermost @traced call in the current context"""
+    return _current_trace.get()
+
+
+# Number of independently locked active-trace shards (power of two)
+_TRACE_SHARDS = 16
 
 
 class TracingMiddleware:
-    """Distributed tracing middleware"""
+    """Distributed tracing middleware
+    
+    Active traces are split across shards keyed by trace id, each with its own
+    lock, so concurrent traces do not contend on a single lock. Only inserting
+    and removing traces takes a shard lock; tags and logs are added lock-free.
+    """
     
     def __init__(self):
-        self.active_traces: Dict[str, TraceContext] = {}
-        self.completed_traces: List[TraceContext] = []
+        self._shards: List[Tuple[threading.Lock, Dict[str, TraceContext]]] = [
+            (threading.Lock(), {}) for _ in range(_TRACE_SHARDS)
+        ]
         self.max_completed_traces = 1000
-        self.lock = threading.RLock()
+        self.completed_traces: deque = deque(maxlen=self.max_completed_traces)
+        self._completed_lock = threading.Lock()
+    
+    def _shard(self, trace_id: str) -> Tuple[threading.Lock, Dict[str, TraceContext]]:
+        """Get the (lock, traces) shard holding a trace id"""
+        return self._shards[hash(trace_id) & (_TRACE_SHARDS - 1)]
+    
+    @property
+    def active_traces(self) -> Dict[str, TraceContext]:
+        """Snapshot of all active traces"""
+        traces = {}
+        for lock, shard in self._shards:
+            with lock:
+                traces.update(shard)
+        return traces
+    
+    def start_current_trace(self, operation_name: str) -> Tuple[TraceContext, Token]:
+        """Start a trace under the current one and make it current
+        
+        Returns the trace and the token to pass to ``_current_trace.reset``
+        once the traced work is done, as the ``traced`` decorator does.
+        """
+        parent = _current_trace.get()
+        trace = self.start_trace(operation_name, parent.span_id if parent is not None else None)
+        return trace, _current_trace.set(trace)
+    
+    def get_active_trace(self, trace_id: str) -> Optional[TraceContext]:
+        """Look up one active trace, touching only its shard"""
+        return self._shard(trace_id)[1].get(trace_id)
+    
+    def active_trace_count(self) -> int:
+        """Number of active traces, without copying any shard"""
+        return sum(len(shard) for _, shard in self._shards)
     
     def start_trace(self, operation_name: str, parent_trace_id: str = None) -> TraceContext:
         """Start a new trace"""
-        trace_id = str(uuid.uuid4())
-        span_id = str(uuid.uuid4())
+        trace_id = _TRACE_ID_PREFIX + format(next(_trace_counter), 'x')
+        span_id = _TRACE_ID_PREFIX + format(next(_trace_counter), 'x')
         parent_span_id = parent_trace_id
         
         trace_context = TraceContext(
@@ -66,64 +156,91 @@ class TracingMiddleware:
             operation_name=operation_name
         )
         
-        with self.lock:
-            self.active_traces[trace_id] = trace_context
+        lock, shard = self._shard(trace_id)
+        with lock:
+            shard[trace_id] = trace_context
         
         logger.debug(f"Started trace {trace_id} for operation {operation_name}")
         return trace_context
     
     def finish_trace(self, trace_id: str, status: str = "success", error: str = None):
         """Finish a trace"""
-        with self.lock:
-            if trace_id not in self.active_traces:
-                logger.warning(f"Trace {trace_id} not found in active traces")
-                return
-            
-            trace = self.active_traces.pop(trace_id)
-            trace.tags['status'] = status
-            trace.tags['duration'] = str(time.time() - trace.start_time)
-            
-            if error:
-                trace.tags['error'] = error
-                trace.logs.append({
-                    'timestamp': time.time(),
-                    'level': 'error',
-                    'message': error
-                })
-            
+        lock, shard = self._shard(trace_id)
+        with lock:
+            trace = shard.pop(trace_id, None)
+        
+        if trace is None:
+            logger.warning(f"Trace {trace_id} not found in active traces")
+            return
+        
+        # The trace is no longer shared, so it can be updated without a lock
+        trace.tags['status'] = status
+        trace.tags['duration'] = str((time.monotonic_ns() - trace.start_ns) / 1e9)
+        
+        if error:
+            trace.tags['error'] = error
+            trace.logs.append({
+                'timestamp': time.time(),
+                'level': 'error',
+                'message': error
+            })
+        
+        # Bounded by maxlen; the oldest traces are dropped
+        with self._completed_lock:
             self.completed_traces.append(trace)
-            
-            # Limit memory usage
-            if len(self.completed_traces) > self.max_completed_traces:
-                self.completed_traces = self.completed_traces[-self.max_completed_traces:]
         
         logger.debug(f"Finished trace {trace_id} with status {status}")
     
     def add_trace_log(self, trace_id: str, level: str, message: str, **kwargs):
         """Add a log entry to an active trace"""
-        with self.lock:
-            if trace_id in self.active_traces:
-                self.active_traces[trace_id].logs.append({
-                    'timestamp': time.time(),
-                    'level': level,
-                    'message': message,
-                    **kwargs
-                })
+        # dict.get and list.append are atomic, so no shard lock is needed
+        trace = self._shard(trace_id)[1].get(trace_id)
+        if trace is not None:
+            trace.logs.append({
+                'timestamp': time.time(),
+                'level': level,
+                'message': message,
+                **kwargs
+            })
     
     def add_trace_tag(self, trace_id: str, key: str, value: str):
         """Add a tag to an active trace"""
-        with self.lock:
-            if trace_id in self.active_traces:
-                self.active_traces[trace_id].tags[key] = value
+        # dict.get and dict item assignment are atomic, so no shard lock is needed
+        trace = self._shard(trace_id)[1].get(trace_id)
+        if trace is not None:
+            trace.tags[key] = value
+    
+    def add_current_trace_tag(self, key: str, value: str):
+        """Add a tag to the current context's trace, without an id lookup"""
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.tags[key] = value
+    
+    def add_current_trace_log(self, level: str, message: str, **kwargs):
+        """Add a log entry to the current context's trace, without an id lookup"""
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.logs.append({
+                'timestamp': time.time(),
+                'level': level,
+                'message': message,
+                **kwargs
+            })
+    
+    def get_completed_traces(self) -> List[TraceContext]:
+        """Snapshot of completed traces, oldest first"""
+        with self._completed_lock:
+            return list(self.completed_traces)
     
     def get_trace_summary(self) -> Dict[str, Any]:
         """Get tracing summary"""
-        with self.lock:
-            return {
-                'active_traces': len(self.active_traces),
-                'completed_traces': len(self.completed_traces),
-                'total_traces': len(self.active_traces) + len(self.completed_traces)
-            }
+        active_count = self.active_trace_count()
+        completed_count = len(self.completed_traces)
+        return {
+            'active_traces': active_count,
+            'completed_traces': completed_count,
+            'total_traces': active_count + completed_count
+        }
 
 
 # Global tracing middleware instance
@@ -135,29 +252,45 @@ def get_tracing_middleware() -> TracingMiddleware:
     """Get or create the global tracing middleware instance"""
     global _tracing_middleware
     
+    # Fast path: once created, the instance is returned without locking
+    tracing = _tracing_middleware
+    if tracing is not None:
+        return tracing
+    
     with _tracing_lock:
         if _tracing_middleware is None:
             _tracing_middleware = TracingMiddleware()
         return _tracing_middleware
 
 
+def set_tracing_enabled(enabled: bool):
+    """Enable or disable tracing of @traced functions"""
+    global _TRACING_ENABLED
+    _TRACING_ENABLED = enabled
+
+
+def set_interception_enabled(enabled: bool):
+    """Enable or disable method interception metrics"""
+    global _INTERCEPT_ENABLED
+    _INTERCEPT_ENABLED = enabled
+
+
 def traced(operation_name: str = None, include_args: bool = False):
     """Decorator to add distributed tracing to functions"""
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            op_name = operation_name or f"{func.__module__}.{func.__name__}"
+        # Everything fixed at decoration time is resolved once here
+        op_name = operation_name or f"{func.__module__}.{func.__name__}"
+        func_tags = {'function': func.__name__, 'module': func.__module__}
+        
+        def start():
             tracing = get_tracing_middleware()
-            trace = tracing.start_trace(op_name)
-            
-            # Add function metadata
-            tracing.add_trace_tag(trace.trace_id, 'function', func.__name__)
-            tracing.add_trace_tag(trace.trace_id, 'module', func.__module__)
-            
-            if include_args:
-                tracing.add_trace_tag(trace.trace_id, 'args_count', str(len(args)))
-                tracing.add_trace_tag(trace.trace_id, 'kwargs_count', str(len(kwargs)))
-            
+            parent = _current_trace.get()
+            trace = tracing.start_trace(op_name, parent.span_id if parent is not None else None)
+            trace.tags.update(func_tags)
+            return tracing, trace
+        
+        def run(tracing, trace, args, kwargs):
+            token = _current_trace.set(trace)
             try:
                 result = func(*args, **kwargs)
                 tracing.finish_trace(trace.trace_id, "success")
@@ -166,91 +299,283 @@ def traced(operation_name: str = None, include_args: bool = False):
             except Exception as e:
                 tracing.finish_trace(trace.trace_id, "error", str(e))
                 raise
+            
+            finally:
+                _current_trace.reset(token)
+        
+        if include_args:
+            def wrapper(*args, **kwargs):
+                if not _TRACING_ENABLED:
+                    return func(*args, **kwargs)
+                
+                tracing, trace = start()
+                trace.tags['args_count'] = str(len(args))
+                trace.tags['kwargs_count'] = str(len(kwargs))
+                return run(tracing, trace, args, kwargs)
+        else:
+            def wrapper(*args, **kwargs):
+                if not _TRACING_ENABLED:
+                    return func(*args, **kwargs)
+                
+                tracing, trace = start()
+                return run(tracing, trace, args, kwargs)
         
-        return wrapper
+        return functools.wraps(func)(wrapper)
     return decorator
 
 
+# Exception type -> name, for the error paths of intercepted methods
+_exc_name_cache: Dict[type, str] = {}
+
+
+def _exception_name(exc: BaseException) -> str:
+    """Get an exception's type name, cached per type"""
+    exc_type = type(exc)
+    name = _exc_name_cache.get(exc_type)
+    if name is None:
+        name = _exc_name_cache[exc_type] = exc_type.__name__
+    return name
+
+
+class MethodStats:
+    """Sliding-window duration statistics for one method
+    
+    Count, sum, min and max over the last ``window`` durations are kept up to
+    date on every record, using monotonic deques for the window min/max.
+    """
+    
+    __slots__ = ('window', 'durations', 'total_ns', '_recorded', '_min_candidates', '_max_candidates')
+    
+    def __init__(self, window: int = 100):
+        self.window = window
+        self.durations: deque = deque(maxlen=window)
+        self.total_ns = 0
+        self._recorded = 0
+        self._min_candidates: deque = deque()  # (index, duration), increasing durations
+        self._max_candidates: deque = deque()  # (index, duration), decreasing durations
+    
+    def record(self, duration_ns: int):
+        """Add a duration, evicting the oldest once the window is full"""
+        if len(self.durations) == self.window:
+            self.total_ns -= self.durations[0]
+        self.durations.append(duration_ns)
+        self.total_ns += duration_ns
+        
+        index = self._recorded
+        self._recorded += 1
+        oldest = index - self.window
+        
+        min_candidates = self._min_candidates
+        while min_candidates and min_candidates[-1][1] >= duration_ns:
+            min_candidates.pop()
+        min_candidates.append((index, duration_ns))
+        if min_candidates[0][0] <= oldest:
+            min_candidates.popleft()
+        
+        max_candidates = self._max_candidates
+        while max_candidates and max_candidates[-1][1] <= duration_ns:
+            max_candidates.pop()
+        max_candidates.append((index, duration_ns))
+        if max_candidates[0][0] <= oldest:
+            max_candidates.popleft()
+    
+    def summary(self) -> Dict[str, float]:
+        """Window statistics in seconds"""
+        count = len(self.durations)
+        return {
+            'count': count,
+            'avg_duration': self.total_ns / count / 1e9,
+            'min_duration': self._min_candidates[0][1] / 1e9,
+            'max_duration': self._max_candidates[0][1] / 1e9,
+            'total_duration': self.total_ns / 1e9
+        }
+
+
+class _MetricsBuffer:
+    """Per-thread buffer of pending collector calls"""
+    
+    __slots__ = ('requests', 'errors', 'deadline_ns', 'owner')
+    
+    def __init__(self, owner: threading.Thread):
+        # deques so another thread can drain them while the owner appends
+        self.requests: deque = deque()  # (method, endpoint, status_code, duration)
+        self.errors: deque = deque()    # (error_type, component, severity)
+        self.deadline_ns = 0
+        self.owner = owner
+
+
+def _drain(pending: deque) -> list:
+    """Pop everything currently in a deque; safe while other threads pop too"""
+    items = []
+    popleft = pending.popleft
+    while True:
+        try:
+            items.append(popleft())
+        except IndexError:
+            return items
+
+
 class PerformanceInterceptor:
     """Performance monitoring interceptor for method calls"""
     
+    # Collector calls are buffered per thread and flushed in batches once this
+    # many requests are pending or the oldest flush is this old. A sweeper
+    # thread flushes buffers of idle threads and drops those of exited ones.
+    FLUSH_THRESHOLD = 128
+    FLUSH_INTERVAL_NS = 1_000_000_000
+    
     def __init__(self, metrics_collector: Optional[MetricsCollector] = None):
         self.metrics_collector = metrics_collector or get_metrics_collector()
-        self.method_stats: Dict[str, List[float]] = {}
+        self.method_stats: Dict[str, MethodStats] = {}  # Last 100 calls per method
         self.lock = threading.RLock()
+        self._local = threading.local()
+        self._buffers: List[_MetricsBuffer] = []
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweeper_stop = threading.Event()
+        self._stopped = False
+    
+    def _get_buffer(self) -> _MetricsBuffer:
+        """Get the calling thread's metrics buffer"""
+        try:
+            return self._local.buffer
+        except AttributeError:
+            buffer = self._local.buffer = _MetricsBuffer(threading.current_thread())
+            with self.lock:
+                self._buffers.append(buffer)
+                if self._sweeper is None:
+                    self._start_sweeper()
+            return buffer
+    
+    def _flush_buffer(self, buffer: _MetricsBuffer):
+        """Send a buffer's pending calls to the collector"""
+        if buffer.errors:
+            errors = _drain(buffer.errors)
+            if errors:
+                self.metrics_collector.record_errors(errors)
+        if buffer.requests:
+            requests = _drain(buffer.requests)
+            if requests:
+                self.metrics_collector.record_api_requests(requests)
+    
+    def flush_metrics(self):
+        """Send every thread's pending calls to the collector"""
+        with self.lock:
+            buffers = list(self._buffers)
+        for buffer in buffers:
+            self._flush_buffer(buffer)
+    
+    def _start_sweeper(self):
+        """Start the background sweep thread; caller holds self.lock"""
+        # The thread only holds a weak reference, so it ends with the interceptor
+        self._sweeper = threading.Thread(
+            target=PerformanceInterceptor._sweep_loop,
+            args=(weakref.ref(self), self._sweeper_stop, self.FLUSH_INTERVAL_NS / 1e9),
+            name="metrics-sweeper", daemon=True
+        )
+        self._sweeper.start()
+    
+    @staticmethod
+    def _sweep_loop(interceptor_ref: "weakref.ref[PerformanceInterceptor]",
+                    stop: threading.Event, interval: float):
+        """Sweep buffers every interval until stopped or the interceptor is gone"""
+        while not stop.wait(interval):
+            interceptor = interceptor_ref()
+            if interceptor is None:
+                return
+            try:
+                interceptor._sweep_buffers()
+            except Exception as e:
+                logger.error(f"Metrics sweep failed: {e}")
+            del interceptor
+    
+    def _sweep_buffers(self):
+        """Flush buffers past their deadline and drop those of exited threads"""
+        now_ns = time.monotonic_ns()
+        with self.lock:
+            buffers = list(self._buffers)
+            self._buffers = [b for b in buffers if b.owner.is_alive()]
+        for buffer in buffers:
+            if not buffer.owner.is_alive():
+                buffer.owner = None
+                self._flush_buffer(buffer)
+            elif now_ns >= buffer.deadline_ns and (buffer.requests or buffer.errors):
+                buffer.deadline_ns = now_ns + self.FLUSH_INTERVAL_NS
+                self._flush_buffer(buffer)
+    
+    def stop(self):
+        """Stop the sweeper and send whatever is still buffered
+        
+        Calls intercepted after this (such as the wrapped stop() itself)
+        flush straight through, since no sweeper is left to pick them up.
+        """
+        self._stopped = True
+        self._sweeper_stop.set()
+        self.flush_metrics()
     
     def intercept_method(self, instance: Any, method_name: str, original_method: Callable):
         """Intercept and monitor method calls"""
-        @functools.wraps(original_method)
+        # Fixed per interception; the wrapper is installed on the instance and
+        # never introspected, so functools.wraps is not needed
+        component = instance.__class__.__name__
+        method_key = f"{component}.{method_name}"
+        
+        def record(buffer: _MetricsBuffer, end_ns: int, duration_ns: int, status_code: int):
+            buffer.requests.append(('method_call', method_key, status_code, duration_ns / 1e9))
+            if (self._stopped or len(buffer.requests) >= self.FLUSH_THRESHOLD
+                    or end_ns >= buffer.deadline_ns):
+                buffer.deadline_ns = end_ns + self.FLUSH_INTERVAL_NS
+                try:
+                    self._flush_buffer(buffer)
+                except Exception as e:
+                    # Metrics delivery must not change the outcome of the monitored call
+                    logger.error(f"Failed to flush method metrics: {e}")
+        
         def monitored_method(*args, **kwargs):
-            start_time = time.time()
-            method_key = f"{instance.__class__.__name__}.{method_name}"
+            if not _INTERCEPT_ENABLED:
+                return original_method(*args, **kwargs)
+            
+            start_ns = time.monotonic_ns()
             
             try:
                 result = original_method(*args, **kwargs)
-                
-                # Record successful execution
-                duration = time.time() - start_time
-                self._record_method_performance(method_key, duration, True)
-                
-                self.metrics_collector.record_api_request(
-                    method='method_call',
-                    endpoint=method_key,
-                    status_code=200,
-                    duration=duration
-                )
-                
-                return result
-                
             except Exception as e:
                 # Record failed execution
-                duration = time.time() - start_time
-                self._record_method_performance(method_key, duration, False)
+                end_ns = time.monotonic_ns()
+                duration_ns = end_ns - start_ns
+                self._record_method_performance(method_key, duration_ns, False)
                 
-                self.metrics_collector.record_error(
-                    error_type=type(e).__name__,
-                    component=instance.__class__.__name__,
-                    severity='error',
-                    message=str(e)
-                )
-                
-                self.metrics_collector.record_api_request(
-                    method='method_call',
-                    endpoint=method_key,
-                    status_code=500,
-                    duration=duration
-                )
+                buffer = self._get_buffer()
+                buffer.errors.append((_exception_name(e), component, 'error'))
+                record(buffer, end_ns, duration_ns, 500)
                 
                 raise
+            
+            # Record successful execution
+            end_ns = time.monotonic_ns()
+            duration_ns = end_ns - start_ns
+            self._record_method_performance(method_key, duration_ns, True)
+            record(self._get_buffer(), end_ns, duration_ns, 200)
+            
+            return result
         
         return monitored_method
     
-    def _record_method_performance(self, method_key: str, duration: float, success: bool):
-        """Record method performance statistics"""
+    def _record_method_performance(self, method_key: str, duration_ns: int, success: bool):
+        """Record method performance statistics (duration in nanoseconds)"""
         with self.lock:
-            if method_key not in self.method_stats:
-                self.method_stats[method_key] = []
-            
-            self.method_stats[method_key].append(duration)
-            
-            # Keep only last 100 measurements per method
-            if len(self.method_stats[method_key]) > 100:
-                self.method_stats[method_key] = self.method_stats[method_key][-100:]
+            stats = self.method_stats.get(method_key)
+            if stats is None:
+                stats = self.method_stats[method_key] = MethodStats()
+            stats.record(duration_ns)
     
     def get_method_stats(self) -> Dict[str, Dict[str, float]]:
         """Get method performance statistics"""
         with self.lock:
-            stats = {}
-            for method_key, durations in self.method_stats.items():
-                if durations:
-                    stats[method_key] = {
-                        'count': len(durations),
-                        'avg_duration': sum(durations) / len(durations),
-                        'min_duration': min(durations),
-                        'max_duration': max(durations),
-                        'total_duration': sum(durations)
-                    }
-            return stats
+            return {
+                method_key: stats.summary()
+                for method_key, stats in self.method_stats.items()
+                if stats.durations
+            }
 
 
 class OrchestratorMonitoringMixin:
@@ -284,39 +609,46 @@ class OrchestratorMonitoringMixin:
                 )
                 setattr(self, method_name, monitored_method)
     
-    @traced("orchestrator.execute_task")
     def execute_task_with_monitoring(self, task, **kwargs):
         """Execute task with comprehensive monitoring"""
+        # Task always defines priority and queue_time (0.0 until a queue sets
+        # it); the defaults only cover duck-typed tasks without those fields
+        try:
+            priority = task.priority
+        except AttributeError:
+            priority = 5
+        
         # Start task metrics tracking
         task_metrics = self.metrics_collector.record_task_start(
             task_id=task.task_id,
             task_type=task.task_type,
             agent_id="orchestrator",  # Will be updated when assigned to agent
-            priority=getattr(task, 'priority', 5),
+            priority=priority,
             queue_time=getattr(task, 'queue_time', 0.0)
         )
         
+        # One trace per task execution, tagged with the task details; it is made
+        # current so spans opened inside the task nest under it
+        trace, token = self.tracing.start_current_trace(f"task_execution_{task.task_type}")
+        self.tracing.add_trace_tag(trace.trace_id, 'task_id', task.task_id)
+        self.tracing.add_trace_tag(trace.trace_id, 'task_type', task.task_type)
+        
         try:
-            # Add trace information
-            trace = get_tracing_middleware().start_trace(f"task_execution_{task.task_type}")
-            get_tracing_middleware().add_trace_tag(trace.trace_id, 'task_id', task.task_id)
-            get_tracing_middleware().add_trace_tag(trace.trace_id, 'task_type', task.task_type)
-            
             # Execute the original task
             result = self.execute_task(task, **kwargs)
             
             # Update metrics with final agent assignment
-            if hasattr(result, 'agent_id'):
+            try:
                 task_metrics.agent_id = result.agent_id
+                status = result.status
+            except AttributeError:
+                status = getattr(result, 'status', 'unknown')
             
             # Record completion
-            self.metrics_collector.record_task_completion(
-                task.task_id,
-                result.status if hasattr(result, 'status') else 'unknown'
-            )
+            self.metrics_collector.record_task_completion(task.task_id, status)
             
             # Finish trace
-            get_tracing_middleware().finish_trace(trace.trace_id, "success")
+            self.tracing.finish_trace(trace.trace_id, "success")
             
             return result
             
@@ -325,18 +657,29 @@ class OrchestratorMonitoringMixin:
             self.metrics_collector.record_task_completion(
                 task.task_id,
                 'failed',
-                error_type=type(e).__name__,
+                error_type=_exception_name(e),
                 error_message=str(e)
             )
             
             # Finish trace with error
-            get_tracing_middleware().finish_trace(trace.trace_id, "error", str(e))
+            self.tracing.finish_trace(trace.trace_id, "error", str(e))
             
             raise
+        
+        finally:
+            _current_trace.reset(token)
+    
+    def stop(self, *args, **kwargs):
+        """Stop the orchestrator, then deliver buffered method metrics"""
+        try:
+            return super().stop(*args, **kwargs)
+        finally:
+            self.performance_interceptor.stop()
     
     def get_comprehensive_status(self) -> Dict[str, Any]:
         """Get comprehensive system status including metrics"""
         base_status = self.get_agent_status() if hasattr(self, 'get_agent_status') else {}
+        self.performance_interceptor.flush_metrics()
         
         return {
             'timestamp': time.time(),
@@ -368,6 +711,7 @@ class AgentMonitoringMixin:
         self.performance_interceptor = PerformanceInterceptor(self.metrics_collector)
         self.tracing = get_tracing_middleware()
         self.resource_monitor = ResourceMonitor()
+        self._monitoring_component = f"agent_{self.agent_id}"
         
         # Intercept key methods for monitoring
         self._intercept_agent_monitoring_methods()
@@ -390,11 +734,8 @@ class AgentMonitoringMixin:
                 )
                 setattr(self, method_name, monitored_method)
     
-    @traced("agent.execute_task")
     def execute_task_with_monitoring(self, task, **kwargs):
         """Execute task with comprehensive agent monitoring"""
-        start_time = time.time()
-        
         # Update agent status - starting task
         self.metrics_collector.update_agent_status(
             agent_id=self.agent_id,
@@ -403,24 +744,20 @@ class AgentMonitoringMixin:
             health_failures=getattr(self, 'health_check_failed', 0)
         )
         
+        # One trace per task execution, tagged with the agent and task; it is made
+        # current so spans opened inside the task nest under it
+        trace, token = self.tracing.start_current_trace(f"agent_task_{task.task_type}")
+        self.tracing.add_trace_tag(trace.trace_id, 'agent_id', self.agent_id)
+        self.tracing.add_trace_tag(trace.trace_id, 'task_id', task.task_id)
+        
+        # Process sample at task start; the delta is taken when the task ends
+        start_sample = self.resource_monitor.sample_process_usage()
+        
         try:
-            # Start trace
-            trace = self.tracing.start_trace(f"agent_task_{task.task_type}")
-            self.tracing.add_trace_tag(trace.trace_id, 'agent_id', self.agent_id)
-            self.tracing.add_trace_tag(trace.trace_id, 'task_id', task.task_id)
-            
-            # Get initial resource usage
-            initial_resources = self.resource_monitor.get_current_usage()
-            
             # Execute task
             result = self.execute_task(task, **kwargs)
             
-            # Get final resource usage
-            final_resources = self.resource_monitor.get_current_usage()
-            
-            # Calculate resource usage delta
-            cpu_usage = final_resources.get('cpu_percent', 0) - initial_resources.get('cpu_percent', 0)
-            memory_usage = final_resources.get('memory_bytes', 0) - initial_resources.get('memory_bytes', 0)
+            cpu_usage, memory_usage = self.resource_monitor.usage_since(start_sample)
             
             # Update agent status - task completed
             self.metrics_collector.update_agent_status(
@@ -452,8 +789,8 @@ class AgentMonitoringMixin:
             
             # Record error
             self.metrics_collector.record_error(
-                error_type=type(e).__name__,
-                component=f"agent_{self.agent_id}",
+                error_type=_exception_name(e),
+                component=self._monitoring_component,
                 severity='error',
                 message=str(e)
             )
@@ -462,14 +799,26 @@ class AgentMonitoringMixin:
             self.tracing.finish_trace(trace.trace_id, "error", str(e))
             
             raise
+        
+        finally:
+            _current_trace.reset(token)
+    
+    def stop(self, *args, **kwargs):
+        """Stop the agent, then deliver buffered method metrics"""
+        try:
+            return super().stop(*args, **kwargs)
+        finally:
+            self.performance_interceptor.stop()
     
     def get_agent_performance_stats(self) -> Dict[str, Any]:
         """Get agent-specific performance statistics"""
+        self.performance_interceptor.flush_metrics()
+        
         return {
             'agent_id': self.agent_id,
             'resource_usage': self.resource_monitor.get_current_usage(),
             'method_performance': self.performance_interceptor.get_method_stats(),
-            'active_traces': len(self.tracing.active_traces),
+            'active_traces': self.tracing.active_trace_count(),
             'health_status': {
                 'is_running': getattr(self, 'is_running', False),
                 'health_failures': getattr(self, 'health_check_failed', 0),
@@ -481,24 +830,23 @@ class AgentMonitoringMixin:
 class ResourceMonitor:
     """Monitor system and process resource usage"""
     
+    # Usage is system-wide, so one recent sample is shared by all monitors
+    SAMPLE_TTL = 1.0
+    _last_sample: Tuple[float, Dict[str, float]] = (float('-inf'), {})
+    _sample_lock = threading.Lock()
+    
     def __init__(self):
-        self.monitoring = False
+        # Per-agent bookkeeping only; usage is sampled on demand
         self.agent_resources: Dict[str, Dict[str, float]] = {}
         self.lock = threading.RLock()
+        self._process = None
     
     def start_monitoring(self, agent_id: str):
         """Start monitoring resources for an agent"""
         with self.lock:
             self.agent_resources[agent_id] = {
-                'cpu_percent': 0.0,
-                'memory_bytes': 0.0,
-                'memory_percent': 0.0,
-                'last_update': time.time()
+                'monitoring_since': time.time()
             }
-        
-        if not self.monitoring:
-            self.monitoring = True
-            threading.Thread(target=self._monitor_loop, daemon=True).start()
     
     def stop_monitoring(self, agent_id: str):
         """Stop monitoring resources for an agent"""
@@ -506,17 +854,61 @@ class ResourceMonitor:
             if agent_id in self.agent_resources:
                 del self.agent_resources[agent_id]
     
+    def sample_process_usage(self) -> Optional[Tuple[float, float, int]]:
+        """Sample this process once as (monotonic time, CPU seconds, RSS bytes)
+        
+        Returns None when the process cannot be sampled.
+        """
+        try:
+            import psutil
+            if self._process is None:
+                self._process = psutil.Process()
+            with self._process.oneshot():
+                cpu_times = self._process.cpu_times()
+                rss = self._process.memory_info().rss
+        except Exception as e:
+            logger.error(f"Error getting process resource usage: {e}")
+            return None
+        return time.monotonic(), cpu_times.user + cpu_times.system, rss
+    
+    def usage_since(self, start: Optional[Tuple[float, float, int]]) -> Tuple[float, float]:
+        """Sample this process again and diff it against a sample taken at task start
+        
+        Returns (cpu_percent, memory_delta_bytes) over the interval, or zeros
+        when either sample is missing.
+        """
+        end = self.sample_process_usage()
+        if start is None or end is None:
+            return 0.0, 0.0
+        
+        started_at, start_cpu_time, start_rss = start
+        ended_at, end_cpu_time, end_rss = end
+        elapsed = ended_at - started_at
+        cpu_percent = (end_cpu_time - start_cpu_time) / elapsed * 100 if elapsed > 0 else 0.0
+        return cpu_percent, float(end_rss - start_rss)
+    
     def get_current_usage(self) -> Dict[str, float]:
-        """Get current system resource usage"""
+        """Get current system resource usage, reusing samples up to SAMPLE_TTL old"""
+        sampled_at, sample = ResourceMonitor._last_sample
+        if time.monotonic() - sampled_at < self.SAMPLE_TTL:
+            return sample.copy()
+        
         try:
             import psutil
-            memory = psutil.virtual_memory()
-            return {
-                'cpu_percent': psutil.cpu_percent(interval=None),
-                'memory_bytes': memory.used,
-                'memory_percent': memory.percent,
-                'timestamp': time.time()
-            }
+            with ResourceMonitor._sample_lock:
+                # Another thread may have refreshed the sample while we waited
+                sampled_at, sample = ResourceMonitor._last_sample
+                now = time.monotonic()
+                if now - sampled_at >= self.SAMPLE_TTL:
+                    memory = psutil.virtual_memory()
+                    sample = {
+                        'cpu_percent': psutil.cpu_percent(interval=None),
+                        'memory_bytes': memory.used,
+                        'memory_percent': memory.percent,
+                        'timestamp': time.time()
+                    }
+                    ResourceMonitor._last_sample = (now, sample)
+            return sample.copy()
         except Exception as e:
             logger.error(f"Error getting resource usage: {e}")
             return {
@@ -525,22 +917,6 @@ class ResourceMonitor:
                 'memory_percent': 0.0,
                 'timestamp': time.time()
             }
-    
-    def _monitor_loop(self):
-        """Resource monitoring loop"""
-        while self.monitoring and self.agent_resources:
-            try:
-                current_usage = self.get_current_usage()
-                
-                with self.lock:
-                    for agent_id in self.agent_resources:
-                        self.agent_resources[agent_id].update(current_usage)
-                
-                time.sleep(5)  # Update every 5 seconds
-                
-            except Exception as e:
-                logger.error(f"Error in resource monitoring loop: {e}")
-                time.sleep(5)
 
 
 def create_monitoring_config() -> Dict[str, Any]:
@@ -580,6 +956,11 @@ def setup_monitoring(orchestrator_class, agent_class, config: Dict[str, Any] = N
     if config is None:
         config = create_monitoring_config()
     
+    set_tracing_enabled(config.get('tracing', {}).get('enabled', True))
+    set_interception_enabled(
+        config.get('performance_monitoring', {}).get('method_interception', True)
+    )
+    
     # Create monitored orchestrator class
     class MonitoredOrchestrator(OrchestratorMonitoringMixin, orchestrator_class):
         pass
@@ -606,4 +987,10 @@ def generate_monitoring_report(metrics_collector: Optional[MetricsCollector] = N
         'prometheus_available': metrics_collector.enable_prometheus
     }
     
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            report_data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
     return json.dumps(report_data, indent=2, default=str)
\ No newline at end of file
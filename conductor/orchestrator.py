@@ -4,14 +4,19 @@ Multi-agent orchestrator for Claude Conductor
 """
 
 import os
+import copy
 import time
 import json
-import uuid
+import itertools
+import math
+import random
+import statistics
 import threading
 import yaml
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, Iterator, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field, asdict
-from concurrent.futures import ThreadPoolExecutor, Future
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError, as_completed
 import logging
 from datetime import datetime
 import asyncio
@@ -30,13 +35,89 @@ from .task_decomposer import TaskDecomposer, ComplexityAnalysis
 from .coordination import CoordinationManager, CoordinationStrategy, LeadAgent, AgentCapability, AgentRole
 from .token_optimizer import TokenOptimizer
 from .mcp_integration import MCPClient, MCPServer, MCPCapability, MCPRegistry
+from .utils import WorkStealingExecutor, next_correlation_id
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# libyaml's C loader when available (same safety as SafeLoader)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Parsed config files: absolute path -> (mtime_ns, size, config)
+_config_cache: Dict[str, tuple] = {}
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """JSON-encode to bytes, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=str).encode()
+
+
+def _format_json(data: Dict[str, Any]) -> str:
+    """Indented JSON text for logs and console output"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, indent=2, default=str)
+
+
+def _read_config_file(config_path: str) -> Dict[str, Any]:
+    """Parse a YAML config file, reusing the parse while the file is unchanged"""
+    with open(config_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        path = os.path.abspath(config_path)
+        cached = _config_cache.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            config = cached[2]
+        else:
+            config = yaml.load(f, Loader=_YamlLoader)
+            _config_cache[path] = (st.st_mtime_ns, st.st_size, config)
+    # Callers may modify nested settings
+    return copy.deepcopy(config)
+
+
+class OrchestratorStats:
+    """Orchestrator execution counters
+    
+    Slots keep the per-task update to plain attribute writes; item access by
+    the original dict keys still works for readers.
+    """
+    
+    __slots__ = ("tasks_completed", "tasks_failed", "total_execution_time", "start_time", "_lock")
+    
+    def __init__(self):
+        self.tasks_completed = 0
+        self.tasks_failed = 0
+        self.total_execution_time = 0.0
+        self.start_time: Optional[float] = None
+        self._lock = threading.Lock()
+        
+    def record(self, failed: bool, execution_time: float):
+        """Count one finished task"""
+        with self._lock:
+            self.tasks_failed += failed
+            self.tasks_completed += not failed
+            self.total_execution_time += execution_time
+            
+    def __getitem__(self, key: str) -> Any:
+        if key.startswith("_") or key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+        
+    def __setitem__(self, key: str, value: Any):
+        if key.startswith("_") or key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+
 class Orchestrator:
     """Multi-agent orchestrator for Claude Conductor"""
     
@@ -49,16 +130,36 @@ class Orchestrator:
         
         # Components
         self.agents: Dict[str, ClaudeAgent] = {}
-        self.executor = ThreadPoolExecutor(
-            max_workers=self.config.get("max_workers", 10)
+        
+        # Idle agent ids, longest idle first (the set mirrors the deque so an id is
+        # never queued twice); busy agents map to their in-flight task count
+        self._idle_agents: Deque[str] = deque()
+        self._idle_set: Set[str] = set()
+        self._busy_agents: Dict[str, int] = {}
+        self._agent_lock = threading.Lock()
+        self._agent_cycle: Optional[Iterator[str]] = None
+        # Sizes of recent batch steals from each agent's queue, used to size the next one
+        self._steal_history: Dict[str, Deque[int]] = defaultdict(lambda: deque(maxlen=64))
+        self._steal_history_lock = threading.Lock()  # Worker threads append while others read
+        
+        self.executor = WorkStealingExecutor(
+            max_workers=self.config["max_workers"],
+            thread_name_prefix="orchestrator"
         )
-        self.results: Dict[str, TaskResult] = {}
-        self.stats = {
-            "tasks_completed": 0,
-            "tasks_failed": 0,
-            "total_execution_time": 0.0,
-            "start_time": None
-        }
+        self._results: Dict[str, TaskResult] = {}
+        # JSON of recently read results, encoded on first read: task id -> (result, encoding).
+        # LRU-bounded, and checked against the stored result so a replaced one is re-encoded
+        self._results_json: "OrderedDict[str, Tuple[TaskResult, bytes]]" = OrderedDict()
+        self._results_json_max = self.config.get("results_json_cache_size", 1000)
+        self._results_json_lock = threading.Lock()
+        # Workers only enqueue completed results; a single flusher thread (or a
+        # reader, via _flush_completions) applies them to the stores above
+        self._completions: Deque[Tuple[str, TaskResult]] = deque()
+        self._completions_ready = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_stopping = False
+        self.stats = OrchestratorStats()
         
         # Communication socket
         self.broker_socket_path = "/tmp/claude_orchestrator.sock"
@@ -91,25 +192,37 @@ class Orchestrator:
         self.evaluator = LLMJudgeEvaluator()
         self.enable_evaluation = self.config.get("enable_evaluation", True)
         
+        # One event loop thread runs all background evaluations (started on first use)
+        self._eval_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._eval_thread: Optional[threading.Thread] = None
+        self._eval_loop_lock = threading.Lock()
+        self._eval_semaphore: Optional[asyncio.Semaphore] = None
+        
     def _load_config(self, config_path: Optional[str]) -> Dict[str, Any]:
         """Load configuration file with proper error handling"""
         default_config = {
             "num_agents": 3,
-            "max_workers": 10,
+            "max_workers_cap": 32,
+            "workers_per_cpu": 5,
             "task_timeout": 300,
-            "log_level": "INFO"
+            "log_level": "INFO",
+            # Hand out busy agents round-robin when none is idle instead of reporting
+            # that no agent is available (overcommits agents; off by default)
+            "share_busy_agents": False
         }
+        default_config["max_workers"] = self._default_max_workers(default_config)
         
         if not config_path:
             logger.info("No config path provided, using default configuration")
             return default_config
             
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = _read_config_file(config_path)
                 
             # Merge with defaults
             merged_config = {**default_config, **config}
+            if "max_workers" not in config:
+                merged_config["max_workers"] = self._default_max_workers(merged_config)
             
             # Validate configuration
             self._validate_config(merged_config)
@@ -137,6 +250,11 @@ class Orchestrator:
                 reraise=True
             )
             
+    @staticmethod
+    def _default_max_workers(config: Dict[str, Any]) -> int:
+        """Worker pool size for IO-bound agent calls: scaled by CPU count, capped"""
+        return min(config["max_workers_cap"], (os.cpu_count() or 1) * config["workers_per_cpu"])
+        
     def _validate_config(self, config: Dict[str, Any]):
         """Validate configuration values"""
         if config["num_agents"] < 1:
@@ -148,7 +266,7 @@ class Orchestrator:
             
     def start(self, num_agents: Optional[int] = None):
         """Start orchestrator and agents with enhanced error handling"""
-        correlation_id = str(uuid.uuid4())
+        correlation_id = next_correlation_id()
         logger.info(f"Starting orchestrator with correlation_id: {correlation_id}")
         
         # Update stats
@@ -171,6 +289,7 @@ class Orchestrator:
         if num_agents is None:
             num_agents = self.config.get("num_agents", 3)
             
+        active_agents = 0
         for i in range(num_agents):
             agent_id = f"agent_{i:03d}"
             try:
@@ -182,6 +301,9 @@ class Orchestrator:
                     
                 agent = self.agent_circuit_breaker.call(start_agent)
                 self.agents[agent_id] = agent
+                with self._agent_lock:
+                    self._mark_idle(agent_id)
+                active_agents += 1
                 logger.info(f"Started agent {agent_id}")
             except Exception as e:
                 self.error_handler.handle_error(
@@ -194,7 +316,8 @@ class Orchestrator:
                     reraise=False  # Continue with other agents
                 )
                 
-        active_agents = len([a for a in self.agents.values() if a.is_running])
+        self._agent_cycle = itertools.cycle(list(self.agents))
+        
         if active_agents == 0:
             self.error_handler.handle_error(
                 AgentStartupError("No agents could be started"),
@@ -228,6 +351,12 @@ class Orchestrator:
         # Shutdown executor
         self.executor.shutdown(wait=True)
         
+        # Apply any queued results and retire the flusher
+        self._stop_flusher()
+        
+        # Stop the evaluation loop; evaluations still running are abandoned
+        self._stop_eval_loop()
+        
         # Report final stats
         if self.stats["start_time"]:
             runtime = time.time() - self.stats["start_time"]
@@ -235,9 +364,16 @@ class Orchestrator:
             logger.info(f"Completed {self.stats['tasks_completed']} tasks")
             logger.info(f"Failed {self.stats['tasks_failed']} tasks")
             
+    def set_max_workers(self, max_workers: int):
+        """Resize the task worker pool at runtime"""
+        if max_workers < 1:
+            raise ConfigurationError("max_workers must be at least 1")
+        self.executor.set_max_workers(max_workers)
+        self.config["max_workers"] = max_workers
+        
     def submit_task(self, task: Task) -> Future[TaskResult]:
         """Submit task for execution with enhanced error handling"""
-        correlation_id = str(uuid.uuid4())
+        correlation_id = next_correlation_id()
         logger.info(f"Submitting task {task.task_id} with correlation_id: {correlation_id}")
         
         # Validate task
@@ -245,6 +381,7 @@ class Orchestrator:
             self._validate_task(task)
         except TaskValidationError as e:
             self.error_handler.handle_error(
+                "submit_task",
                 e,
                 context={"task": asdict(task)},
                 correlation_id=correlation_id,
@@ -267,14 +404,21 @@ class Orchestrator:
             agent = find_agent()
         except Exception as e:
             self.error_handler.handle_error(
+                "find_agent",
                 ResourceError(f"Failed to find available agent: {e}"),
                 context={"task_id": task.task_id},
                 correlation_id=correlation_id,
                 reraise=True
             )
             
-        # Submit task for execution
-        future = self.executor.submit(self._execute_task, task, agent, correlation_id)
+        # Submit task for execution; the agent returns to the idle pool when it finishes
+        agent_id = agent.agent_id
+        try:
+            future = self.executor.submit(self._execute_task, task, agent, correlation_id)
+        except Exception:
+            self._release_agent(agent_id)
+            raise
+        future.add_done_callback(lambda _: self._release_agent(agent_id))
         return future
         
     def _validate_task(self, task: Task):
@@ -289,19 +433,57 @@ class Orchestrator:
             raise TaskValidationError("Task timeout must be positive")
             
     def _find_available_agent(self) -> Optional[ClaudeAgent]:
-        """Find an available agent for task execution"""
-        # Simple round-robin for now
-        for agent in self.agents.values():
-            if agent.is_running and not agent.is_busy:
-                return agent
+        """Take the longest-idle agent, or None if none is idle
+        
+        With ``share_busy_agents`` configured, a busy agent is shared round-robin
+        instead of returning None.
+        """
+        with self._agent_lock:
+            while self._idle_agents:
+                agent_id = self._idle_agents.popleft()
+                self._idle_set.discard(agent_id)
+                agent = self.agents.get(agent_id)
+                # Stopped agents leave the pool here
+                if agent is not None and agent.is_running:
+                    self._busy_agents[agent_id] = 1
+                    return agent
+                    
+            if self._agent_cycle is not None and self.config.get("share_busy_agents", False):
+                for _ in range(len(self.agents)):
+                    agent_id = next(self._agent_cycle)
+                    agent = self.agents[agent_id]
+                    if agent.is_running:
+                        self._busy_agents[agent_id] = self._busy_agents.get(agent_id, 0) + 1
+                        return agent
         return None
         
+    def _release_agent(self, agent_id: str):
+        """Return an agent to the idle pool once its last in-flight task is done"""
+        with self._agent_lock:
+            remaining = self._busy_agents.get(agent_id, 1) - 1
+            if remaining > 0:
+                self._busy_agents[agent_id] = remaining
+                return
+            self._busy_agents.pop(agent_id, None)
+            agent = self.agents.get(agent_id)
+            if agent is not None and agent.is_running:
+                self._mark_idle(agent_id)
+                
+    def _mark_idle(self, agent_id: str):
+        """Queue an agent as idle unless it already is; caller holds _agent_lock"""
+        if agent_id not in self._idle_set:
+            self._idle_set.add(agent_id)
+            self._idle_agents.append(agent_id)
+        
     def _execute_task(self, task: Task, agent: ClaudeAgent, correlation_id: str) -> TaskResult:
         """Execute task on agent with enhanced error handling"""
         start_time = time.time()
+        # Bind once: these are read on every path, including the error handlers
+        task_id = getattr(task, 'task_id', 'unknown')
+        agent_id = getattr(agent, 'agent_id', 'unknown')
         
         try:
-            logger.info(f"Executing task {task.task_id} on agent {agent.agent_id}")
+            logger.info(f"Executing task {task_id} on agent {agent_id}")
             
             # Set task timeout if specified
             timeout = task.timeout or self.config.get("task_timeout", 300)
@@ -310,47 +492,41 @@ class Orchestrator:
             try:
                 result = agent.execute_task(task)
             except TimeoutError:
-                raise TaskTimeoutError(f"Task {task.task_id} timed out after {timeout}s")
+                raise TaskTimeoutError(f"Task {task_id} timed out after {timeout}s")
             except Exception as e:
                 raise TaskExecutionError(f"Task execution failed: {e}")
                 
             # Check result
             if result.status == "failed":
                 self.error_handler.handle_error(
-                    TaskExecutionError(f"Task {task.task_id} failed: {result.error}"),
+                    "execute_task",
+                    TaskExecutionError(f"Task {task_id} failed: {result.error}"),
                     context={
-                        "task_id": task.task_id,
-                        "agent_id": agent.agent_id,
+                        "task_id": task_id,
+                        "agent_id": agent_id,
                         "error": result.error
                     },
                     correlation_id=correlation_id,
                     reraise=False
                 )
-                self.stats["tasks_failed"] += 1
-            else:
-                self.stats["tasks_completed"] += 1
             
             self._update_stats(result)
-            self.results[task.task_id] = result
+            self._store_result(task_id, result)
             
             # Evaluate task result if evaluation is enabled
             if self.enable_evaluation and result.status == "success":
                 try:
                     # Schedule evaluation in background
-                    threading.Thread(
-                        target=self._run_evaluation,
-                        args=(task, result),
-                        daemon=True
-                    ).start()
+                    self._run_evaluation(task, result)
                 except Exception as e:
-                    logger.error(f"Failed to schedule evaluation for task {task.task_id}: {e}")
+                    logger.error(f"Failed to schedule evaluation for task {task_id}: {e}")
             
             return result
             
         except Exception as e:
             # Handle unexpected errors in task execution setup
             error_result = TaskResult(
-                task_id=getattr(task, 'task_id', 'unknown'),
+                task_id=task_id,
                 agent_id="orchestrator",
                 status="failed",
                 error=str(e),
@@ -359,61 +535,210 @@ class Orchestrator:
             )
             
             self.error_handler.handle_error(
+                "execute_task",
                 TaskExecutionError(f"Unexpected error executing task: {e}"),
                 context={
-                    "task_id": getattr(task, 'task_id', 'unknown'),
-                    "agent_id": getattr(agent, 'agent_id', 'unknown')
+                    "task_id": task_id,
+                    "agent_id": agent_id
                 },
                 correlation_id=correlation_id,
                 reraise=False
             )
             
-            self.stats["tasks_failed"] += 1
             self._update_stats(error_result)
-            self.results[getattr(task, 'task_id', 'unknown')] = error_result
+            self._store_result(task_id, error_result)
             
             return error_result
             
     def _update_stats(self, result: TaskResult):
         """Update execution statistics"""
-        self.stats["total_execution_time"] += result.execution_time
+        self.stats.record(result.status == "failed", result.execution_time)
         
+    # Most tasks an idle batch worker takes from another agent's queue at once
+    MAX_STEAL = 8
+    # Steal size until a victim has STEAL_HISTORY_MIN recorded steals; after
+    # that it follows 1.5x their median, so it grows while victims stay deep
+    DEFAULT_STEAL = 2
+    STEAL_HISTORY_MIN = 16
+    
     def submit_batch(self, tasks: List[Task]) -> List[Future[TaskResult]]:
-        """Submit multiple tasks for execution"""
-        futures = []
+        """Submit multiple tasks for execution
+        
+        Valid tasks are dealt round-robin onto one queue per claimed agent and
+        each agent drains its queue in a single executor job, stealing from the
+        other queues once its own is empty.
+        """
+        correlation_id = next_correlation_id()
+        futures: List[Future[TaskResult]] = []
+        pending: List[Tuple[Task, Future]] = []
         for task in tasks:
+            future: Future[TaskResult] = Future()
+            futures.append(future)
             try:
-                future = self.submit_task(task)
-                futures.append(future)
+                self._validate_task(task)
+            except TaskValidationError as e:
+                self.error_handler.handle_error(
+                    "submit_batch",
+                    e,
+                    context={"task": asdict(task)},
+                    correlation_id=correlation_id,
+                    reraise=False
+                )
+                future.set_exception(e)
+                continue
+            pending.append((task, future))
+            
+        if not pending:
+            return futures
+            
+        agents = self._claim_agents(len(pending))
+        if not agents:
+            error = ResourceError("Failed to find available agent: No available agents")
+            for task, future in pending:
+                logger.error(f"Failed to submit task {task.task_id}: {error}")
+                future.set_exception(error)
+            return futures
+            
+        logger.info(f"Submitting batch of {len(pending)} tasks to {len(agents)} agents "
+                    f"with correlation_id: {correlation_id}")
+        
+        queues = [deque(pending[i::len(agents)]) for i in range(len(agents))]
+        locks = [threading.Lock() for _ in agents]
+        agent_ids = [agent.agent_id for agent in agents]
+        submitted = 0
+        for index, agent in enumerate(agents):
+            try:
+                self.executor.submit(self._drain_batch_queue, index, agent, queues, locks,
+                                     agent_ids, correlation_id)
+                submitted += 1
             except Exception as e:
-                logger.error(f"Failed to submit task {task.task_id}: {e}")
-                # Create a failed future
-                failed_future: Future[TaskResult] = Future()
-                failed_future.set_exception(e)
-                futures.append(failed_future)
+                # The other agents' jobs steal this queue; fail the batch only if none run
+                self._release_agent(agent.agent_id)
+                error = e
+        if not submitted:
+            for task, future in pending:
+                logger.error(f"Failed to submit task {task.task_id}: {error}")
+                future.set_exception(error)
         return futures
         
+    def _claim_agents(self, count: int) -> List[ClaudeAgent]:
+        """Take up to ``count`` distinct agents, idle ones first"""
+        agents: List[ClaudeAgent] = []
+        claimed = set()
+        for _ in range(min(count, len(self.agents))):
+            agent = self._find_available_agent()
+            if agent is None:
+                break
+            if agent.agent_id in claimed:
+                # Every agent is already claimed; undo the extra share
+                self._release_agent(agent.agent_id)
+                break
+            claimed.add(agent.agent_id)
+            agents.append(agent)
+        return agents
+        
+    def _drain_batch_queue(self, index: int, agent: ClaudeAgent, queues: List[Deque[Tuple[Task, Future]]],
+                           locks: List[threading.Lock], agent_ids: List[str], correlation_id: str):
+        """Run an agent's share of a batch, then steal from the other queues until all are empty"""
+        own, own_lock = queues[index], locks[index]
+        try:
+            while True:
+                with own_lock:
+                    entry = own.pop() if own else None
+                if entry is None:
+                    stolen = self._steal_batch_entries(index, queues, locks, agent_ids)
+                    if stolen is None:
+                        # Nothing left to steal; returning hands the thread back
+                        # to the executor, where it parks until the next submit()
+                        return
+                    with own_lock:
+                        own.extend(stolen)
+                    continue
+                    
+                task, future = entry
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(self._execute_task(task, agent, correlation_id))
+                except Exception as e:
+                    future.set_exception(e)
+        finally:
+            self._release_agent(agent.agent_id)
+            
+    def _steal_batch_size(self, agent_id: str) -> int:
+        """Entries to steal from an agent's queue, adapted to its recent steals"""
+        with self._steal_history_lock:
+            history = list(self._steal_history.get(agent_id, ()))
+        if len(history) < self.STEAL_HISTORY_MIN:
+            return self.DEFAULT_STEAL
+        return max(1, min(self.MAX_STEAL, math.ceil(statistics.median(history) * 1.5)))
+        
+    def _steal_batch_entries(self, thief: int, queues: List[Deque[Tuple[Task, Future]]],
+                             locks: List[threading.Lock],
+                             agent_ids: List[str]) -> Optional[List[Tuple[Task, Future]]]:
+        """Take up to half of a random non-empty queue's oldest entries
+        
+        The count is also capped by _steal_batch_size for the victim's agent.
+        A victim emptied before its lock was taken is skipped for the next one.
+        
+        Returns None once every other queue is empty.
+        """
+        count = len(queues)
+        start = random.randrange(count)
+        for offset in range(count):
+            victim = (start + offset) % count
+            if victim == thief or not queues[victim]:
+                continue
+            size = self._steal_batch_size(agent_ids[victim])
+            with locks[victim]:
+                victim_queue = queues[victim]
+                take = min(size, (len(victim_queue) + 1) // 2)
+                stolen = [victim_queue.popleft() for _ in range(take)]
+            if stolen:
+                with self._steal_history_lock:
+                    self._steal_history[agent_ids[victim]].append(len(stolen))
+                return stolen
+        return None
+        
     def wait_for_batch(self, futures: List[Future[TaskResult]], timeout: Optional[float] = None) -> List[TaskResult]:
-        """Wait for batch of tasks to complete"""
-        results = []
-        for future in futures:
-            try:
-                result = future.result(timeout=timeout)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Task execution failed: {e}")
-                # Create error result
-                error_result = TaskResult(
-                    task_id="unknown",
-                    agent_id="orchestrator",
-                    status="failed",
-                    error=str(e),
-                    result={},
-                    execution_time=0.0
-                )
-                results.append(error_result)
+        """Wait for batch of tasks to complete
+        
+        Results keep the order of ``futures`` but are collected as tasks finish;
+        ``timeout`` is a single deadline for the whole batch.
+        """
+        results: List[Optional[TaskResult]] = [None] * len(futures)
+        positions: Dict[Future, List[int]] = {}
+        for index, future in enumerate(futures):
+            positions.setdefault(future, []).append(index)
+            
+        try:
+            for future in as_completed(positions, timeout=timeout):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Task execution failed: {e}")
+                    result = self._batch_error_result(str(e))
+                for index in positions[future]:
+                    results[index] = result
+        except FutureTimeoutError as e:
+            logger.error(f"Task execution failed: batch timed out after {timeout}s")
+            for index, result in enumerate(results):
+                if result is None:
+                    results[index] = self._batch_error_result(str(e) or "Task execution timeout")
         return results
         
+    @staticmethod
+    def _batch_error_result(error: str) -> TaskResult:
+        """Placeholder result for a batch future that raised or never finished"""
+        return TaskResult(
+            task_id="unknown",
+            agent_id="orchestrator",
+            status="failed",
+            error=error,
+            result={},
+            execution_time=0.0
+        )
+        
     def get_agent_status(self) -> Dict[str, Dict[str, Any]]:
         """Get status of all agents"""
         status = {}
@@ -427,10 +752,115 @@ class Orchestrator:
             }
         return status
         
+    @property
+    def results(self) -> Dict[str, TaskResult]:
+        """Stored task results by ID, including completions still queued"""
+        self._flush_completions()
+        return self._results
+        
+    @results.setter
+    def results(self, store: Dict[str, TaskResult]):
+        self._results = store
+        
+    def _store_result(self, task_id: str, result: TaskResult):
+        """Queue a task result for the flusher to store"""
+        self._completions.append((task_id, result))
+        self._completions_ready.set()
+        if self._flusher is None:
+            self._start_flusher()
+            
+    def _start_flusher(self):
+        """Start the single result-writer thread"""
+        with self._flush_lock:
+            if self._flusher is not None:
+                return
+            self._flusher_stopping = False
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="orchestrator-results", daemon=True
+            )
+            self._flusher.start()
+            
+    def _stop_flusher(self):
+        """Stop the flusher thread and apply whatever it left queued"""
+        flusher = self._flusher
+        if flusher is not None:
+            self._flusher_stopping = True
+            self._completions_ready.set()
+            flusher.join(timeout=5)
+            self._flusher = None
+        self._flush_completions()
+        
+    def _flush_loop(self):
+        """Block for completed results and write them to the result stores"""
+        ready = self._completions_ready
+        while not self._flusher_stopping:
+            ready.wait()
+            ready.clear()
+            with self._flush_lock:
+                self._drain_completions()
+                
+    def _flush_completions(self):
+        """Apply queued results now, so reads see every finished task"""
+        with self._flush_lock:
+            self._drain_completions()
+            
+    def _drain_completions(self):
+        """Apply everything currently queued; caller holds _flush_lock"""
+        # Entries only leave the deque here, under the lock, so a reader that
+        # flushes never misses a result the flusher has taken but not written
+        popleft = self._completions.popleft
+        while True:
+            try:
+                item = popleft()
+            except IndexError:
+                return
+            try:
+                self._apply_completion(item)
+            except Exception as e:
+                # One bad result must not stop the writer (or the reader flushing)
+                logger.error(f"Failed to store result for task {item[0]}: {e}")
+                
+    def _apply_completion(self, item: Tuple[str, TaskResult]):
+        """Write one queued result to the result store"""
+        task_id, result = item
+        self._results[task_id] = result
+        
     def get_task_result(self, task_id: str) -> Optional[TaskResult]:
         """Get task execution result by ID"""
         return self.results.get(task_id)
         
+    def get_task_result_json(self, task_id: str) -> Optional[bytes]:
+        """Get a task result as JSON bytes by ID"""
+        self._flush_completions()
+        return self._result_json(task_id)
+        
+    def get_results_json(self, task_ids: Optional[List[str]] = None) -> bytes:
+        """JSON array of stored results (all, or the given ids), reusing cached encodings"""
+        self._flush_completions()
+        if task_ids is None:
+            task_ids = list(self._results.keys())
+        encoded = [self._result_json(task_id) for task_id in task_ids]
+        return b"[" + b",".join(e for e in encoded if e is not None) + b"]"
+        
+    def _result_json(self, task_id: str) -> Optional[bytes]:
+        """Cached JSON encoding of a stored result, encoding it on a miss"""
+        result = self._results.get(task_id)
+        if result is None:
+            return None
+        with self._results_json_lock:
+            cached = self._results_json.get(task_id)
+            if cached is not None and cached[0] is result:
+                self._results_json.move_to_end(task_id)
+                return cached[1]
+                
+        encoded = _dumps(result.to_dict())
+        with self._results_json_lock:
+            self._results_json[task_id] = (result, encoded)
+            self._results_json.move_to_end(task_id)
+            if len(self._results_json) > self._results_json_max:
+                self._results_json.popitem(last=False)
+        return encoded
+        
     def get_statistics(self) -> Dict[str, Any]:
         """Get orchestrator execution statistics"""
         runtime = time.time() - self.stats["start_time"] if self.stats["start_time"] else 0
@@ -440,7 +870,7 @@ class Orchestrator:
             "tasks_failed": self.stats["tasks_failed"],
             "avg_execution_time": self._get_avg_execution_time(),
             "total_execution_time": self.stats["total_execution_time"],
-            "active_agents": len([a for a in self.agents.values() if a.is_running]),
+            "active_agents": sum(1 for a in self.agents.values() if a.is_running),
             "total_agents": len(self.agents)
         }
         
@@ -466,20 +896,62 @@ class Orchestrator:
             "recent_audit_events": len(self.security_manager.audit_logger.audit_log)
         }
     
-    def _run_evaluation(self, task: Task, result: TaskResult):
-        """Run evaluation in background thread"""
+    def _run_evaluation(self, task: Task, result: TaskResult) -> Future:
+        """Schedule evaluation on the shared evaluation loop"""
+        return asyncio.run_coroutine_threadsafe(
+            self._evaluate_in_background(task, result),
+            self._get_eval_loop()
+        )
+    
+    def _get_eval_loop(self) -> asyncio.AbstractEventLoop:
+        """Evaluation event loop, running on a daemon thread once created"""
+        with self._eval_loop_lock:
+            if self._eval_loop is None:
+                loop = asyncio.new_event_loop()
+                self._eval_thread = threading.Thread(target=self._run_eval_loop, args=(loop,),
+                                                     daemon=True, name="orchestrator-eval")
+                self._eval_thread.start()
+                self._eval_loop = loop
+            return self._eval_loop
+    
+    @staticmethod
+    def _run_eval_loop(loop: asyncio.AbstractEventLoop):
+        """Run the evaluation loop until stopped, then cancel what is left and close it"""
+        asyncio.set_event_loop(loop)
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            evaluation_result = loop.run_until_complete(
-                self._evaluate_task_result(task, result)
-            )
-            logger.info(f"Task {task.task_id} evaluated with score {evaluation_result.overall_score:.1f}")
-        except Exception as e:
-            logger.error(f"Failed to evaluate task {task.task_id}: {e}")
+            loop.run_forever()
         finally:
+            pending = asyncio.all_tasks(loop)
+            for pending_task in pending:
+                pending_task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
             loop.close()
     
+    def _stop_eval_loop(self):
+        """Stop the evaluation loop and wait for its thread to close it"""
+        with self._eval_loop_lock:
+            loop, thread = self._eval_loop, self._eval_thread
+            self._eval_loop = None
+            self._eval_thread = None
+            self._eval_semaphore = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+    
+    async def _evaluate_in_background(self, task: Task, result: TaskResult):
+        """Evaluate a task result, with at most max_concurrent_evaluations in flight"""
+        # Created on the loop thread: the loop is the only user
+        if self._eval_semaphore is None:
+            self._eval_semaphore = asyncio.Semaphore(self.config.get("max_concurrent_evaluations", 8))
+            
+        async with self._eval_semaphore:
+            try:
+                evaluation_result = await self._evaluate_task_result(task, result)
+                logger.info(f"Task {task.task_id} evaluated with score {evaluation_result.overall_score:.1f}")
+            except Exception as e:
+                logger.error(f"Failed to evaluate task {task.task_id}: {e}")
+    
     async def _evaluate_task_result(self, task: Task, result: TaskResult) -> EvaluationResult:
         """Evaluate task result using LLM-as-judge"""
         # Prepare task input data
@@ -516,16 +988,15 @@ class Orchestrator:
         trends = self.evaluator.analyze_quality_trends()
         
         return {
-            "evaluation_history": [asdict(eval_result) for eval_result in history],
-            "quality_trends": [asdict(trend) for trend in trends],
+            "evaluation_history": [eval_result.to_dict() for eval_result in history],
+            "quality_trends": [trend.to_dict() for trend in trends],
             "statistics": self.evaluator.get_statistics()
         }
     
     def _check_agent_health(self) -> bool:
         """エージェントヘルスチェック"""
         try:
-            active_agents = len([a for a in self.agents.values() if a.is_running])
-            return active_agents > 0
+            return any(a.is_running for a in self.agents.values())
         except Exception:
             return False
     
@@ -561,17 +1032,21 @@ class Orchestrator:
             return 0.0
         return self.stats["total_execution_time"] / total_tasks
 
-def create_task(task_type: str = "generic", description: str = "", files: List[str] = None, **kwargs) -> Task:
+# Ids for tasks created without one: unique per process, prefix + counter
+_TASK_ID_PREFIX = f"task_{os.getpid():x}-{int(time.time()):x}-"
+_task_counter = itertools.count()
+
+
+def create_task(task_type: str = "generic", description: str = "", files: List[str] = None,
+                task_id: str = None, **kwargs) -> Task:
     """Helper function to easily create tasks"""
-    if files is None:
-        files = []
+    if task_id is None:
+        task_id = _TASK_ID_PREFIX + format(next(_task_counter), 'x')
     
-    return Task(
-        task_type=task_type,
-        description=description,
-        files=files,
-        **kwargs
-    )
+    # Positional fields skip keyword matching; Task turns files=None into []
+    if kwargs:
+        return Task(task_id, task_type, description, files, **kwargs)
+    return Task(task_id, task_type, description, files)
 
 # Demo tasks for testing
 def create_demo_tasks() -> List[Task]:
@@ -617,6 +1092,12 @@ def main():
     parser.add_argument("--demo", action="store_true", help="Run with demo tasks")
     args = parser.parse_args()
     
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+    
     # Create orchestrator
     orchestrator = Orchestrator(config_path=args.config)
     
@@ -639,7 +1120,7 @@ def main():
                     
             # Print statistics
             stats = orchestrator.get_statistics()
-            logger.info(f"Statistics: {json.dumps(stats, indent=2)}")
+            logger.info(f"Statistics: {_format_json(stats)}")
         else:
             # Interactive mode
             logger.info("Orchestrator started. Press Ctrl+C to stop.")
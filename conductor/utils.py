@@ -11,10 +11,22 @@ import json
 import hashlib
 import subprocess
 import functools
+import itertools
+import random
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
 from typing import Any, Dict, List, Optional, Union, Callable
 from pathlib import Path
 import psutil
 
+# yaml.safe_load always uses the pure-Python loader; pick libyaml's when present
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class ConfigValidationError(Exception):
     """Configuration validation error"""
@@ -53,13 +65,14 @@ def load_yaml_config(config_file: str, defaults: Optional[Dict[str, Any]] = None
     """Load YAML configuration with defaults"""
     config = defaults.copy() if defaults else {}
     
-    if os.path.exists(config_file):
-        try:
-            with open(config_file, 'r') as f:
-                loaded_config = yaml.safe_load(f) or {}
-                config.update(loaded_config)
-        except yaml.YAMLError as e:
-            logging.warning(f"Error loading config file {config_file}: {e}")
+    try:
+        with open(config_file, 'rb') as f:
+            loaded_config = yaml.load(f, Loader=_YamlLoader) or {}
+            config.update(loaded_config)
+    except FileNotFoundError:
+        pass
+    except yaml.YAMLError as e:
+        logging.warning(f"Error loading config file {config_file}: {e}")
     
     return config
 
@@ -219,6 +232,16 @@ def generate_unique_id(prefix: str = "") -> str:
     return f"{prefix}{int(time.time())}_{random_part}"
 
 
+# Correlation IDs only need to be unique per process: prefix + counter
+_CORR_PREFIX = f"{os.getpid():x}-{int(time.time()):x}-"
+_corr_counter = itertools.count()
+
+
+def next_correlation_id() -> str:
+    """Process-unique correlation ID, cheaper than formatting a uuid4"""
+    return _CORR_PREFIX + format(next(_corr_counter), 'x')
+
+
 def validate_file_permissions(file_path: str, readable: bool = False, writable: bool = False) -> bool:
     """Validate file permissions"""
     if not os.path.exists(file_path):
@@ -334,6 +357,230 @@ def cached(ttl: int = 300):
     return decorator
 
 
+class RWLock:
+    """Readers-writer lock allowing concurrent readers and one exclusive writer
+    
+    Waiting writers block new readers so a steady stream of reads cannot
+    starve writes. The lock is not reentrant.
+    """
+    
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+    
+    @contextmanager
+    def read_lock(self):
+        """Hold the lock shared for the duration of the block"""
+        with self._condition:
+            while self._writer or self._writers_waiting:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+    
+    @contextmanager
+    def write_lock(self):
+        """Hold the lock exclusively for the duration of the block"""
+        with self._condition:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
+
+class WorkStealingExecutor(Executor):
+    """Thread pool in which every worker owns its own task deque
+    
+    submit() deals work round-robin across the worker deques, so there is no
+    single shared queue to contend on. A worker runs its newest task first and,
+    once its deque is empty, steals the oldest task of another worker.
+    Single-item deque operations are atomic, so neither path takes a lock.
+    Idle workers park without a timeout; each submit() unparks one of them,
+    so work dealt to a busy worker is stolen right away.
+    The pool can be resized at runtime with set_max_workers().
+    """
+    
+    def __init__(self, max_workers: int, thread_name_prefix: str = "worker"):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._queues: List[deque] = []
+        self._wakeups: List[threading.Event] = []
+        self._threads: List[threading.Thread] = []
+        # Indices of parked workers, oldest first; the set keeps each listed once.
+        # Both are only touched under _park_lock
+        self._parked: deque = deque()
+        self._parked_set: set = set()
+        self._park_lock = threading.Lock()
+        self._next_queue = itertools.count()
+        self._start_lock = threading.Lock()
+        self._shutdown = False
+    
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        """Queue fn(*args, **kwargs) on the next worker's deque"""
+        if self._shutdown:
+            raise RuntimeError("cannot schedule new futures after shutdown")
+        if not self._threads:
+            self._start_workers()
+        
+        future = Future()
+        index = next(self._next_queue) % self._max_workers
+        self._queues[index].append((future, fn, args, kwargs))
+        self._wakeups[index].set()
+        # The owner may be busy; wake an idle worker too so it can steal the item
+        with self._park_lock:
+            idle = self._parked.popleft() if self._parked else None
+            self._parked_set.discard(idle)
+        if idle is not None and idle != index:
+            self._wakeups[idle].set()
+        return future
+    
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """Stop accepting work; workers exit once every deque is empty"""
+        self._shutdown = True
+        if cancel_futures:
+            for work_queue in self._queues:
+                while work_queue:
+                    try:
+                        future, _, _, _ = work_queue.popleft()
+                    except IndexError:
+                        break
+                    future.cancel()
+        for wakeup in self._wakeups:
+            wakeup.set()
+        if wait:
+            for thread in list(self._threads):
+                if thread is not None:
+                    thread.join()
+    
+    def set_max_workers(self, max_workers: int):
+        """Grow or shrink the pool; surplus workers exit once their deques drain"""
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        with self._start_lock:
+            if self._threads:
+                for index in range(max_workers):
+                    if index == len(self._queues):
+                        self._queues.append(deque())
+                        self._wakeups.append(threading.Event())
+                        self._threads.append(None)
+                    if self._threads[index] is None:
+                        self._threads[index] = self._spawn(index)
+            # Raised only after the new deques exist, so submit() never deals past them
+            self._max_workers = max_workers
+        for wakeup in self._wakeups:
+            wakeup.set()
+    
+    def _start_workers(self):
+        """Start the worker threads on first use"""
+        with self._start_lock:
+            if self._threads:
+                return
+            # Publish the deques before the threads that use them
+            self._queues = [deque() for _ in range(self._max_workers)]
+            self._wakeups = [threading.Event() for _ in range(self._max_workers)]
+            self._threads = [self._spawn(index) for index in range(self._max_workers)]
+    
+    def _spawn(self, index: int) -> threading.Thread:
+        """Start the worker thread for deque index"""
+        thread = threading.Thread(target=self._worker, args=(index,), daemon=True,
+                                  name=f"{self._thread_name_prefix}-{index}")
+        thread.start()
+        return thread
+    
+    def _retire(self, index: int) -> bool:
+        """Release a surplus worker's slot if its deque is empty"""
+        with self._start_lock:
+            if index < self._max_workers or self._queues[index]:
+                return False
+            self._threads[index] = None
+            return True
+    
+    def _get_or_steal(self, index: int, steal: bool = True) -> Optional[tuple]:
+        """Newest item of the worker's own deque, else the oldest item of another"""
+        try:
+            return self._queues[index].pop()
+        except IndexError:
+            if not steal:
+                return None
+        
+        queues = self._queues
+        start = random.randrange(len(queues))
+        for offset in range(len(queues)):
+            victim = (start + offset) % len(queues)
+            if victim == index:
+                continue
+            try:
+                return queues[victim].popleft()
+            except IndexError:
+                continue
+        return None
+    
+    def _park(self, index: int):
+        """List the worker as idle so the next submit() wakes it"""
+        with self._park_lock:
+            if index not in self._parked_set:
+                self._parked_set.add(index)
+                self._parked.append(index)
+    
+    def _unpark(self, index: int):
+        """Take the worker off the idle list if it is still on it"""
+        with self._park_lock:
+            if index in self._parked_set:
+                self._parked_set.discard(index)
+                self._parked.remove(index)
+    
+    def _worker(self, index: int):
+        """Run queued work until shutdown leaves every deque empty"""
+        wakeup = self._wakeups[index]
+        while True:
+            # Workers beyond max_workers finish their own deque, then exit
+            surplus = index >= self._max_workers
+            item = self._get_or_steal(index, steal=not surplus)
+            if item is None:
+                if surplus and self._retire(index):
+                    return
+                if self._shutdown:
+                    return
+                # Park, then look once more: a submit(), shutdown() or resize
+                # racing with the first look either shows up in this one or
+                # finds the worker parked and sets its wakeup
+                wakeup.clear()
+                self._park(index)
+                item = self._get_or_steal(index, steal=not surplus)
+                if (item is None and not self._shutdown
+                        and (index >= self._max_workers) == surplus):
+                    wakeup.wait()
+                self._unpark(index)
+                if item is None:
+                    continue
+            
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+
 def get_file_hash(file_path: str) -> str:
     """Get MD5 hash of file content"""
     hasher = hashlib.md5()
@@ -9,9 +9,12 @@ import socket
 import threading
 import queue
 import os
+import fcntl
+import struct
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, asdict
-from typing import Dict, Any, Optional, Callable, List
+from typing import Dict, Any, Optional, Callable, List, Union
 from enum import Enum
 import logging
 
@@ -49,6 +52,79 @@ class AgentMessage:
         data['message_type'] = MessageType(data['message_type'])
         return cls(**data)
 
+# SOCK_SEQPACKET keeps message boundaries, so one recv() is one message;
+# platforms without it fall back to SOCK_STREAM
+SOCKET_TYPE = getattr(socket, 'SOCK_SEQPACKET', socket.SOCK_STREAM)
+MAX_MESSAGE_SIZE = 65536
+# Larger kernel buffers let bursts of control messages queue without blocking the sender
+SOCKET_BUFFER_SIZE = 1 << 20
+
+# Batch packets: a marker byte, then length-prefixed JSON frames
+_BATCH_MARKER = b'\x1e'
+_FRAME_HEADER = struct.Struct('!I')
+
+# struct ucred {pid_t pid; uid_t uid; gid_t gid;}
+_UCRED = struct.Struct('3i')
+
+
+def default_socket_dir() -> str:
+    """Per-user runtime directory for sockets, /tmp when unavailable"""
+    return os.environ.get('XDG_RUNTIME_DIR') or '/tmp'
+
+
+def default_broker_socket_path() -> str:
+    """Broker socket address: Linux abstract namespace, else a file in the socket dir
+
+    Abstract sockets have no filesystem entry to stat, lock or unlink, and any
+    local user can bind the name first. Both ends therefore check the peer's
+    credentials: the server on accept, the client on connect.
+    """
+    if sys.platform.startswith('linux'):
+        return f"\0claude_orchestrator_{os.getuid()}"
+    return os.path.join(default_socket_dir(), "claude_orchestrator.sock")
+
+
+def is_abstract_socket_path(socket_path: str) -> bool:
+    """Whether the address is in the Linux abstract namespace"""
+    return socket_path.startswith('\0')
+
+
+def tune_socket(sock: socket.socket):
+    """Raise the send/receive buffers, keeping the defaults if the kernel refuses"""
+    for option in (socket.SO_SNDBUF, socket.SO_RCVBUF):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, option, SOCKET_BUFFER_SIZE)
+        except OSError:
+            pass
+
+
+def decode_packet(data: bytes) -> List[AgentMessage]:
+    """Messages in a received packet: a single JSON message or a batch"""
+    if not data.startswith(_BATCH_MARKER):
+        return [AgentMessage.from_json(data.decode())]
+        
+    messages = []
+    offset = len(_BATCH_MARKER)
+    while offset < len(data):
+        length, = _FRAME_HEADER.unpack_from(data, offset)
+        offset += _FRAME_HEADER.size
+        messages.append(AgentMessage.from_json(data[offset:offset + length].decode()))
+        offset += length
+    return messages
+
+
+def get_peer_credentials(sock: socket.socket) -> Optional[tuple]:
+    """(pid, uid, gid) of a connected Unix socket peer, None if unsupported"""
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return None
+    return _UCRED.unpack(sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _UCRED.size))
+
+
+def is_trusted_peer(credentials: Optional[tuple]) -> bool:
+    """Whether the peer runs as the current user or root (unknown peers pass)"""
+    return credentials is None or credentials[1] in (os.getuid(), 0)
+
+
 class UnixSocketChannel:
     """Communication channel using Unix sockets"""
     
@@ -67,12 +143,21 @@ class UnixSocketChannel:
             
     def _start_server(self):
         """Start server socket"""
-        if os.path.exists(self.socket_path):
-            os.unlink(self.socket_path)
-            
-        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        self.socket.bind(self.socket_path)
-        self.socket.listen(5)
+        self.socket = socket.socket(socket.AF_UNIX, SOCKET_TYPE)
+        tune_socket(self.socket)
+        
+        if is_abstract_socket_path(self.socket_path):
+            # The kernel rejects a second bind, so no lock file is needed
+            self.socket.bind(self.socket_path)
+        else:
+            # Serialize unlink + bind so two servers cannot race on the path
+            with open(f"{self.socket_path}.lock", 'w') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                if os.path.exists(self.socket_path):
+                    os.unlink(self.socket_path)
+                self.socket.bind(self.socket_path)
+                
+        self.socket.listen(128)
         self.is_running = True
         
         threading.Thread(target=self._accept_connections, daemon=True).start()
@@ -83,6 +168,15 @@ class UnixSocketChannel:
         while self.is_running:
             try:
                 client_socket, _ = self.socket.accept()
+                
+                # Kernel-verified peer identity instead of an app-level handshake
+                credentials = get_peer_credentials(client_socket)
+                if not is_trusted_peer(credentials):
+                    logger.warning(f"Rejected connection from pid {credentials[0]} uid {credentials[1]}")
+                    client_socket.close()
+                    continue
+                    
+                tune_socket(client_socket)
                 self.clients.append(client_socket)
                 threading.Thread(
                     target=self._handle_client,
@@ -97,16 +191,16 @@ class UnixSocketChannel:
         """Handle messages from client"""
         while self.is_running:
             try:
-                data = client_socket.recv(4096)
+                data = client_socket.recv(MAX_MESSAGE_SIZE)
                 if not data:
                     break
                     
-                message = AgentMessage.from_json(data.decode())
-                self.receive_queue.put(message)
-                
-                # Broadcast processing
-                if message.receiver_id == "broadcast":
-                    self._broadcast_message(message, exclude_socket=client_socket)
+                for message in decode_packet(data):
+                    self.receive_queue.put(message)
+                    
+                    # Broadcast processing
+                    if message.receiver_id == "broadcast":
+                        self._broadcast_message(message, exclude_socket=client_socket)
                     
             except Exception as e:
                 logger.error(f"Client handling error: {e}")
@@ -127,8 +221,17 @@ class UnixSocketChannel:
                     
     def _connect_client(self):
         """Connect as client"""
-        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket = socket.socket(socket.AF_UNIX, SOCKET_TYPE)
+        tune_socket(self.socket)
         self.socket.connect(self.socket_path)
+        
+        # Refuse a server squatting on the address under another user
+        credentials = get_peer_credentials(self.socket)
+        if not is_trusted_peer(credentials):
+            self.socket.close()
+            raise PermissionError(
+                f"Socket {self.socket_path!r} is served by uid {credentials[1]}, not the current user"
+            )
         self.is_running = True
         
         threading.Thread(target=self._receive_messages, daemon=True).start()
@@ -138,12 +241,12 @@ class UnixSocketChannel:
         """Receive messages"""
         while self.is_running:
             try:
-                data = self.socket.recv(4096)
+                data = self.socket.recv(MAX_MESSAGE_SIZE)
                 if not data:
                     break
                     
-                message = AgentMessage.from_json(data.decode())
-                self.receive_queue.put(message)
+                for message in decode_packet(data):
+                    self.receive_queue.put(message)
                 
             except Exception as e:
                 if self.is_running:
@@ -157,6 +260,33 @@ class UnixSocketChannel:
         data = message.to_json().encode()
         self.socket.sendall(data)
         
+    def send_batch(self, messages: List[AgentMessage]):
+        """Send several messages with one sendmsg() per packet (gather I/O, no copy)"""
+        if not self.socket:
+            raise Exception("Socket not connected")
+            
+        # Stream sockets have no packet boundaries to frame a batch in
+        if SOCKET_TYPE != getattr(socket, 'SOCK_SEQPACKET', None):
+            for message in messages:
+                self.send(message)
+            return
+            
+        buffers = [_BATCH_MARKER]
+        size = len(_BATCH_MARKER)
+        for message in messages:
+            payload = message.to_json().encode()
+            frame_size = _FRAME_HEADER.size + len(payload)
+            # Start a new packet when this one would exceed the receive size
+            if len(buffers) > 1 and size + frame_size > MAX_MESSAGE_SIZE:
+                self.socket.sendmsg(buffers)
+                buffers = [_BATCH_MARKER]
+                size = len(_BATCH_MARKER)
+            buffers += (_FRAME_HEADER.pack(len(payload)), payload)
+            size += frame_size
+            
+        if len(buffers) > 1:
+            self.socket.sendmsg(buffers)
+            
     def receive(self, timeout: Optional[float] = None) -> Optional[AgentMessage]:
         """Receive message"""
         try:
@@ -169,13 +299,76 @@ class UnixSocketChannel:
         self.is_running = False
         if self.socket:
             self.socket.close()
-        if self.is_server and os.path.exists(self.socket_path):
+        if (self.is_server and not is_abstract_socket_path(self.socket_path)
+                and os.path.exists(self.socket_path)):
             os.unlink(self.socket_path)
 
+class BatchingChannel:
+    """Coalesces outgoing messages on a UnixSocketChannel into batch packets
+    
+    Messages are flushed when max_batch are pending or linger seconds after the
+    first one, so bursts of small control messages cost one syscall per batch.
+    """
+    
+    def __init__(self, channel: UnixSocketChannel, max_batch: int = 32, linger: float = 0.000256):
+        self.channel = channel
+        self.max_batch = max_batch
+        self.linger = linger
+        self._pending: List[AgentMessage] = []
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        
+        threading.Thread(target=self._flush_loop, daemon=True).start()
+        
+    def send(self, message: AgentMessage):
+        """Queue message for the next batch"""
+        with self._lock:
+            self._pending.append(message)
+            full = len(self._pending) >= self.max_batch
+            
+        if full:
+            self.flush()
+        else:
+            self._wakeup.set()
+            
+    def flush(self):
+        """Send all pending messages now"""
+        # Swap and send under one lock so batches leave in order
+        with self._send_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+            if pending:
+                self.channel.send_batch(pending)
+                
+    def _flush_loop(self):
+        """Flush pending messages once the linger time has passed"""
+        while not self._closed:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            time.sleep(self.linger)
+            try:
+                self.flush()
+            except Exception as e:
+                if not self._closed:
+                    logger.error(f"Batch send error: {e}")
+                    
+    def receive(self, timeout: Optional[float] = None) -> Optional[AgentMessage]:
+        """Receive message"""
+        return self.channel.receive(timeout)
+        
+    def close(self):
+        """Flush pending messages and close the channel"""
+        self._closed = True
+        self._wakeup.set()
+        self.flush()
+        self.channel.close()
+
 class Agent2AgentProtocol:
     """Agent-to-Agent protocol implementation"""
     
-    def __init__(self, agent_id: str, channel: UnixSocketChannel):
+    def __init__(self, agent_id: str, channel: Union[UnixSocketChannel, BatchingChannel]):
         self.agent_id = agent_id
         self.channel = channel
         self.pending_requests: Dict[str, AgentMessage] = {}
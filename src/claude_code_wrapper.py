@@ -10,7 +10,7 @@ import time
 import json
 import os
 import signal
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
 import logging
 
@@ -26,6 +26,7 @@ class AgentConfig:
     podman_image: str = "ubuntu:22.04"
     memory_limit: str = "2g"
     cpu_limit: str = "1.0"
+    capabilities: List[str] = field(default_factory=list)  # 優先して割り当てるタスク種別
     
 @dataclass
 class CommandResult:
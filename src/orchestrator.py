@@ -6,29 +6,53 @@ Claude Code Multi-Agent Orchestrator
 import os
 import time
 import json
+import asyncio
 import uuid
+import hashlib
+import sched
+import random
 import threading
 import yaml
 import subprocess
 from typing import Dict, List, Optional, Any, Callable
-from dataclasses import dataclass, field, asdict
-from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass, field, asdict, replace
+from collections import deque, defaultdict, OrderedDict
+from concurrent.futures import (
+    Executor, Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+)
 import logging
 from datetime import datetime
 
+# libyaml があればCローダーで設定を読む（安全性は SafeLoader と同じ）
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# orjson があればステータス表示の JSON 化に使う
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _STATUS_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # 前述のモジュールをインポート
 from .claude_code_wrapper import ClaudeCodeWrapper, AgentConfig
 from .agent_communication import (
-    AgentMessage, MessageType, UnixSocketChannel,
-    Agent2AgentProtocol
+    AgentMessage, MessageType, UnixSocketChannel, BatchingChannel,
+    Agent2AgentProtocol, default_broker_socket_path
 )
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+
+def format_status_json(data: Any) -> str:
+    """ステータスや統計を表示用のインデント付き JSON 文字列にする"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=_STATUS_JSON_OPTIONS).decode()
+    return json.dumps(data, indent=2, default=str)
+
 @dataclass
 class Task:
     """タスク定義"""
@@ -41,6 +65,21 @@ class Task:
     priority: int = 5  # 1-10, 10が最高
     timeout: float = 300.0  # 5分
     
+    @classmethod
+    def from_subtask(cls, parent: 'Task', index: int, definition: Any) -> 'Task':
+        """親タスクのサブタスク定義（dict または Task）からタスクを生成"""
+        if isinstance(definition, Task):
+            return definition
+        get = definition.get
+        return cls(
+            task_id=f"{parent.task_id}_sub{index}",
+            task_type=get("type", parent.task_type),
+            description=get("description", ""),
+            files=get("files", []),
+            priority=parent.priority,
+            timeout=get("timeout", parent.timeout)
+        )
+    
 @dataclass
 class TaskResult:
     """タスク実行結果"""
@@ -63,13 +102,14 @@ class ClaudeAgent:
         self.config = AgentConfig(
             agent_id=agent_id,
             container_name=f"claude_agent_{agent_id}",
-            work_dir=f"/tmp/claude_workspace_{agent_id}"
+            work_dir=f"/tmp/claude_workspace_{agent_id}",
+            capabilities=orchestrator.config.get("agent_capabilities", {}).get(agent_id, [])
         )
         
         # コンポーネント
         self.wrapper: Optional[ClaudeCodeWrapper] = None
         self.protocol: Optional[Agent2AgentProtocol] = None
-        self.channel: Optional[UnixSocketChannel] = None
+        self.channel: Optional[BatchingChannel] = None
         
         # 状態
         self.is_running = False
@@ -88,9 +128,9 @@ class ClaudeAgent:
             self.wrapper = ClaudeCodeWrapper(self.config)
             self.wrapper.setup_container()
             
-            # 通信チャネルの初期化
+            # 通信チャネルの初期化（制御メッセージはバッチにまとめて送信）
             socket_path = f"/tmp/claude_agent_{self.agent_id}.sock"
-            self.channel = UnixSocketChannel(socket_path, is_server=False)
+            self.channel = BatchingChannel(UnixSocketChannel(socket_path, is_server=False))
             self.protocol = Agent2AgentProtocol(self.agent_id, self.channel)
             
             # メッセージハンドラー登録
@@ -103,12 +143,9 @@ class ClaudeAgent:
             self.wrapper.start_claude_code(headless=True)
             self.is_running = True
             
-            # メッセージ処理スレッド
+            # メッセージ処理スレッド（ヘルスチェックはオーケストレーターのスケジューラーで実行）
             threading.Thread(target=self._process_messages, daemon=True).start()
             
-            # ヘルスチェックスレッド
-            threading.Thread(target=self._health_check_loop, daemon=True).start()
-            
             logger.info(f"Agent {self.agent_id} started successfully")
             
         except Exception as e:
@@ -314,28 +351,28 @@ class ClaudeAgent:
             except Exception as e:
                 logger.error(f"Message processing error: {e}")
                 
-    def _health_check_loop(self):
-        """定期的なヘルスチェック"""
-        while self.is_running:
-            time.sleep(30)  # 30秒ごと
+    # ヘルスチェックの間隔（秒）
+    HEALTH_CHECK_INTERVAL = 30
+    
+    def _health_check(self):
+        """ヘルスチェックを1回実行"""
+        try:
+            # 簡単なコマンドを送信してレスポンスを確認
+            self.wrapper.send_command("echo health_check")
+            outputs = self.wrapper.read_output(timeout=5.0)
             
-            try:
-                # 簡単なコマンドを送信してレスポンスを確認
-                self.wrapper.send_command("echo health_check")
-                outputs = self.wrapper.read_output(timeout=5.0)
-                
-                if outputs:
-                    self.health_check_failed = 0
-                else:
-                    self.health_check_failed += 1
-                    
-                if self.health_check_failed > 3:
-                    logger.error(f"Agent {self.agent_id} health check failed")
-                    # TODO: 自動復旧処理
-                    
-            except Exception as e:
-                logger.error(f"Health check error: {e}")
+            if outputs:
+                self.health_check_failed = 0
+            else:
                 self.health_check_failed += 1
+                
+            if self.health_check_failed > 3:
+                logger.error(f"Agent {self.agent_id} health check failed")
+                # TODO: 自動復旧処理
+                
+        except Exception as e:
+            logger.error(f"Health check error: {e}")
+            self.health_check_failed += 1
 
 class Orchestrator:
     """マルチエージェントオーケストレーター"""
@@ -346,21 +383,59 @@ class Orchestrator:
         
         # コンポーネント
         self.agents: Dict[str, ClaudeAgent] = {}
-        self.executor = ThreadPoolExecutor(
-            max_workers=self.config.get("max_workers", 10)
-        )
-        self.task_queue: List[Task] = []
-        self.results: Dict[str, TaskResult] = {}
+        
+        # エージェントごとのタスクキューとワーカースレッド（共有キューの競合を避ける）
+        self._agent_queues: Dict[str, deque] = {}
+        self._agent_signals: Dict[str, threading.Semaphore] = {}
+        self._workers_running = False
+        
+        # 空いているエージェント（agent_id -> agent、挿入順）。同じエージェントの二重割り当てを防ぐ
+        self._idle_agents: Dict[str, ClaudeAgent] = {}
+        self._idle_condition = threading.Condition()
+        # asyncio 版でエージェントを待つ (ループ, Future)。_idle_condition 保持中に操作
+        self._agent_waiters: deque = deque()
+        
+        # タスク種別 -> その能力を持つエージェント（起動時に構築）と巡回位置
+        self._agents_by_capability: Dict[str, List[ClaudeAgent]] = defaultdict(list)
+        self._capability_cursor: Dict[str, int] = defaultdict(int)
+        # 待機中タスク: 優先度ごとのFIFOバケット。エントリは [bucket, task]、ディスパッチ済みは task を None に
+        self._task_buckets: List[deque] = [deque() for _ in range(self.PRIORITY_LEVELS)]
+        self._task_queue_lock = threading.Lock()
+        # 結果はLRUで上限件数まで保持（長時間稼働でもメモリが増え続けない）
+        self.results: "OrderedDict[str, TaskResult]" = OrderedDict()
+        self._results_max = self.config.get("results_max_entries", 10000)
+        self._results_lock = threading.Lock()
         
         # 統計情報
         self.stats = {
             "tasks_completed": 0,
             "tasks_failed": 0,
-            "total_execution_time": 0.0
+            "total_execution_time": 0.0,
+            "cache_hits": 0,
+            "cache_misses": 0
         }
+        self._stats_lock = threading.Lock()
+        
+        # 定期処理は全て1つのスケジューラースレッドで実行（処理ごとにスレッドを持たない）
+        self._scheduler = sched.scheduler(time.monotonic, time.sleep)
+        # ヘルスチェックは小さなプールで実行（応答しないエージェントが他のチェックを止めない）
+        self._health_check_executor = ThreadPoolExecutor(
+            max_workers=self.config.get("health_check_workers", 4),
+            thread_name_prefix="health_check"
+        )
+        self._last_stats_log = time.monotonic()
+        self._avg_exec = 0.0  # _update_stats で更新する平均実行時間
         
-        # 通信用ソケット
-        self.broker_socket_path = "/tmp/claude_orchestrator.sock"
+        # 成功結果のキャッシュ: タスク内容のSHA-256 -> (保存時刻, 結果)、LRU + TTL（result_cache_ttl > 0 の時のみ）
+        self._result_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        
+        # 実行中タスク: キャッシュキー -> 結果Future（同一タスクの同時実行をまとめる）
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # 通信用ソケット（Linuxでは抽象名前空間、それ以外はユーザー専用ディレクトリ）
+        self.broker_socket_path = default_broker_socket_path()
         self.broker_channel: Optional[UnixSocketChannel] = None
         
     def _load_config(self, config_path: Optional[str]) -> Dict[str, Any]:
@@ -369,13 +444,22 @@ class Orchestrator:
             "num_agents": 3,
             "max_workers": 10,
             "task_timeout": 300,
-            "log_level": "INFO"
+            "log_level": "INFO",
+            "result_cache_size": 1000,
+            "results_max_entries": 10000,
+            # 結果キャッシュの有効期限（秒）。0 で無効（既定）。LLM の出力は毎回異なるため、
+            # 同一タスクに前回の結果を返してよい場合のみ設定ファイルで正の値を指定する
+            "result_cache_ttl": 0
         }
         
-        if config_path and os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                user_config = yaml.safe_load(f)
+        if config_path:
+            # 存在確認と読み込みを1回の open で（libyaml はバイト列の方が速い）
+            try:
+                with open(config_path, 'rb') as f:
+                    user_config = yaml.load(f, Loader=_YamlLoader)
                 default_config.update(user_config)
+            except FileNotFoundError:
+                pass
                 
         return default_config
         
@@ -397,6 +481,14 @@ class Orchestrator:
             try:
                 agent.start()
                 self.agents[agent_id] = agent
+                self._start_agent_worker(agent)
+                self._register_capabilities(agent)
+                self._release_agent(agent)
+                self._schedule_periodic(
+                    agent.HEALTH_CHECK_INTERVAL, agent._health_check,
+                    lambda agent=agent: agent.is_running,
+                    executor=self._health_check_executor
+                )
                 logger.info(f"Agent {agent_id} added to orchestrator")
                 
             except Exception as e:
@@ -404,8 +496,7 @@ class Orchestrator:
                 
         logger.info(f"Orchestrator started with {len(self.agents)} active agents")
         
-        # 統計情報スレッド
-        threading.Thread(target=self._stats_reporter, daemon=True).start()
+        threading.Thread(target=self._scheduler.run, daemon=True).start()
         
     def stop(self):
         """オーケストレーターを停止"""
@@ -422,22 +513,166 @@ class Orchestrator:
         if self.broker_channel:
             self.broker_channel.close()
             
-        # Executorをシャットダウン
-        self.executor.shutdown(wait=True)
+        # ワーカーを停止し、未実行のタスクをキャンセル
+        self._stop_agent_workers()
+        
+        # 予定済みの定期処理を取り消す（スケジューラースレッドは空になると終了）
+        for event in self._scheduler.queue:
+            try:
+                self._scheduler.cancel(event)
+            except ValueError:
+                pass
+        self._health_check_executor.shutdown(wait=False, cancel_futures=True)
         
         # 統計情報を出力
         self._print_final_stats()
         
         logger.info("Orchestrator stopped")
         
+    # 優先度の段階数（0-10、範囲外は端に丸める）
+    PRIORITY_LEVELS = 11
+    
+    @property
+    def task_queue(self) -> List[Task]:
+        """待機中タスクを優先度順に並べたリスト（読み取り専用スナップショット）"""
+        with self._task_queue_lock:
+            return [entry[1] for bucket in reversed(self._task_buckets) for entry in bucket
+                    if entry[1] is not None]
+        
+    def _enqueue_task(self, task: Task) -> list:
+        """優先度バケットに追加: O(1)、比較なし"""
+        bucket = self._task_buckets[min(max(task.priority, 0), self.PRIORITY_LEVELS - 1)]
+        entry = [bucket, task]
+        with self._task_queue_lock:
+            bucket.append(entry)
+        return entry
+        
+    def _dequeue_task(self, entry: list):
+        """ディスパッチ済みにし、バケット先頭の済みエントリを取り除く"""
+        bucket = entry[0]
+        with self._task_queue_lock:
+            entry[1] = None
+            while bucket and bucket[0][1] is None:
+                bucket.popleft()
+                
+        # 次の先頭タスクが、残っているアイドルエージェントを取れるよう起こす
+        with self._idle_condition:
+            if self._idle_agents:
+                self._notify_agent_waiters()
+                
+    def _is_next_task(self, entry: list) -> bool:
+        """最も高い優先度の空でないバケットの先頭が entry か（先頭は常に未ディスパッチ）"""
+        with self._task_queue_lock:
+            for bucket in reversed(self._task_buckets):
+                if bucket:
+                    return bucket[0] is entry
+        return False
+        
+    @staticmethod
+    def _task_cache_key(task: Task) -> str:
+        """タスク種別・説明・ファイル（パス、更新時刻、サイズ）からキャッシュキーを生成"""
+        file_states = []
+        for path in sorted(task.files):
+            try:
+                stat = os.stat(path)
+                file_states.append((path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                file_states.append((path, None, None))
+        return hashlib.sha256(
+            f"{task.task_type}|{task.description}|{file_states}".encode()
+        ).hexdigest()
+        
+    def _get_cached_result(self, key: str) -> Optional[TaskResult]:
+        """有効期限内のキャッシュ結果を取得（キャッシュ無効時は常に None）"""
+        if self.config["result_cache_ttl"] <= 0:
+            return None
+        with self._result_cache_lock:
+            entry = self._result_cache.get(key)
+            if entry is not None:
+                cached_at, result = entry
+                if time.monotonic() - cached_at > self.config["result_cache_ttl"]:
+                    del self._result_cache[key]
+                    result = None
+                else:
+                    self._result_cache.move_to_end(key)
+            else:
+                result = None
+                
+        # self.stats は _stats_lock で保護（キャッシュのロックとは別）
+        with self._stats_lock:
+            self.stats["cache_hits" if result is not None else "cache_misses"] += 1
+        return result
+            
+    def _cache_result(self, key: str, result: TaskResult):
+        """成功結果をキャッシュ（上限を超えたら最も古いものを削除）"""
+        if self.config["result_cache_ttl"] <= 0:
+            return
+        with self._result_cache_lock:
+            self._result_cache[key] = (time.monotonic(), result)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.config["result_cache_size"]:
+                self._result_cache.popitem(last=False)
+        
     def execute_task(self, task: Task) -> TaskResult:
         """単一タスクを実行"""
-        # 優先度キューに追加（簡易実装）
-        self.task_queue.append(task)
-        self.task_queue.sort(key=lambda t: t.priority, reverse=True)
+        # 同一内容のタスクの結果がキャッシュにあれば再実行しない
+        cache_key = self._task_cache_key(task)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            result = replace(cached, task_id=task.task_id, timestamp=time.time())
+            self._store_result(task.task_id, result)
+            return result
+            
+        # 同一タスクが実行中なら、再実行せずその結果を待つ（single-flight）
+        with self._inflight_lock:
+            flight = self._inflight.get(cache_key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._inflight[cache_key] = Future()
+                
+        if not is_leader:
+            try:
+                shared = flight.result(timeout=task.timeout)
+            except FutureTimeoutError:
+                shared = TaskResult(
+                    task_id=task.task_id,
+                    agent_id="none",
+                    status="timeout",
+                    result={},
+                    error="Task execution timeout"
+                )
+            result = replace(shared, task_id=task.task_id)
+            self._store_result(task.task_id, result)
+            return result
+            
+        try:
+            result = self._run_task(task)
+            
+            self._update_stats(result)
+            self._store_result(task.task_id, result)
+            if result.status == "success":
+                self._cache_result(cache_key, result)
+            flight.set_result(result)
+            
+            return result
+            
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+            
+        finally:
+            # キャッシュ登録後に外すので、後続の呼び出しはキャッシュに当たる
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+        
+    def _run_task(self, task: Task) -> TaskResult:
+        """エージェントを確保してタスクを実行し、結果を待つ"""
+        # 優先度キューに追加
+        entry = self._enqueue_task(task)
         
-        # 利用可能なエージェントを選択
-        agent = self._get_available_agent()
+        # 優先度順で先頭になったら、利用可能なエージェントを選択（能力が合うものを優先、空くまで待つ）
+        agent = self._get_available_agent(timeout=task.timeout, task_type=task.task_type, entry=entry)
+        self._dequeue_task(entry)
         if not agent:
             return TaskResult(
                 task_id=task.task_id,
@@ -448,107 +683,374 @@ class Orchestrator:
             )
             
         # タスクを実行
-        future = self.executor.submit(agent.execute_task, task)
+        future = self._dispatch(agent, task)
         
         try:
-            result = future.result(timeout=task.timeout)
-        except TimeoutError:
-            result = TaskResult(
+            return future.result(timeout=task.timeout)
+        except FutureTimeoutError:
+            return TaskResult(
                 task_id=task.task_id,
                 agent_id=agent.agent_id,
                 status="timeout",
                 result={},
                 error="Task execution timeout"
             )
-            
-        self._update_stats(result)
-        self.results[task.task_id] = result
-        
-        return result
         
     def execute_parallel_task(self, task: Task) -> List[TaskResult]:
         """並列タスクを実行"""
         if not task.subtasks:
             return [self.execute_task(task)]
             
-        futures: List[Future] = []
-        results: List[TaskResult] = []
-        
-        # サブタスクを並列実行
-        for i, subtask_def in enumerate(task.subtasks):
-            subtask = Task(
-                task_id=f"{task.task_id}_sub{i}",
-                task_type=subtask_def.get("type", task.task_type),
-                description=subtask_def.get("description", ""),
-                files=subtask_def.get("files", []),
-                priority=task.priority,
-                timeout=subtask_def.get("timeout", task.timeout)
-            )
-            
-            agent = self._get_available_agent()
-            if agent:
-                future = self.executor.submit(agent.execute_task, subtask)
-                futures.append((future, agent.agent_id, subtask))
+        futures: List[tuple] = []
+        
+        from_subtask = Task.from_subtask
+        subtasks = [from_subtask(task, i, subtask_def) for i, subtask_def in enumerate(task.subtasks)]
+        
+        # 空いているエージェントをまとめて確保し、サブタスクを一括投入
+        # （確保できた数より多い分はキューに積まれ、他のエージェントが奪って実行）
+        agents = self._acquire_agents(len(subtasks), timeout=task.timeout)
+        if agents:
+            futures = [None] * len(subtasks)
+            for offset, agent in enumerate(agents):
+                batch = subtasks[offset::len(agents)]
+                for index, future in zip(range(offset, len(subtasks), len(agents)),
+                                         self._dispatch_batch(agent, batch)):
+                    futures[index] = (future, agent.agent_id, subtasks[index])
                 
-        # 結果を収集
-        for future, agent_id, subtask in futures:
+        # 完了した順に結果を収集（全体で task.timeout の共通期限）
+        results: List[Optional[TaskResult]] = [None] * len(futures)
+        positions = {entry[0]: index for index, entry in enumerate(futures)}
+        try:
+            for future in as_completed(positions, timeout=task.timeout):
+                index = positions[future]
+                _, agent_id, subtask = futures[index]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = TaskResult(
+                        task_id=subtask.task_id,
+                        agent_id=agent_id,
+                        status="failed",
+                        result={},
+                        error=str(e)
+                    )
+                results[index] = result
+                self._update_stats(result)
+                self._store_result(result.task_id, result)
+        except FutureTimeoutError:
+            # 期限までに終わらなかったサブタスク
+            for index, (_, agent_id, subtask) in enumerate(futures):
+                if results[index] is None:
+                    result = TaskResult(
+                        task_id=subtask.task_id,
+                        agent_id=agent_id,
+                        status="timeout",
+                        result={},
+                        error="Task execution timeout"
+                    )
+                    results[index] = result
+                    self._update_stats(result)
+                    self._store_result(result.task_id, result)
+            
+        return results
+        
+    # 統計情報をログに出す最小間隔（秒）
+    STATS_LOG_INTERVAL = 60
+    
+    def _schedule_periodic(self, interval: float, func: Callable[[], None],
+                           active: Callable[[], bool], executor: Optional[Executor] = None):
+        """active() が真の間、interval 秒ごとに func を実行
+        
+        executor を渡すと func はそこで実行し、スケジューラースレッドを塞がない。
+        前回の実行がまだ終わっていなければその回は飛ばす（同じ処理を積み上げない）。
+        """
+        last_run: List[Future] = []
+        
+        def run():
             try:
-                result = future.result(timeout=subtask.timeout)
+                func()
             except Exception as e:
-                result = TaskResult(
-                    task_id=subtask.task_id,
-                    agent_id=agent_id,
-                    status="failed",
-                    result={},
-                    error=str(e)
-                )
+                logger.error(f"Periodic task error: {e}")
                 
-            results.append(result)
-            self._update_stats(result)
-            self.results[result.task_id] = result
+        def tick():
+            if not active():
+                return
+            if executor is None:
+                run()
+            elif not last_run or last_run[0].done():
+                last_run[:] = [executor.submit(run)]
+            self._scheduler.enter(interval, 1, tick)
             
-        return results
+        self._scheduler.enter(interval, 1, tick)
         
-    def _get_available_agent(self) -> Optional[ClaudeAgent]:
-        """利用可能なエージェントを取得"""
-        # 現在タスクを実行していないエージェントを探す
-        for agent in self.agents.values():
-            if agent.is_running and agent.current_task is None:
-                return agent
+    def _start_agent_worker(self, agent: ClaudeAgent):
+        """エージェント専用のキューとワーカースレッドを起動"""
+        self._workers_running = True
+        self._agent_queues[agent.agent_id] = deque()
+        self._agent_signals[agent.agent_id] = threading.Semaphore(0)
+        threading.Thread(target=self._agent_worker, args=(agent,), daemon=True).start()
+        
+    def _stop_agent_workers(self):
+        """ワーカーを停止し、キューに残ったタスクをキャンセル"""
+        self._workers_running = False
+        for agent_queue in self._agent_queues.values():
+            while agent_queue:
+                try:
+                    _, future, _ = agent_queue.popleft()
+                except IndexError:
+                    break
+                future.cancel()
+        # 待機中のワーカーを起こして終了させる
+        for signal in self._agent_signals.values():
+            signal.release()
+                
+    def _submit(self, agent: ClaudeAgent, task: Task) -> Future:
+        """タスクをエージェントのキューに直接投入（他エージェントには盗ませない）"""
+        future: Future = Future()
+        self._agent_queues[agent.agent_id].append((task, future, False))
+        self._agent_signals[agent.agent_id].release()
+        return future
+        
+    def _dispatch(self, agent: ClaudeAgent, task: Task) -> Future:
+        """取得したエージェントにタスクを投入し、完了時にアイドルへ戻す"""
+        return self._dispatch_batch(agent, [task])[0]
+        
+    def _dispatch_batch(self, agent: ClaudeAgent, tasks: List[Task]) -> List[Future]:
+        """複数タスクをエージェントのキューに一度に投入し、全て完了したらアイドルへ戻す
+        
+        2件以上のバッチはアイドルなエージェントに盗ませる。単一タスクは
+        取得したエージェント自身が必ず実行する。
+        """
+        futures = [Future() for _ in tasks]
+        stealable = len(tasks) > 1
+        self._agent_queues[agent.agent_id].extend(
+            (task, future, stealable) for task, future in zip(tasks, futures)
+        )
+        self._agent_signals[agent.agent_id].release(len(tasks))
+        
+        pending = [len(futures)]
+        pending_lock = threading.Lock()
+        
+        def on_done(_):
+            with pending_lock:
+                pending[0] -= 1
+                finished = pending[0] == 0
+            if finished:
+                self._release_agent(agent)
                 
-        # 全てビジーの場合は、最も負荷の低いエージェントを選択
-        # （簡易実装：ランダムに選択）
-        if self.agents:
-            return list(self.agents.values())[0]
+        for future in futures:
+            future.add_done_callback(on_done)
             
+        # アイドルなワーカーを起こして盗ませる（定期的なポーリングはしない）
+        if stealable:
+            with self._idle_condition:
+                thieves = list(self._idle_agents)[:len(tasks) - 1]
+            for agent_id in thieves:
+                self._agent_signals[agent_id].release()
+        return futures
+        
+    def _has_stealable_work(self, agent_id: str) -> bool:
+        """他エージェントのキューに盗めるタスクがあるか"""
+        for victim, victim_queue in self._agent_queues.items():
+            if victim == agent_id:
+                continue
+            try:
+                if victim_queue[-1][2]:
+                    return True
+            except IndexError:
+                continue
+        return False
+        
+    def _steal_task(self, agent_id: str) -> Optional[tuple]:
+        """他エージェントのキューの末尾から盗めるタスクを奪う
+        
+        キューには1回の投入分のタスクしか入らないため、末尾が盗めるなら
+        キュー内の全タスクが盗める。
+        """
+        victims = [aid for aid in self._agent_queues if aid != agent_id]
+        random.shuffle(victims)
+        for victim in victims:
+            victim_queue = self._agent_queues[victim]
+            try:
+                if not victim_queue[-1][2]:
+                    continue
+                return victim_queue.pop()
+            except IndexError:
+                continue
         return None
         
-    def _update_stats(self, result: TaskResult):
-        """統計情報を更新"""
-        if result.status == "success":
-            self.stats["tasks_completed"] += 1
-        else:
-            self.stats["tasks_failed"] += 1
+    def _steal_work(self, agent: ClaudeAgent):
+        """アイドルなエージェントをアイドルから外し、盗めるタスクがなくなるまで実行"""
+        if not self._has_stealable_work(agent.agent_id):
+            return
+        # 取得済みのエージェントでは盗まない（アイドルから外せた場合のみ）
+        with self._idle_condition:
+            if self._idle_agents.pop(agent.agent_id, None) is None:
+                return
+        try:
+            while self._workers_running:
+                item = self._steal_task(agent.agent_id)
+                if item is None:
+                    break
+                self._run_queued(agent, item)
+        finally:
+            self._release_agent(agent)
             
-        self.stats["total_execution_time"] += result.execution_time
+    def _run_queued(self, agent: ClaudeAgent, item: tuple):
+        """キューから取り出したタスクを実行し、結果を Future に設定"""
+        task, future, _ = item
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(agent.execute_task(task))
+        except Exception as e:
+            future.set_exception(e)
+        
+    def _agent_worker(self, agent: ClaudeAgent):
+        """自分のキューを先頭から処理し、空でアイドルなら他のキューから盗む"""
+        own_queue = self._agent_queues[agent.agent_id]
+        signal = self._agent_signals[agent.agent_id]
         
-    def _stats_reporter(self):
-        """定期的に統計情報を報告"""
         while True:
-            time.sleep(60)  # 1分ごと
+            signal.acquire()
+            if not self._workers_running:
+                break
+            try:
+                item = own_queue.popleft()
+            except IndexError:
+                item = None
+            if item is not None:
+                self._run_queued(agent, item)
+            if not own_queue:
+                self._steal_work(agent)
+        
+    def _register_capabilities(self, agent: ClaudeAgent):
+        """エージェントを能力（対応するタスク種別）ごとに索引"""
+        for capability in agent.config.capabilities:
+            self._agents_by_capability[capability].append(agent)
+            
+    def _release_agent(self, agent: ClaudeAgent):
+        """エージェントをアイドルに戻し、待機者を起こす"""
+        with self._idle_condition:
+            self._idle_agents[agent.agent_id] = agent
+            self._notify_agent_waiters()
+            
+    def _notify_agent_waiters(self):
+        """同期・非同期の待機者を全て起こす（_idle_condition 保持中に呼ぶ）
+        
+        エージェントを取れるのは優先度順で先頭のタスクだけなので、1つだけ起こすと
+        先頭でない待機者に起床が渡って先頭が待ち続けることがある。
+        """
+        self._idle_condition.notify_all()
+        while self._agent_waiters:
+            self._wake_agent_waiter()
+            
+    def _wake_agent_waiter(self):
+        """asyncio の待機者を1つ、そのイベントループ上で起こす（_idle_condition 保持中に呼ぶ）"""
+        while self._agent_waiters:
+            loop, waiter = self._agent_waiters.popleft()
+            # タイムアウト・キャンセル済みで、まだ登録を外していない待機者は飛ばす
+            if waiter.done():
+                continue
+            try:
+                loop.call_soon_threadsafe(_wake_waiter, waiter)
+                return
+            except RuntimeError:
+                # ループが既に閉じている待機者は飛ばす
+                continue
+                
+    def _take_idle_agent(self, task_type: Optional[str]) -> Optional[ClaudeAgent]:
+        """アイドルなエージェントを1つ取り出す（_idle_condition 保持中に呼ぶ）"""
+        idle = self._idle_agents
+        
+        # タスク種別に対応する能力を持つエージェントを巡回順に優先
+        capable = self._agents_by_capability.get(task_type) if task_type else None
+        if capable:
+            start = self._capability_cursor[task_type]
+            for offset in range(len(capable)):
+                index = (start + offset) % len(capable)
+                agent = idle.pop(capable[index].agent_id, None)
+                if agent is not None:
+                    self._capability_cursor[task_type] = index + 1
+                    return agent
+                    
+        # 該当がなければ、最も長くアイドルなエージェント
+        for agent_id in idle:
+            return idle.pop(agent_id)
+        return None
+        
+    def _get_available_agent(self, timeout: Optional[float] = None,
+                             task_type: Optional[str] = None,
+                             entry: Optional[list] = None) -> Optional[ClaudeAgent]:
+        """利用可能なエージェントを取得（全てビジーなら空くまで待つ）
+        
+        entry（_enqueue_task の戻り値）を渡すと、待機中タスクのうち優先度順で
+        先頭になるまでエージェントを取らない。
+        """
+        if not self.agents:
+            return None
+            
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle_condition:
+            while True:
+                if entry is None or self._is_next_task(entry):
+                    agent = self._take_idle_agent(task_type)
+                else:
+                    agent = None
+                if agent is None:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return None
+                    self._idle_condition.wait(remaining)
+                    continue
+                    
+                # 停止したエージェントはアイドルから外す
+                if agent.is_running:
+                    return agent
+        
+    def _acquire_agents(self, count: int, timeout: Optional[float] = None) -> List[ClaudeAgent]:
+        """最低1つ（待つ）、最大count個（待たない）のエージェントを確保"""
+        agent = self._get_available_agent(timeout=timeout)
+        if agent is None:
+            return []
+            
+        agents = [agent]
+        while len(agents) < count:
+            agent = self._get_available_agent(timeout=0)
+            if agent is None:
+                break
+            agents.append(agent)
+        return agents
+        
+    def _update_stats(self, result: TaskResult):
+        """統計情報を更新（複数のワーカースレッドから呼ばれる）"""
+        now = time.monotonic()
+        with self._stats_lock:
+            if result.status == "success":
+                self.stats["tasks_completed"] += 1
+            else:
+                self.stats["tasks_failed"] += 1
+                
+            self.stats["total_execution_time"] += result.execution_time
+            completed = self.stats["tasks_completed"]
+            failed = self.stats["tasks_failed"]
+            self._avg_exec = self.stats["total_execution_time"] / (completed + failed)
             
+            # 統計情報の報告は最大1分に1回（専用スレッドで定期的に起こさない）
+            should_log = now - self._last_stats_log >= self.STATS_LOG_INTERVAL
+            if should_log:
+                self._last_stats_log = now
+                
+        if should_log:
             logger.info(
-                f"Stats - Completed: {self.stats['tasks_completed']}, "
-                f"Failed: {self.stats['tasks_failed']}, "
+                f"Stats - Completed: {completed}, "
+                f"Failed: {failed}, "
                 f"Avg time: {self._get_avg_execution_time():.2f}s"
             )
             
     def _get_avg_execution_time(self) -> float:
         """平均実行時間を取得"""
-        total_tasks = self.stats["tasks_completed"] + self.stats["tasks_failed"]
-        if total_tasks == 0:
-            return 0.0
-        return self.stats["total_execution_time"] / total_tasks
+        return self._avg_exec
         
     def _print_final_stats(self):
         """最終統計情報を出力"""
@@ -557,6 +1059,7 @@ class Orchestrator:
         print(f"Total tasks failed: {self.stats['tasks_failed']}")
         print(f"Average execution time: {self._get_avg_execution_time():.2f}s")
         print(f"Total execution time: {self.stats['total_execution_time']:.2f}s")
+        print(f"Result cache hits/misses: {self.stats['cache_hits']}/{self.stats['cache_misses']}")
         
     def get_agent_status(self) -> Dict[str, Any]:
         """全エージェントのステータスを取得"""
@@ -571,7 +1074,178 @@ class Orchestrator:
         
     def get_task_result(self, task_id: str) -> Optional[TaskResult]:
         """タスク結果を取得"""
-        return self.results.get(task_id)
+        with self._results_lock:
+            result = self.results.get(task_id)
+            if result is not None:
+                self.results.move_to_end(task_id)
+            return result
+            
+    def _store_result(self, task_id: str, result: TaskResult):
+        """結果を保存し、上限を超えたら最も古い結果を削除"""
+        with self._results_lock:
+            self.results[task_id] = result
+            self.results.move_to_end(task_id)
+            if len(self.results) > self._results_max:
+                self.results.popitem(last=False)
+
+
+def _wake_waiter(waiter: asyncio.Future):
+    """待機中の Future を完了させる（タイムアウト済みなら何もしない）"""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AsyncOrchestrator(Orchestrator):
+    """asyncio 版オーケストレーター
+    
+    エージェントの確保と結果待ちをイベントループ上で行い、呼び出し側のスレッドを
+    ブロックしない。エージェントのワーカースレッド・結果キャッシュは同期版と共有。
+    """
+    
+    async def execute_task(self, task: Task) -> TaskResult:
+        """単一タスクを実行"""
+        cache_key = self._task_cache_key(task)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            result = replace(cached, task_id=task.task_id, timestamp=time.time())
+            self._store_result(task.task_id, result)
+            return result
+            
+        # 同一タスクが実行中なら（同期版からの実行も含め）その結果を待つ
+        with self._inflight_lock:
+            flight = self._inflight.get(cache_key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._inflight[cache_key] = Future()
+                
+        if not is_leader:
+            try:
+                shared = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(flight)), task.timeout)
+            except asyncio.TimeoutError:
+                shared = TaskResult(
+                    task_id=task.task_id,
+                    agent_id="none",
+                    status="timeout",
+                    result={},
+                    error="Task execution timeout"
+                )
+            result = replace(shared, task_id=task.task_id)
+            self._store_result(task.task_id, result)
+            return result
+            
+        try:
+            result = await self._run_task_async(task)
+            
+            self._update_stats(result)
+            self._store_result(task.task_id, result)
+            if result.status == "success":
+                self._cache_result(cache_key, result)
+            flight.set_result(result)
+            
+            return result
+            
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+            
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+                
+    async def execute_parallel_task(self, task: Task) -> List[TaskResult]:
+        """並列タスクを実行（サブタスクは同時に待機し、結果はサブタスク順）"""
+        if not task.subtasks:
+            return [await self.execute_task(task)]
+            
+        from_subtask = Task.from_subtask
+        subtasks = [from_subtask(task, i, subtask_def) for i, subtask_def in enumerate(task.subtasks)]
+        outcomes = await asyncio.gather(
+            *(self._run_task_async(subtask) for subtask in subtasks),
+            return_exceptions=True
+        )
+        
+        results = []
+        for subtask, outcome in zip(subtasks, outcomes):
+            if isinstance(outcome, BaseException):
+                outcome = TaskResult(
+                    task_id=subtask.task_id,
+                    agent_id="none",
+                    status="failed",
+                    result={},
+                    error=str(outcome)
+                )
+            self._update_stats(outcome)
+            self._store_result(outcome.task_id, outcome)
+            results.append(outcome)
+            
+        return results
+        
+    async def _get_available_agent_async(self, task: Task,
+                                         queue_entry: Optional[list] = None) -> Optional[ClaudeAgent]:
+        """利用可能なエージェントを取得（空くまでイベントループを止めずに待つ）"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + task.timeout
+        while True:
+            # 空きの確認と待機者の登録を同じロック内で行い、解放の取りこぼしを防ぐ
+            with self._idle_condition:
+                agent = self._get_available_agent(timeout=0, task_type=task.task_type, entry=queue_entry)
+                remaining = deadline - loop.time()
+                if agent or not self.agents or remaining <= 0:
+                    return agent
+                entry = (loop, loop.create_future())
+                self._agent_waiters.append(entry)
+                
+            # _release_agent から起こされるまで待つ（ポーリングしない）
+            try:
+                await asyncio.wait_for(entry[1], remaining)
+            except asyncio.TimeoutError:
+                # 期限切れでも最後にもう一度だけ空きを確認する
+                self._withdraw_agent_waiter(entry)
+                continue
+            except asyncio.CancelledError:
+                self._withdraw_agent_waiter(entry)
+                raise
+            with self._idle_condition:
+                if entry in self._agent_waiters:
+                    self._agent_waiters.remove(entry)
+                    
+    def _withdraw_agent_waiter(self, entry: tuple):
+        """待機者の登録を外す。既に起こされていたなら、その起床を次の待機者に譲る"""
+        with self._idle_condition:
+            if entry in self._agent_waiters:
+                self._agent_waiters.remove(entry)
+            else:
+                self._wake_agent_waiter()
+            
+    async def _run_task_async(self, task: Task) -> TaskResult:
+        """エージェントを確保してタスクを実行し、結果を待つ"""
+        entry = self._enqueue_task(task)
+        try:
+            agent = await self._get_available_agent_async(task, entry)
+        finally:
+            self._dequeue_task(entry)
+            
+        if not agent:
+            return TaskResult(
+                task_id=task.task_id,
+                agent_id="none",
+                status="failed",
+                result={},
+                error="No available agents"
+            )
+            
+        # タイムアウトしてもエージェント側の実行は取り消さない（同期版と同じ）
+        future = self._dispatch(agent, task)
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), task.timeout)
+        except asyncio.TimeoutError:
+            return TaskResult(
+                task_id=task.task_id,
+                agent_id=agent.agent_id,
+                status="timeout",
+                result={},
+                error="Task execution timeout"
+            )
 
 
 # CLIエントリーポイント
@@ -585,6 +1259,12 @@ def main():
     
     args = parser.parse_args()
     
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
         
@@ -613,7 +1293,7 @@ def main():
                     break
                 elif cmd == "status":
                     status = orchestrator.get_agent_status()
-                    print(json.dumps(status, indent=2))
+                    print(format_status_json(status))
                 elif cmd.startswith("task"):
                     parts = cmd.split(maxsplit=2)
                     if len(parts) >= 3:
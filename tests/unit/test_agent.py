@@ -3,6 +3,7 @@ Unit tests for the Agent classes
 """
 
 import pytest
+import sys
 import time
 import json
 from unittest.mock import MagicMock, patch, mock_open
@@ -80,6 +81,31 @@ class TestTask:
         assert task.subtasks == [{"type": "analysis"}]
         assert task.priority == 8
         assert task.timeout == 120.0
+    
+    def test_task_type_interned(self):
+        """Test that task types built at runtime share the canonical string"""
+        task = Task(task_id="interned", task_type="".join(["code_", "review"]))
+        
+        assert task.task_type is sys.intern("code_review")
+    
+    def test_non_string_fields_are_not_interned(self):
+        """Test that None or non-str task types and statuses are kept as given"""
+        task = Task(task_id="untyped", task_type=None)
+        result = TaskResult("untyped", "agent_000", None, {})
+        
+        assert task.task_type is None
+        assert result.status is None
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+    def test_task_has_no_instance_dict(self):
+        """Test that tasks and results use slots instead of a per-instance dict"""
+        task = Task(task_id="slotted")
+        result = TaskResult("slotted", "agent_000", "success", {})
+        
+        assert not hasattr(task, "__dict__")
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            task.unknown_field = 1
 
 
 class TestTaskResult:
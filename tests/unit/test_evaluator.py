@@ -0,0 +1,31 @@
+"""
+Unit tests for the LLM-as-judge evaluation data classes
+"""
+
+from dataclasses import asdict
+
+from conductor.evaluator import CriteriaScore, EvaluationResult, QualityTrend
+
+
+class TestEvaluationSerialization:
+    """Test cases for evaluation to_dict conversion"""
+
+    def test_evaluation_result_matches_asdict(self):
+        """Test that to_dict produces the same structure as asdict"""
+        result = EvaluationResult(
+            task_id="task_1", agent_id="agent_000", task_type="code_review",
+            overall_score=85.0,
+            criteria_scores=[CriteriaScore("accuracy", 4, 5, 0.5, "good", ["add tests"])],
+            overall_feedback="fine", improvement_suggestions=["refactor"]
+        )
+
+        data = result.to_dict()
+
+        assert data == asdict(result)
+        assert data["criteria_scores"][0]["suggestions"] is not result.criteria_scores[0].suggestions
+
+    def test_quality_trend_matches_asdict(self):
+        """Test that trend to_dict produces the same structure as asdict"""
+        trend = QualityTrend("agent_000", "analysis", "week", 75.0, "stable", 4, 90.0, 60.0, ["naming"])
+
+        assert trend.to_dict() == asdict(trend)
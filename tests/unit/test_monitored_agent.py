@@ -0,0 +1,224 @@
+"""
+Unit tests for the monitored agent helpers
+"""
+
+import json
+import os
+import time
+import pytest
+from unittest.mock import patch
+
+from conductor.monitored_agent import (
+    ContainerMonitor, ErrorTracker, MonitoredAgent, ProcessMonitor, TaskExecutionDetail, get_process_monitor
+)
+
+
+class TestProcessMonitor:
+    """Test cases for the shared process monitor"""
+
+    def test_process_monitor_shared_per_pid(self):
+        """Test that all callers in one process share one monitor"""
+        monitor = get_process_monitor()
+
+        assert monitor is get_process_monitor()
+        assert monitor.pid == os.getpid()
+
+    def test_process_monitor_runs_while_in_use(self):
+        """Test that the sampler keeps running until the last user stops"""
+        monitor = ProcessMonitor(os.getpid())
+
+        monitor.start()
+        monitor.start()
+        assert monitor.monitoring
+
+        monitor.stop()
+        assert monitor.monitoring
+
+        monitor.stop()
+        assert not monitor.monitoring
+
+    def test_restart_retires_the_previous_loop(self):
+        """Test that a loop started before stop() exits after a quick restart"""
+        monitor = ProcessMonitor(os.getpid())
+
+        with patch("conductor.monitored_agent.threading.Thread"):
+            monitor.start()
+            old_generation = monitor._generation
+            monitor.stop()
+            monitor.start()
+
+        assert monitor.monitoring
+        assert monitor._generation != old_generation
+        with patch("conductor.monitored_agent.time.sleep") as sleep:
+            monitor._monitor_loop(old_generation)
+        sleep.assert_not_called()
+        monitor.stop()
+
+    def test_agent_stop_releases_its_reference_once(self):
+        """Test that stopping one agent twice keeps another agent's monitor running"""
+        first = MonitoredAgent("monitor_ref_first")
+        second = MonitoredAgent("monitor_ref_second")
+        monitor = ProcessMonitor(os.getpid())
+        first.process_monitor = second.process_monitor = monitor
+
+        with patch("conductor.monitored_agent.threading.Thread"), \
+                patch("conductor.agent.ClaudeAgent.start"), patch("conductor.agent.ClaudeAgent.stop"), \
+                patch.object(MonitoredAgent, "_start_performance_profiling"), \
+                patch.object(MonitoredAgent, "_generate_agent_performance_report"):
+            first.start()
+            first.start()
+            second.start()
+            first.stop()
+            first.stop()
+
+            assert monitor.monitoring
+            second.stop()
+
+        assert not monitor.monitoring
+
+
+class TestMonitoredAgentProfile:
+    """Test cases for MonitoredAgent performance profiling"""
+
+    def test_efficiency_is_updated_with_each_task(self):
+        """Test that each task folds its resource usage into the efficiency score immediately"""
+        agent = MonitoredAgent("profile_test_agent")
+        detail = TaskExecutionDetail(
+            task_id="task_1",
+            task_type="analysis",
+            start_time=time.time(),
+            cpu_usage_start=10.0,
+            cpu_usage_end=14.0,
+            memory_usage_start=0,
+            memory_usage_end=2 * 1024 * 1024
+        )
+
+        agent._update_performance_profile("analysis", detail, True)
+
+        expected = 0.9 * 1.0 + 0.1 * (1.0 / 4.0 + 1.0 / 2.0) / 2
+        assert agent.performance_profile.resource_efficiency == pytest.approx(expected)
+
+    def test_executions_get_distinct_correlation_ids(self):
+        """Test that retries of the same task are told apart by correlation id"""
+        first = TaskExecutionDetail(task_id="task_1", task_type="analysis", start_time=time.time())
+        retry = TaskExecutionDetail(task_id="task_1", task_type="analysis", start_time=time.time())
+
+        assert first.correlation_id
+        assert first.correlation_id != retry.correlation_id
+
+    def test_performance_report_is_valid_json(self):
+        """Test that the performance report parses as JSON"""
+        agent = MonitoredAgent("report_test_agent")
+        for i in range(3):
+            agent.execution_history.append(TaskExecutionDetail(
+                task_id=f"task_{i}",
+                task_type="analysis",
+                start_time=time.time(),
+                end_time=time.time(),
+                correlation_id=f"task_{i}"
+            ))
+
+        with patch("conductor.monitored_agent.time.time", return_value=1234567890):
+            agent._generate_agent_performance_report()
+
+        report_file = "/tmp/claude_agent_report_test_agent_performance_report_1234567890.json"
+        try:
+            with open(report_file) as f:
+                report = json.load(f)
+        finally:
+            os.remove(report_file)
+
+        assert report["agent_id"] == "report_test_agent"
+        assert [e["task_id"] for e in report["detailed_execution_history"]] == ["task_0", "task_1", "task_2"]
+
+    def test_failed_report_write_leaves_no_file(self):
+        """Test that an error while writing the report leaves neither a partial report nor a temp file"""
+        agent = MonitoredAgent("failed_report_agent")
+        report_file = "/tmp/claude_agent_failed_report_agent_performance_report_1234567890.json"
+
+        with patch("conductor.monitored_agent.time.time", return_value=1234567890), \
+                patch("json.dump", side_effect=ValueError("boom")):
+            agent._generate_agent_performance_report()
+
+        assert not os.path.exists(report_file)
+        assert not os.path.exists(f"{report_file}.tmp")
+
+    def test_performance_report_with_empty_summary_is_valid_json(self):
+        """Test that the report stays valid JSON when the summary has no keys"""
+        agent = MonitoredAgent("empty_report_agent")
+        agent.get_agent_performance_summary = lambda: {}
+
+        with patch("conductor.monitored_agent.time.time", return_value=1234567890):
+            agent._generate_agent_performance_report()
+
+        report_file = "/tmp/claude_agent_empty_report_agent_performance_report_1234567890.json"
+        try:
+            with open(report_file) as f:
+                report = json.load(f)
+        finally:
+            os.remove(report_file)
+
+        assert report == {"detailed_execution_history": []}
+
+
+class TestContainerMonitor:
+    """Test cases for ContainerMonitor parsing"""
+
+    def test_parse_memory_size_units(self):
+        """Test that memory sizes parse with and without units"""
+        monitor = ContainerMonitor("test_container")
+
+        assert monitor._parse_memory_size("512") == 512
+        assert monitor._parse_memory_size("100B") == 100
+        assert monitor._parse_memory_size(" 2KB ") == 2048
+        assert monitor._parse_memory_size("12.5MiB") == int(12.5 * 1024**2)
+        assert monitor._parse_memory_size("1.5GB") == int(1.5 * 1024**3)
+        assert monitor._parse_memory_size("n/a") == 0
+        assert monitor._parse_memory_size(None) == 0
+
+    def test_parse_memory_usage_pair(self):
+        """Test that podman-style usage strings split into used and total"""
+        monitor = ContainerMonitor("test_container")
+
+        assert monitor._parse_memory("10MiB / 1GiB") == {'used': 10 * 1024**2, 'total': 1024**3}
+
+
+class TestErrorTracker:
+    """Test cases for ErrorTracker"""
+
+    def test_error_patterns_are_bounded(self):
+        """Test that each error pattern keeps only its most recent records"""
+        tracker = ErrorTracker()
+        for i in range(150):
+            tracker.record_error("analysis", f"timeout after {i}s", 1.0)
+
+        summary = tracker.get_summary()
+
+        assert summary['total_errors'] == 150
+        assert summary['error_type_counts'] == {'timeout_error': 100}
+        assert [e['error_message'] for e in summary['recent_errors']] == [
+            f"timeout after {i}s" for i in range(140, 150)
+        ]
+
+    def test_classify_error_keyword_precedence(self):
+        """Test that classification follows keyword precedence, not position"""
+        tracker = ErrorTracker()
+
+        assert tracker._classify_error("Connection TIMEOUT") == 'timeout_error'
+        assert tracker._classify_error("permission denied: file not found") == 'permission_error'
+        assert tracker._classify_error("Out of Memory") == 'memory_error'
+        assert tracker._classify_error("segfault") == 'unknown_error'
+
+    def test_recent_errors_report_wall_clock_time(self):
+        """Test that summaries convert monotonic record times to wall-clock time"""
+        tracker = ErrorTracker()
+        before = time.time()
+        tracker.record_error("analysis", "connection refused", 0.5)
+        after = time.time()
+
+        error = tracker.get_summary()['recent_errors'][0]
+
+        assert before - 0.01 <= error['timestamp'] <= after + 0.01
+        assert error['error_type'] == 'connection_error'
+        assert error['task_type'] == 'analysis'
+
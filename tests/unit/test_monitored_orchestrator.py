@@ -0,0 +1,307 @@
+"""
+Unit tests for the monitored orchestrator task queue and metrics writer
+"""
+
+import queue
+import threading
+import pytest
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from unittest.mock import MagicMock, patch
+
+from conductor import Task, TaskResult
+from conductor.monitored_orchestrator import (
+    RESOURCE_USAGE_FIELDS, EnhancedTaskQueue, MetricsEventWriter, MonitoredOrchestrator, ResourceUsagePoint
+)
+
+
+class TestEnhancedTaskQueue:
+    """Test cases for EnhancedTaskQueue"""
+
+    def test_dequeue_priority_order(self):
+        """Test that tasks dequeue by priority, FIFO within a priority"""
+        queue = EnhancedTaskQueue()
+        for task_id, priority in [("a", 5), ("b", 9), ("c", 5), ("d", 1), ("e", 9)]:
+            assert queue.enqueue(Task(task_id=task_id), priority)
+
+        order = [queue.dequeue().task_id for _ in range(5)]
+
+        assert order == ["b", "e", "a", "c", "d"]
+        assert queue.dequeue() is None
+
+    def test_enqueue_rejects_when_full(self):
+        """Test that the queue rejects tasks beyond max_size"""
+        queue = EnhancedTaskQueue(max_size=1)
+
+        assert queue.enqueue(Task(task_id="first"))
+        assert not queue.enqueue(Task(task_id="second"))
+
+    def test_metrics_priority_distribution(self):
+        """Test that metrics report queued priorities"""
+        queue = EnhancedTaskQueue()
+        queue.enqueue(Task(task_id="a"), 3)
+        queue.enqueue(Task(task_id="b"), 3)
+        queue.enqueue(Task(task_id="c"), 7)
+
+        metrics = queue.get_metrics()
+
+        assert metrics.queued_tasks == 3
+        assert metrics.priority_distribution == {3: 2, 7: 1}
+
+    def test_metrics_are_independent_snapshots(self):
+        """Test that each call returns fresh metrics the caller can modify"""
+        queue = EnhancedTaskQueue()
+        queue.enqueue(Task(task_id="a"), 4)
+
+        first = queue.get_metrics()
+        first.priority_distribution[9] = 1
+        first.queued_tasks = 99
+        assert queue.get_metrics().priority_distribution == {4: 1}
+
+        queue.dequeue()
+        second = queue.get_metrics()
+
+        assert second is not first
+        assert second.queued_tasks == 0
+        assert second.processing_tasks == 1
+        assert second.priority_distribution == {}
+
+    def test_metrics_averages_cover_recent_completions(self):
+        """Test that averages and failures cover only the last 100 completions"""
+        queue = EnhancedTaskQueue()
+        for i in range(150):
+            task_id = f"task_{i}"
+            queue.enqueue(Task(task_id=task_id))
+            task = queue.dequeue()
+            task.queue_time = float(i)
+            status = "failed" if i % 2 else "success"
+            queue.complete_task(task_id, TaskResult(task_id=task_id, agent_id="agent_000", status=status, result={}))
+
+        metrics = queue.get_metrics()
+
+        assert metrics.completed_tasks == 150
+        assert metrics.failed_tasks == 50
+        assert metrics.avg_queue_time == pytest.approx(sum(range(50, 150)) / 100)
+
+    def test_reserve_for_execution_skips_queue(self):
+        """Test that reserved tasks go straight to processing"""
+        queue = EnhancedTaskQueue()
+        queue.enqueue(Task(task_id="waiting"), 9)
+
+        task = queue.reserve_for_execution(Task(task_id="direct"), 3)
+
+        assert task.task_id == "direct"
+        assert task.queue_time == 0.0
+        assert "direct" in queue.processing
+        assert queue.dequeue().task_id == "waiting"
+
+    def test_reserve_for_execution_rejects_when_full(self):
+        """Test that reservation is bounded by the tasks already in progress"""
+        queue = EnhancedTaskQueue(max_size=1)
+        queue.enqueue(Task(task_id="waiting"))
+
+        assert queue.reserve_for_execution(Task(task_id="first")) is not None
+        assert queue.reserve_for_execution(Task(task_id="second")) is None
+
+        queue.complete_task("first", TaskResult(task_id="first", agent_id="agent_000", status="success", result={}))
+        assert queue.reserve_for_execution(Task(task_id="third")) is not None
+
+    def test_metrics_convert_to_dict(self):
+        """Test that queue metrics serialize for reports"""
+        queue = EnhancedTaskQueue()
+        queue.enqueue(Task(task_id="a"), 2)
+
+        metrics = asdict(queue.get_metrics())
+
+        assert metrics['queued_tasks'] == 1
+        assert metrics['priority_distribution'] == {2: 1}
+
+class TestMetricsEventWriter:
+    """Test cases for MetricsEventWriter"""
+
+    def test_stop_flushes_queued_events(self):
+        """Test that events queued before stop reach the collector in order"""
+        collector = MagicMock()
+        writer = MetricsEventWriter(collector)
+
+        writer.start()
+        writer.record('record_task_completion', 'task_1', 'success')
+        writer.record('update_queue_metrics', queue_length=0, priority_breakdown={})
+        writer.stop()
+
+        collector.record_task_completion.assert_called_once_with('task_1', 'success')
+        collector.update_queue_metrics.assert_called_once_with(queue_length=0, priority_breakdown={})
+
+    def test_events_recorded_synchronously_when_not_running(self):
+        """Test that events before start and after stop are not stranded in the queue"""
+        collector = MagicMock()
+        writer = MetricsEventWriter(collector)
+
+        writer.record('record_task_completion', 'before', 'success')
+        writer.start()
+        writer.stop()
+        writer.record('record_task_completion', 'after', 'failed')
+
+        assert [c.args for c in collector.record_task_completion.call_args_list] == [
+            ('before', 'success'), ('after', 'failed')
+        ]
+        assert writer.events.empty()
+
+    def test_record_does_not_take_the_state_lock(self):
+        """Test that queuing an event while running is lock-free"""
+        collector = MagicMock()
+        writer = MetricsEventWriter(collector)
+        writer.start()
+        state_lock = writer._state_lock
+        writer._state_lock = MagicMock()
+
+        writer.record('record_task_completion', 'task_1', 'success')
+
+        writer._state_lock.__enter__.assert_not_called()
+        writer._state_lock = state_lock
+        writer.stop()
+        collector.record_task_completion.assert_called_once_with('task_1', 'success')
+
+    def test_event_racing_with_stop_is_applied(self):
+        """Test that an event put after stop() has finished is still applied"""
+        collector = MagicMock()
+        writer = MetricsEventWriter(collector)
+
+        class StopBeforePut(queue.SimpleQueue):
+            def put_nowait(self, item):
+                if item is not None and writer.running:
+                    writer.stop()
+                super().put_nowait(item)
+
+        writer.events = StopBeforePut()
+        writer.start()
+        writer.record('record_task_completion', 'task_1', 'success')
+
+        collector.record_task_completion.assert_called_once_with('task_1', 'success')
+        assert writer.events.empty()
+
+    def test_queue_forwards_completion_through_writer(self):
+        """Test that the task queue emits completions via the writer"""
+        writer = MagicMock()
+        queue = EnhancedTaskQueue(metrics_writer=writer)
+        queue.enqueue(Task(task_id="a"))
+        queue.dequeue()
+
+        queue.complete_task("a", TaskResult(task_id="a", agent_id="agent_000", status="success", result={}))
+
+        methods = [c.args[0] for c in writer.record.call_args_list]
+        assert 'record_task_completion' in methods
+        assert 'update_queue_metrics' in methods
+
+
+class TestResourceUsageHistory:
+    """Test cases for the orchestrator resource usage history"""
+
+    def test_trend_rebuilds_latest_points(self):
+        """Test that the trend returns the newest points, oldest first"""
+        orchestrator = MonitoredOrchestrator.__new__(MonitoredOrchestrator)
+        orchestrator.detailed_stats = {'resource_usage_history': deque(maxlen=1440)}
+        history = orchestrator.detailed_stats['resource_usage_history']
+        for i in range(150):
+            history.append(ResourceUsagePoint(*[i] * len(RESOURCE_USAGE_FIELDS)))
+
+        trend = orchestrator._get_resource_usage_trend(100)
+
+        assert len(trend) == 100
+        assert trend[0] == dict.fromkeys(RESOURCE_USAGE_FIELDS, 50)
+        assert trend[-1]['cpu_percent'] == 149
+
+    def test_recorded_samples_are_whole_rows(self):
+        """Test that each recorded sample is stored as one row"""
+        orchestrator = MonitoredOrchestrator.__new__(MonitoredOrchestrator)
+        orchestrator.detailed_stats = {'resource_usage_history': deque(maxlen=1440)}
+        orchestrator.agents = {"agent_000": MagicMock(is_running=True)}
+        orchestrator.task_queue = EnhancedTaskQueue()
+        stats = {'cpu_percent': 12.5, 'memory_percent': 40.0, 'memory_used': 1024}
+
+        with patch("conductor.utils.get_system_stats", return_value=stats):
+            orchestrator._record_resource_usage()
+
+        point, = orchestrator._get_resource_usage_trend(10)
+        assert {k: point[k] for k in ('cpu_percent', 'memory_percent', 'memory_used', 'active_agents', 'queue_length')} == {
+            'cpu_percent': 12.5, 'memory_percent': 40.0, 'memory_used': 1024, 'active_agents': 1, 'queue_length': 0
+        }
+
+
+class TestTaskTypePerformance:
+    """Test cases for per-task-type performance statistics"""
+
+    def test_detailed_stats_record_tuples(self):
+        """Test that task type records are compact tuples"""
+        orchestrator = MonitoredOrchestrator.__new__(MonitoredOrchestrator)
+        orchestrator.task_queue = EnhancedTaskQueue()
+        orchestrator.detailed_stats = {
+            'task_type_performance': defaultdict(lambda: deque(maxlen=1000)),
+            'peak_performance_metrics': {'fastest_task_completion': float('inf'), 'highest_throughput': 0.0}
+        }
+        task = Task(task_id="a", task_type="analysis")
+        result = TaskResult(task_id="a", agent_id="agent_000", status="success", result={}, execution_time=1.5)
+
+        orchestrator._update_detailed_stats(task, result, "success")
+
+        execution_time, status, _, category = orchestrator.detailed_stats['task_type_performance']['analysis'][0]
+        assert (execution_time, status, category) == (1.5, "success", "success")
+        assert orchestrator.detailed_stats['peak_performance_metrics']['fastest_task_completion'] == 1.5
+
+
+class TestMonitoredExecution:
+    """Test cases for MonitoredOrchestrator.execute_task"""
+
+    def test_execute_task_times_out(self):
+        """Test that a slow agent produces a timeout result"""
+        release = threading.Event()
+        agent = MagicMock(agent_id="agent_000")
+        agent.execute_task.side_effect = lambda task: release.wait(5)
+
+        orchestrator = MonitoredOrchestrator.__new__(MonitoredOrchestrator)
+        orchestrator.metrics_collector = MagicMock()
+        orchestrator.metrics_writer = MagicMock()
+        orchestrator.task_queue = EnhancedTaskQueue(metrics_writer=orchestrator.metrics_writer)
+        orchestrator.executor = ThreadPoolExecutor(max_workers=1)
+        orchestrator.detailed_stats = {
+            'task_type_performance': defaultdict(lambda: deque(maxlen=1000)),
+            'peak_performance_metrics': {'fastest_task_completion': float('inf'), 'highest_throughput': 0.0}
+        }
+        orchestrator._find_available_agent = lambda: agent
+        orchestrator._release_agent = MagicMock()
+
+        try:
+            result = orchestrator.execute_task(Task(task_id="slow", timeout=0.05))
+        finally:
+            release.set()
+            orchestrator.executor.shutdown(wait=True)
+
+        assert result.status == "timeout"
+        assert result.agent_id == "agent_000"
+        assert "slow" not in orchestrator.task_queue.processing
+        orchestrator._release_agent.assert_called_once_with("agent_000")
+
+
+    def test_agent_released_when_submit_fails(self):
+        """Test that an agent is handed back if the executor rejects the task"""
+        agent = MagicMock(agent_id="agent_000")
+
+        orchestrator = MonitoredOrchestrator.__new__(MonitoredOrchestrator)
+        orchestrator.metrics_collector = MagicMock()
+        orchestrator.metrics_writer = MagicMock()
+        orchestrator.task_queue = EnhancedTaskQueue(metrics_writer=orchestrator.metrics_writer)
+        orchestrator.executor = MagicMock()
+        orchestrator.executor.submit.side_effect = RuntimeError("cannot schedule new futures after shutdown")
+        orchestrator.detailed_stats = {
+            'task_type_performance': defaultdict(lambda: deque(maxlen=1000)),
+            'peak_performance_metrics': {'fastest_task_completion': float('inf'), 'highest_throughput': 0.0},
+            'error_patterns': defaultdict(int)
+        }
+        orchestrator._find_available_agent = lambda: agent
+        orchestrator._release_agent = MagicMock()
+
+        result = orchestrator.execute_task(Task(task_id="rejected"))
+
+        assert result.status == "failed"
+        orchestrator._release_agent.assert_called_once_with("agent_000")
@@ -0,0 +1,537 @@
+"""
+Unit tests for the performance monitoring middleware
+"""
+
+import json
+import random
+import threading
+import pytest
+from collections import deque
+from dataclasses import asdict
+from unittest.mock import MagicMock, patch
+
+from conductor.agent import Task
+from conductor.metrics import MetricsCollector
+from conductor.monitoring import (
+    AgentMonitoringMixin, MethodStats, OrchestratorMonitoringMixin, PerformanceInterceptor, ResourceMonitor,
+    TracingMiddleware, generate_monitoring_report, get_current_trace, get_tracing_middleware,
+    set_interception_enabled, set_tracing_enabled, traced
+)
+
+
+class TestTracingMiddleware:
+    """Test cases for TracingMiddleware"""
+
+    def test_trace_lifecycle(self):
+        """Test that traces move from active to completed"""
+        tracing = TracingMiddleware()
+        trace = tracing.start_trace("operation")
+        tracing.add_trace_tag(trace.trace_id, 'task_id', 'task_1')
+
+        assert trace.trace_id in tracing.active_traces
+        assert tracing.get_active_trace(trace.trace_id) is trace
+        assert tracing.active_trace_count() == 1
+
+        tracing.finish_trace(trace.trace_id, "error", "boom")
+
+        assert tracing.active_traces == {}
+        assert tracing.get_active_trace(trace.trace_id) is None
+        assert tracing.active_trace_count() == 0
+        completed = tracing.get_completed_traces()
+        assert completed == [trace]
+        assert trace.tags['task_id'] == 'task_1'
+        assert trace.tags['status'] == 'error'
+        assert trace.logs[-1]['message'] == 'boom'
+
+    def test_completed_traces_are_bounded(self):
+        """Test that only the most recent completed traces are kept"""
+        tracing = TracingMiddleware()
+        traces = [tracing.start_trace(f"op_{i}") for i in range(tracing.max_completed_traces + 10)]
+        for trace in traces:
+            tracing.finish_trace(trace.trace_id)
+
+        completed = tracing.get_completed_traces()
+
+        assert len(completed) == tracing.max_completed_traces
+        assert completed[0] is traces[10]
+
+    def test_concurrent_traces(self):
+        """Test that traces from many threads are all tracked"""
+        tracing = TracingMiddleware()
+
+        def run_traces():
+            for _ in range(100):
+                trace = tracing.start_trace("concurrent")
+                tracing.add_trace_tag(trace.trace_id, 'thread', threading.current_thread().name)
+                tracing.finish_trace(trace.trace_id)
+
+        threads = [threading.Thread(target=run_traces) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        summary = tracing.get_trace_summary()
+        assert summary['active_traces'] == 0
+        assert summary['completed_traces'] == 800
+
+    def test_trace_ids_are_unique(self):
+        """Test that trace and span ids never repeat"""
+        tracing = TracingMiddleware()
+        traces = [tracing.start_trace("ids") for _ in range(100)]
+
+        ids = {t.trace_id for t in traces} | {t.span_id for t in traces}
+
+        assert len(ids) == 200
+
+    def test_tracing_middleware_singleton(self):
+        """Test that the global tracing middleware is created once"""
+        assert get_tracing_middleware() is get_tracing_middleware()
+
+    def test_trace_to_dict_matches_asdict(self):
+        """Test that the hand-written trace serialization covers every field"""
+        tracing = TracingMiddleware()
+        trace = tracing.start_trace("serialize")
+        tracing.add_trace_log(trace.trace_id, 'info', 'hello', step=1)
+
+        assert trace.to_dict() == asdict(trace)
+
+    def test_evicted_traces_keep_their_data(self):
+        """Test that a trace a caller still holds is never reset or handed out again"""
+        tracing = TracingMiddleware()
+        tracing.max_completed_traces = 2
+        tracing.completed_traces = deque(maxlen=2)
+        held = tracing.start_trace("held")
+        tracing.finish_trace(held.trace_id, "error", "boom")
+        started = [tracing.start_trace("churn") for _ in range(20)]
+        for trace in started:
+            tracing.finish_trace(trace.trace_id)
+
+        assert held.tags['status'] == 'error'
+        assert held.logs[0]['message'] == 'boom'
+        assert all(trace is not held for trace in started)
+
+
+class TestPerformanceInterceptor:
+    """Test cases for PerformanceInterceptor"""
+
+    def test_method_stats_keep_last_100(self):
+        """Test that per-method statistics cover the last 100 calls"""
+        interceptor = PerformanceInterceptor(MagicMock())
+        for i in range(150):
+            interceptor._record_method_performance("Agent.execute_task", i * 1_000_000_000, True)
+
+        stats = interceptor.get_method_stats()["Agent.execute_task"]
+
+        assert stats['count'] == 100
+        assert stats['min_duration'] == 50.0
+        assert stats['max_duration'] == 149.0
+        assert stats['avg_duration'] == pytest.approx(99.5)
+
+    def test_intercepted_method_records_by_class_and_name(self):
+        """Test that intercepted calls are keyed by class and method name"""
+        class Worker:
+            pass
+
+        collector = MagicMock()
+        interceptor = PerformanceInterceptor(collector)
+        method = interceptor.intercept_method(Worker(), "run", lambda x: x * 2)
+
+        assert method(21) == 42
+        assert interceptor.get_method_stats()["Worker.run"]['count'] == 1
+        (request,) = collector.record_api_requests.call_args.args[0]
+        assert request[:3] == ('method_call', "Worker.run", 200)
+
+    def test_stop_delivers_buffered_and_later_calls(self):
+        """Test that stop flushes buffered calls and later calls are not stranded"""
+        class Worker:
+            pass
+
+        collector = MagicMock()
+        interceptor = PerformanceInterceptor(collector)
+        method = interceptor.intercept_method(Worker(), "run", lambda: None)
+
+        def delivered():
+            return sum(len(c.args[0]) for c in collector.record_api_requests.call_args_list)
+
+        for _ in range(3):
+            method()
+        interceptor.stop()
+        assert delivered() == 3
+        assert interceptor._stopped
+        assert interceptor.FLUSH_THRESHOLD == PerformanceInterceptor.FLUSH_THRESHOLD
+
+        method()
+        assert delivered() == 4
+
+    def test_intercepted_error_is_recorded(self):
+        """Test that failing calls record the exception type and re-raise"""
+        class Worker:
+            pass
+
+        def fail():
+            raise KeyError("missing")
+
+        collector = MagicMock()
+        interceptor = PerformanceInterceptor(collector)
+        method = interceptor.intercept_method(Worker(), "run", fail)
+
+        with pytest.raises(KeyError):
+            method()
+
+        assert collector.record_errors.call_args.args[0] == [("KeyError", "Worker", 'error')]
+        assert collector.record_api_requests.call_args.args[0][0][2] == 500
+
+    def test_metrics_are_flushed_in_batches(self):
+        """Test that collector calls are buffered until the batch threshold"""
+        class Worker:
+            pass
+
+        collector = MagicMock()
+        interceptor = PerformanceInterceptor(collector)
+        method = interceptor.intercept_method(Worker(), "run", lambda: None)
+        method()  # first call flushes and starts the interval
+        collector.reset_mock()
+
+        for _ in range(interceptor.FLUSH_THRESHOLD - 1):
+            method()
+        collector.record_api_requests.assert_not_called()
+
+        method()
+        assert len(collector.record_api_requests.call_args.args[0]) == interceptor.FLUSH_THRESHOLD
+
+    def test_flush_metrics_drains_other_threads(self):
+        """Test that an explicit flush sends calls buffered by any thread"""
+        class Worker:
+            pass
+
+        collector = MagicMock()
+        interceptor = PerformanceInterceptor(collector)
+        method = interceptor.intercept_method(Worker(), "run", lambda: None)
+
+        def run_calls():
+            for _ in range(10):
+                method()
+
+        threads = [threading.Thread(target=run_calls) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        interceptor.flush_metrics()
+
+        recorded = sum(len(c.args[0]) for c in collector.record_api_requests.call_args_list)
+        assert recorded == 40
+
+    def test_flush_tolerates_buffer_drained_concurrently(self):
+        """Test that a flush racing another drain of the same buffer does not fail the call"""
+        class Worker:
+            pass
+
+        class DrainedElsewhere(deque):
+            """Reports one entry more than it holds, as if another thread just took it"""
+            def __len__(self):
+                return super().__len__() + 1
+
+        collector = MagicMock()
+        interceptor = PerformanceInterceptor(collector)
+        method = interceptor.intercept_method(Worker(), "run", lambda: "ok")
+        interceptor._get_buffer().requests = DrainedElsewhere()
+
+        assert method() == "ok"
+        (request,) = collector.record_api_requests.call_args.args[0]
+        assert request[2] == 200
+
+    def test_sweep_flushes_idle_buffers_and_drops_exited_threads(self):
+        """Test that the sweep delivers stale metrics and forgets finished threads"""
+        class Worker:
+            pass
+
+        collector = MagicMock()
+        interceptor = PerformanceInterceptor(collector)
+        method = interceptor.intercept_method(Worker(), "run", lambda: None)
+        method()  # first call flushes and starts the interval
+        method()
+        collector.reset_mock()
+
+        thread = threading.Thread(target=method)
+        thread.start()
+        thread.join()
+        interceptor._buffers[0].deadline_ns = 0
+        interceptor._sweep_buffers()
+
+        recorded = sum(len(c.args[0]) for c in collector.record_api_requests.call_args_list)
+        assert recorded == 2
+        assert [b.owner for b in interceptor._buffers] == [threading.current_thread()]
+        interceptor.stop()
+
+
+class TestMethodStats:
+    """Test cases for MethodStats"""
+
+    def test_window_matches_recomputed_stats(self):
+        """Test that incremental stats equal a full recomputation of the window"""
+        stats = MethodStats(window=10)
+        rng = random.Random(7)
+        recorded = []
+        for _ in range(200):
+            duration = rng.randint(1, 1000)
+            stats.record(duration)
+            recorded.append(duration)
+
+            window = recorded[-10:]
+            summary = stats.summary()
+            assert summary['count'] == len(window)
+            assert summary['total_duration'] == pytest.approx(sum(window) / 1e9)
+            assert summary['min_duration'] == min(window) / 1e9
+            assert summary['max_duration'] == max(window) / 1e9
+
+
+class TestInstrumentationSwitches:
+    """Test cases for the runtime tracing and interception switches"""
+
+    def test_disabled_tracing_skips_trace(self):
+        """Test that disabled tracing calls the function without tracing"""
+        @traced("switch_test")
+        def add(a, b):
+            return a + b
+
+        tracing = get_tracing_middleware()
+        before = tracing.get_trace_summary()['total_traces']
+        set_tracing_enabled(False)
+        try:
+            assert add(1, 2) == 3
+        finally:
+            set_tracing_enabled(True)
+
+        assert tracing.get_trace_summary()['total_traces'] == before
+
+    def test_disabled_interception_skips_metrics(self):
+        """Test that disabled interception records nothing"""
+        collector = MagicMock()
+        interceptor = PerformanceInterceptor(collector)
+        method = interceptor.intercept_method(object(), "noop", lambda: "done")
+
+        set_interception_enabled(False)
+        try:
+            assert method() == "done"
+        finally:
+            set_interception_enabled(True)
+
+        assert interceptor.get_method_stats() == {}
+        collector.record_api_request.assert_not_called()
+
+
+class TestResourceMonitor:
+    """Test cases for ResourceMonitor"""
+
+    def test_current_usage_reuses_recent_sample(self):
+        """Test that back-to-back usage reads share one psutil sample"""
+        monitor = ResourceMonitor()
+        ResourceMonitor._last_sample = (float('-inf'), {})
+
+        with patch("psutil.virtual_memory") as virtual_memory, \
+                patch("psutil.cpu_percent", return_value=12.5):
+            virtual_memory.return_value = MagicMock(used=1024, percent=50.0)
+            first = monitor.get_current_usage()
+            second = ResourceMonitor().get_current_usage()
+
+        assert virtual_memory.call_count == 1
+        assert first == second
+        assert first['cpu_percent'] == 12.5
+        assert first is not second
+
+    def test_usage_since_diffs_against_start_sample(self):
+        """Test that task usage is the process delta since the sample taken at task start"""
+        monitor = ResourceMonitor()
+        process = MagicMock()
+        process.cpu_times.side_effect = [MagicMock(user=1.0, system=0.5), MagicMock(user=2.0, system=1.0)]
+        process.memory_info.side_effect = [MagicMock(rss=1000), MagicMock(rss=3000)]
+        monitor._process = process
+
+        with patch("time.monotonic", side_effect=[10.0, 12.0]):
+            start = monitor.sample_process_usage()
+            cpu_percent, memory_delta = monitor.usage_since(start)
+
+        assert cpu_percent == pytest.approx(75.0)
+        assert memory_delta == 2000.0
+
+
+class TestOrchestratorMonitoringMixin:
+    """Test cases for OrchestratorMonitoringMixin"""
+
+    def test_execute_task_with_monitoring_starts_one_trace(self):
+        """Test that a monitored task execution creates a single trace"""
+        orchestrator = OrchestratorMonitoringMixin.__new__(OrchestratorMonitoringMixin)
+        orchestrator.metrics_collector = MagicMock()
+        orchestrator.tracing = TracingMiddleware()
+        orchestrator.execute_task = MagicMock(return_value=MagicMock(agent_id="agent_000", status="success"))
+        task = MagicMock(task_id="task_1", task_type="analysis", priority=5, queue_time=0.0)
+
+        orchestrator.execute_task_with_monitoring(task)
+
+        completed = orchestrator.tracing.get_completed_traces()
+        assert [t.operation_name for t in completed] == ["task_execution_analysis"]
+        assert completed[0].tags['task_id'] == "task_1"
+        assert completed[0].tags['status'] == "success"
+
+    def test_execute_task_with_monitoring_handles_bare_results(self):
+        """Test that tasks and results without optional attributes still record"""
+        orchestrator = OrchestratorMonitoringMixin.__new__(OrchestratorMonitoringMixin)
+        orchestrator.metrics_collector = MagicMock()
+        orchestrator.tracing = TracingMiddleware()
+        orchestrator.execute_task = MagicMock(return_value=object())
+        task = MagicMock(spec=['task_id', 'task_type'], task_id="task_1", task_type="analysis")
+
+        orchestrator.execute_task_with_monitoring(task)
+
+        start = orchestrator.metrics_collector.record_task_start.call_args.kwargs
+        assert (start['priority'], start['queue_time']) == (5, 0.0)
+        orchestrator.metrics_collector.record_task_completion.assert_called_once_with("task_1", 'unknown')
+
+    def test_execute_task_with_monitoring_records_real_task(self):
+        """Test that a real Task that was never queued records a zero queue time"""
+        orchestrator = OrchestratorMonitoringMixin.__new__(OrchestratorMonitoringMixin)
+        orchestrator.metrics_collector = MetricsCollector(enable_prometheus=False)
+        orchestrator.tracing = TracingMiddleware()
+        orchestrator.execute_task = MagicMock(return_value=MagicMock(agent_id="agent_000", status="success"))
+
+        orchestrator.execute_task_with_monitoring(Task(task_id="task_1", task_type="analysis"))
+
+        assert orchestrator.metrics_collector.task_metrics["task_1"].queue_time == 0.0
+        summary = orchestrator.metrics_collector.get_metrics_summary()
+        assert summary['task_metrics']['total'] == 1
+        assert summary['task_metrics']['avg_queue_time'] == 0.0
+
+
+class TestAgentMonitoringMixin:
+    """Test cases for AgentMonitoringMixin"""
+
+    def test_status_updates_report_current_health_failures(self):
+        """Test that health check failures during a task show up in the completion update"""
+        agent = AgentMonitoringMixin.__new__(AgentMonitoringMixin)
+        agent.agent_id = "agent_000"
+        agent.health_check_failed = 0
+        agent.metrics_collector = MagicMock()
+        agent.tracing = TracingMiddleware()
+        agent.resource_monitor = MagicMock(**{'usage_since.return_value': (0.0, 0)})
+
+        def execute_task(task):
+            agent.health_check_failed = 2
+            return MagicMock(status="success")
+
+        agent.execute_task = execute_task
+        agent.execute_task_with_monitoring(MagicMock(task_id="task_1", task_type="analysis"))
+
+        updates = [c.kwargs['health_failures'] for c in agent.metrics_collector.update_agent_status.call_args_list]
+        assert updates == [0, 2]
+        start_sample = agent.resource_monitor.sample_process_usage.return_value
+        agent.resource_monitor.usage_since.assert_called_once_with(start_sample)
+
+    def test_spans_inside_task_nest_under_task_trace(self):
+        """Test that traced calls made by the task use the task trace as parent"""
+        agent = AgentMonitoringMixin.__new__(AgentMonitoringMixin)
+        agent.agent_id = "agent_000"
+        agent.metrics_collector = MagicMock()
+        agent.tracing = get_tracing_middleware()
+        agent.resource_monitor = MagicMock(**{'usage_since.return_value': (0.0, 0)})
+        seen = {}
+
+        @traced("inner.step")
+        def step():
+            seen['inner'] = get_current_trace()
+
+        def execute_task(task):
+            seen['task'] = get_current_trace()
+            step()
+            return MagicMock(status="success")
+
+        agent.execute_task = execute_task
+        agent.execute_task_with_monitoring(MagicMock(task_id="task_1", task_type="analysis"))
+
+        assert seen['task'].operation_name == "agent_task_analysis"
+        assert seen['inner'].parent_span_id == seen['task'].span_id
+        assert get_current_trace() is None
+
+    def test_stop_stops_interceptor_after_agent(self):
+        """Test that stopping a monitored agent flushes its method metrics"""
+        calls = []
+
+        class Agent:
+            def stop(self):
+                calls.append('agent')
+
+        class Monitored(AgentMonitoringMixin, Agent):
+            pass
+
+        agent = Monitored.__new__(Monitored)
+        agent.performance_interceptor = MagicMock(**{'stop.side_effect': lambda: calls.append('interceptor')})
+
+        agent.stop()
+
+        assert calls == ['agent', 'interceptor']
+
+
+class TestMonitoringReport:
+    """Test cases for generate_monitoring_report"""
+
+    def test_report_is_json(self):
+        """Test that the monitoring report serializes to JSON"""
+        collector = MagicMock()
+        collector.get_metrics_summary.return_value = {'tasks': {'total': 3}}
+        collector.enable_prometheus = False
+
+        report = json.loads(generate_monitoring_report(collector))
+
+        assert report['metrics_summary'] == {'tasks': {'total': 3}}
+        assert report['prometheus_available'] is False
+        assert 'tracing_summary' in report
+
+
+class TestTracedDecorator:
+    """Test cases for the traced decorator"""
+
+    def test_current_trace_propagates_to_nested_calls(self):
+        """Test that nested traced calls see and link to the enclosing trace"""
+        tracing = get_tracing_middleware()
+        seen = {}
+
+        @traced("inner")
+        def inner():
+            seen['inner'] = get_current_trace()
+            tracing.add_current_trace_tag('step', 'inner')
+
+        @traced("outer")
+        def outer():
+            seen['outer'] = get_current_trace()
+            inner()
+            assert get_current_trace() is seen['outer']
+
+        outer()
+
+        assert get_current_trace() is None
+        assert seen['inner'].parent_span_id == seen['outer'].span_id
+        assert seen['inner'].tags['step'] == 'inner'
+        assert seen['outer'].tags['status'] == 'success'
+
+    def test_include_args_tags_argument_counts(self):
+        """Test that only include_args wrappers tag argument counts"""
+        seen = {}
+
+        @traced(include_args=True)
+        def with_args(a, b, c=None):
+            seen['with_args'] = get_current_trace()
+
+        @traced()
+        def without_args(a):
+            seen['without_args'] = get_current_trace()
+
+        with_args(1, 2, c=3)
+        without_args(1)
+
+        assert seen['with_args'].tags['args_count'] == '2'
+        assert seen['with_args'].tags['kwargs_count'] == '1'
+        assert seen['with_args'].operation_name.endswith('.with_args')
+        assert with_args.__name__ == 'with_args'
+        assert 'args_count' not in seen['without_args'].tags
+        assert seen['without_args'].tags['function'] == 'without_args'
@@ -2,12 +2,20 @@
 Unit tests for the Orchestrator class
 """
 
+import asyncio
+import itertools
+import json
+import os
 import pytest
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future
 from unittest.mock import MagicMock, patch, mock_open
 import yaml
 
 from conductor import Orchestrator, Task, TaskResult, create_task
+from conductor.exceptions import TaskValidationError
 
 
 class TestOrchestrator:
@@ -18,7 +26,7 @@ class TestOrchestrator:
         orchestrator = Orchestrator()
         
         assert orchestrator.config["num_agents"] == 3
-        assert orchestrator.config["max_workers"] == 10
+        assert orchestrator.config["max_workers"] == min(32, (os.cpu_count() or 1) * 5)
         assert orchestrator.config["task_timeout"] == 300
         assert len(orchestrator.agents) == 0
         assert len(orchestrator.results) == 0
@@ -324,6 +332,408 @@ class TestOrchestrator:
         assert "avg_execution_time" in stats
 
 
+class TestConfigCache:
+    """Test cases for the parsed config file cache"""
+    
+    def test_unchanged_file_parsed_once(self, tmp_path):
+        """Test that reloading an unchanged file reuses the parse until it changes"""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("num_agents: 4\nsecurity:\n  audit_enabled: false\n")
+        
+        with patch("conductor.orchestrator.yaml.load", wraps=yaml.load) as load:
+            first = Orchestrator(str(config_path))
+            first.config["security"]["audit_enabled"] = True
+            second = Orchestrator(str(config_path))
+            assert load.call_count == 1
+            assert second.config["security"]["audit_enabled"] is False
+            
+            config_path.write_text("num_agents: 6\n")
+            os.utime(config_path, ns=(0, 0))
+            assert Orchestrator(str(config_path)).config["num_agents"] == 6
+            assert load.call_count == 2
+
+
+class TestWorkerPoolSizing:
+    """Test cases for orchestrator worker pool sizing"""
+    
+    def test_max_workers_scales_with_configured_factors(self, tmp_path):
+        """Test that the default pool size follows workers_per_cpu and the cap"""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("workers_per_cpu: 100\nmax_workers_cap: 7\n")
+        
+        orchestrator = Orchestrator(str(config_path))
+        
+        assert orchestrator.config["max_workers"] == 7
+    
+    def test_set_max_workers_resizes_pool(self):
+        """Test that the pool keeps running tasks after growing and shrinking"""
+        orchestrator = Orchestrator()
+        orchestrator.set_max_workers(1)
+        assert orchestrator.executor.submit(lambda: "first").result(timeout=5) == "first"
+        
+        orchestrator.set_max_workers(3)
+        futures = [orchestrator.executor.submit(lambda i=i: i) for i in range(6)]
+        assert sorted(f.result(timeout=5) for f in futures) == list(range(6))
+        
+        orchestrator.set_max_workers(2)
+        futures = [orchestrator.executor.submit(lambda i=i: i) for i in range(6)]
+        assert sorted(f.result(timeout=5) for f in futures) == list(range(6))
+        assert orchestrator.config["max_workers"] == 2
+        orchestrator.executor.shutdown(wait=True)
+
+
+class TestAgentPool:
+    """Test cases for idle agent selection"""
+    
+    @staticmethod
+    def make_orchestrator(num_agents):
+        """Create an orchestrator with mock agents in the idle pool"""
+        orchestrator = Orchestrator()
+        for i in range(num_agents):
+            agent_id = f"agent_{i:03d}"
+            agent = MagicMock(agent_id=agent_id, is_running=True)
+            agent.execute_task.side_effect = lambda task, agent_id=agent_id: TaskResult(
+                task.task_id, agent_id, "success", {}
+            )
+            orchestrator.agents[agent_id] = agent
+            orchestrator._mark_idle(agent_id)
+        orchestrator._agent_cycle = itertools.cycle(list(orchestrator.agents))
+        return orchestrator
+    
+    def test_no_agent_when_all_busy(self):
+        """Test that busy agents are not handed out unless sharing is configured"""
+        orchestrator = self.make_orchestrator(1)
+        
+        assert orchestrator._find_available_agent().agent_id == "agent_000"
+        assert orchestrator._find_available_agent() is None
+        assert orchestrator._busy_agents == {"agent_000": 1}
+    
+    def test_idle_agents_before_busy_ones(self):
+        """Test that idle agents are used first, then busy ones round-robin when shared"""
+        orchestrator = self.make_orchestrator(2)
+        orchestrator.config["share_busy_agents"] = True
+        
+        picked = [orchestrator._find_available_agent().agent_id for _ in range(4)]
+        
+        assert picked[:2] == ["agent_000", "agent_001"]
+        assert sorted(picked[2:]) == ["agent_000", "agent_001"]
+    
+    def test_agent_idle_again_after_last_task(self):
+        """Test that a shared agent returns to the pool only when all its tasks finish"""
+        orchestrator = self.make_orchestrator(1)
+        orchestrator.config["share_busy_agents"] = True
+        orchestrator._find_available_agent()
+        orchestrator._find_available_agent()
+        
+        orchestrator._release_agent("agent_000")
+        assert not orchestrator._idle_agents
+        orchestrator._release_agent("agent_000")
+        assert list(orchestrator._idle_agents) == ["agent_000"]
+        
+    def test_agent_queued_as_idle_once(self):
+        """Test that marking an already idle agent does not queue it twice"""
+        orchestrator = self.make_orchestrator(2)
+        orchestrator._mark_idle("agent_000")
+        orchestrator._release_agent("agent_001")
+        
+        assert list(orchestrator._idle_agents) == ["agent_000", "agent_001"]
+        assert orchestrator._find_available_agent().agent_id == "agent_000"
+        assert orchestrator._idle_set == {"agent_001"}
+
+
+class TestSubmitBatch:
+    """Test cases for batched task submission"""
+    
+    def test_batch_results_match_tasks(self):
+        """Test that every task gets its own result and agents are released"""
+        orchestrator = TestAgentPool.make_orchestrator(2)
+        orchestrator.enable_evaluation = False
+        tasks = [Task(task_id=f"t{i}") for i in range(20)] + [Task(task_id="bad", priority=11)]
+        
+        futures = orchestrator.submit_batch(tasks)
+        results = orchestrator.wait_for_batch(futures, timeout=5)
+        
+        assert [r.task_id for r in results[:20]] == [f"t{i}" for i in range(20)]
+        assert all(r.status == "success" for r in results[:20])
+        assert results[20].status == "failed"
+        assert sorted(orchestrator._idle_agents) == ["agent_000", "agent_001"]
+        assert not orchestrator._busy_agents
+        
+    def test_idle_agent_steals_from_slow_agent(self):
+        """Test that a fast agent takes over tasks queued for a slow one"""
+        orchestrator = TestAgentPool.make_orchestrator(2)
+        orchestrator.enable_evaluation = False
+        
+        def slow(task):
+            time.sleep(0.05)
+            return TaskResult(task.task_id, "agent_000", "success", {})
+            
+        orchestrator.agents["agent_000"].execute_task.side_effect = slow
+        
+        futures = orchestrator.submit_batch([Task(task_id=f"t{i}") for i in range(20)])
+        results = orchestrator.wait_for_batch(futures, timeout=5)
+        
+        assert sum(r.agent_id == "agent_001" for r in results) > 10
+        
+    def test_invalid_batch_task_reported_to_error_handler(self):
+        """Test that batch validation errors go through the error handler"""
+        orchestrator = TestAgentPool.make_orchestrator(1)
+        orchestrator.enable_evaluation = False
+        orchestrator.error_handler = MagicMock()
+        
+        futures = orchestrator.submit_batch([Task(task_id="bad", priority=11)])
+        
+        with pytest.raises(TaskValidationError):
+            futures[0].result(timeout=1)
+        operation, error = orchestrator.error_handler.handle_error.call_args.args
+        assert operation == "submit_batch"
+        assert error is futures[0].exception()
+        
+    def test_steal_skips_victim_emptied_before_lock(self):
+        """Test that a thief moves on when the chosen victim was just emptied"""
+        class StaleDeque(deque):
+            def __bool__(self):
+                return True
+                
+        orchestrator = Orchestrator()
+        entry = (Task(task_id="t1"), Future())
+        queues = [deque(), StaleDeque(), deque([entry])]
+        locks = [threading.Lock() for _ in queues]
+        agent_ids = ["agent_000", "agent_001", "agent_002"]
+        
+        assert orchestrator._steal_batch_entries(0, queues, locks, agent_ids) == [entry]
+        assert orchestrator._steal_batch_entries(0, queues, locks, agent_ids) is None
+        
+    def test_steal_size_follows_recent_steals(self):
+        """Test that steal sizes start small and adapt to the victim's history"""
+        orchestrator = Orchestrator()
+        assert orchestrator._steal_batch_size("agent_000") == orchestrator.DEFAULT_STEAL
+        
+        orchestrator._steal_history["agent_000"].extend([6] * orchestrator.STEAL_HISTORY_MIN)
+        orchestrator._steal_history["agent_001"].extend([1] * orchestrator.STEAL_HISTORY_MIN)
+        
+        assert orchestrator._steal_batch_size("agent_000") == orchestrator.MAX_STEAL
+        assert orchestrator._steal_batch_size("agent_001") == 2
+        
+    def test_steal_size_reads_history_while_thieves_append(self):
+        """Test that sizing a steal is safe while other workers record steals"""
+        orchestrator = Orchestrator()
+        queues = [deque(), deque((Task(task_id=f"t{i}"), Future()) for i in range(20000))]
+        locks = [threading.Lock() for _ in queues]
+        agent_ids = ["agent_000", "agent_001"]
+        errors = []
+        
+        def steal():
+            while orchestrator._steal_batch_entries(0, queues, locks, agent_ids):
+                pass
+                
+        def size():
+            try:
+                while queues[1]:
+                    orchestrator._steal_batch_size("agent_001")
+            except RuntimeError as e:
+                errors.append(e)
+                
+        threads = [threading.Thread(target=steal), threading.Thread(target=size)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+            
+        assert errors == []
+        assert orchestrator._steal_history["agent_001"]
+
+
+class TestBackgroundEvaluation:
+    """Test cases for background task evaluation"""
+    
+    def test_evaluations_share_one_bounded_loop(self):
+        """Test that evaluations run on one loop with limited concurrency"""
+        orchestrator = Orchestrator()
+        orchestrator.config["max_concurrent_evaluations"] = 2
+        running = []
+        peak = []
+        
+        async def evaluate(task, result):
+            running.append(task.task_id)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(task.task_id)
+            return MagicMock(overall_score=90.0)
+        
+        orchestrator._evaluate_task_result = evaluate
+        futures = [
+            orchestrator._run_evaluation(Task(task_id=f"t{i}"), TaskResult(f"t{i}", "agent_000", "success", {}))
+            for i in range(5)
+        ]
+        for future in futures:
+            future.result(timeout=5)
+        loop = orchestrator._get_eval_loop()
+        assert orchestrator._get_eval_loop() is loop
+        orchestrator.stop()
+        
+        assert max(peak) == 2
+        assert loop.is_closed()
+        assert (orchestrator._eval_loop, orchestrator._eval_thread, orchestrator._eval_semaphore) == (None, None, None)
+    
+    def test_stop_cancels_running_evaluations(self):
+        """Test that stop() cancels unfinished evaluations and closes the loop"""
+        orchestrator = Orchestrator()
+        started = threading.Event()
+        
+        async def evaluate(task, result):
+            started.set()
+            await asyncio.sleep(60)
+        
+        orchestrator._evaluate_task_result = evaluate
+        future = orchestrator._run_evaluation(Task(task_id="slow"), TaskResult("slow", "agent_000", "success", {}))
+        assert started.wait(5)
+        loop = orchestrator._eval_loop
+        orchestrator.stop()
+        
+        assert future.cancelled()
+        assert loop.is_closed()
+
+
+class TestExecuteTaskErrors:
+    """Test cases for failed task handling in _execute_task"""
+    
+    def test_failed_result_is_counted_and_stored(self):
+        """Test that a failed agent result is recorded rather than raising"""
+        orchestrator = Orchestrator()
+        agent = MagicMock(agent_id="agent_000")
+        agent.execute_task.return_value = TaskResult("t1", "agent_000", "failed", {}, error="boom")
+        
+        result = orchestrator._execute_task(Task(task_id="t1"), agent, "corr")
+        
+        assert result.status == "failed"
+        assert orchestrator.stats.tasks_failed == 1
+        assert orchestrator.get_task_result("t1") is result
+        
+    def test_agent_exception_becomes_failed_result(self):
+        """Test that an agent exception is stored as an orchestrator failure"""
+        orchestrator = Orchestrator()
+        agent = MagicMock(agent_id="agent_000")
+        agent.execute_task.side_effect = RuntimeError("crashed")
+        
+        result = orchestrator._execute_task(Task(task_id="t2"), agent, "corr")
+        
+        assert (result.status, result.agent_id) == ("failed", "orchestrator")
+        assert orchestrator.stats.tasks_failed == 1
+        assert orchestrator.get_task_result("t2") is result
+
+
+class TestResultJson:
+    """Test cases for cached JSON task results"""
+    
+    def test_results_json_matches_stored_results(self):
+        """Test that cached encodings decode to the stored results"""
+        orchestrator = Orchestrator()
+        first = TaskResult("t1", "agent_000", "success", {"lines": 3})
+        second = TaskResult("t2", "agent_001", "failed", {}, error="boom")
+        orchestrator._store_result("t1", first)
+        orchestrator._store_result("t2", second)
+        
+        assert json.loads(orchestrator.get_task_result_json("t1")) == first.to_dict()
+        assert json.loads(orchestrator.get_results_json()) == [first.to_dict(), second.to_dict()]
+        assert json.loads(orchestrator.get_results_json(["t2", "missing"])) == [second.to_dict()]
+        
+    def test_results_json_accepts_non_string_keys(self):
+        """Test that result payloads with int keys encode like the stdlib would"""
+        orchestrator = Orchestrator()
+        orchestrator._store_result("ints", TaskResult("ints", "agent_000", "success", {1: "x"}))
+        
+        assert json.loads(orchestrator.get_task_result_json("ints"))["result"] == {"1": "x"}
+        
+    def test_results_json_cache_is_bounded_and_tracks_replacements(self):
+        """Test that the encoding cache stays bounded and re-encodes replaced results"""
+        orchestrator = Orchestrator()
+        orchestrator._results_json_max = 2
+        for task_id in ("a", "b", "c"):
+            orchestrator._store_result(task_id, TaskResult(task_id, "agent_000", "success", {}))
+            orchestrator.get_task_result_json(task_id)
+            
+        assert list(orchestrator._results_json) == ["b", "c"]
+        orchestrator._store_result("c", TaskResult("c", "agent_000", "failed", {}))
+        assert json.loads(orchestrator.get_task_result_json("c"))["status"] == "failed"
+        
+    def test_results_are_written_by_one_flusher_thread(self):
+        """Test that results stored from many threads are applied by the flusher"""
+        orchestrator = Orchestrator()
+        writers = []
+        original_apply = orchestrator._apply_completion
+        
+        def apply(item):
+            writers.append(threading.current_thread().name)
+            original_apply(item)
+            
+        orchestrator._apply_completion = apply
+        
+        def store(offset):
+            for i in range(100):
+                task_id = f"t{offset + i}"
+                orchestrator._store_result(task_id, TaskResult(task_id, "agent_000", "success", {}))
+                
+        threads = [threading.Thread(target=store, args=(n * 100,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        orchestrator._stop_flusher()
+        
+        assert len(orchestrator.results) == 400
+        assert len(json.loads(orchestrator.get_results_json())) == 400
+        assert set(writers) <= {"orchestrator-results", "MainThread"}
+        assert orchestrator._flusher is None
+        
+    def test_failed_store_does_not_stop_flusher(self):
+        """Test that a result the store rejects is logged and later results still land"""
+        orchestrator = Orchestrator()
+        store = MagicMock(wraps={})
+        store.__setitem__.side_effect = [RuntimeError("store down"), None]
+        orchestrator.results = store
+        
+        orchestrator._store_result("bad", TaskResult("bad", "agent_000", "success", {}))
+        orchestrator._store_result("good", TaskResult("good", "agent_000", "success", {}))
+        deadline = time.time() + 5
+        while store.__setitem__.call_count < 2 and time.time() < deadline:
+            time.sleep(0.01)
+            
+        assert store.__setitem__.call_count == 2
+        assert orchestrator._flusher.is_alive()
+        orchestrator._stop_flusher()
+
+
+class TestWaitForBatch:
+    """Test cases for collecting batch results"""
+    
+    def test_results_keep_submission_order(self):
+        """Test that results follow the futures' order, not completion order"""
+        orchestrator = Orchestrator()
+        slow, fast, failing = Future(), Future(), Future()
+        fast.set_result(TaskResult("fast", "agent_001", "success", {}))
+        failing.set_exception(RuntimeError("boom"))
+        slow.set_result(TaskResult("slow", "agent_000", "success", {}))
+        
+        results = orchestrator.wait_for_batch([slow, fast, failing])
+        
+        assert [r.task_id for r in results] == ["slow", "fast", "unknown"]
+        assert results[2].status == "failed"
+        assert results[2].error == "boom"
+        
+    def test_timeout_is_shared_by_the_batch(self):
+        """Test that unfinished futures fail once the batch deadline passes"""
+        orchestrator = Orchestrator()
+        done = Future()
+        done.set_result(TaskResult("done", "agent_000", "success", {}))
+        
+        start = time.time()
+        results = orchestrator.wait_for_batch([Future(), done, Future()], timeout=0.1)
+        
+        assert time.time() - start < 1.0
+        assert [r.status for r in results] == ["failed", "success", "failed"]
+
+
 class TestCreateTask:
     """Test cases for create_task helper function"""
     
@@ -363,4 +773,11 @@ class TestCreateTask:
         
         assert task.task_type == "refactor"
         assert task.parallel is True
-        assert task.subtasks == [{"type": "analysis"}]
\ No newline at end of file
+        assert task.subtasks == [{"type": "analysis"}]
+    
+    def test_create_task_generates_unique_ids(self):
+        """Test that tasks created without an id get distinct ids"""
+        tasks = [create_task() for _ in range(100)]
+        
+        assert len({task.task_id for task in tasks}) == 100
+        assert create_task(task_id="fixed").task_id == "fixed"
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""
+Unit tests for the standalone agent communication channel in src/
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+from src import agent_communication
+from src.agent_communication import (
+    AgentMessage, BatchingChannel, MessageType, UnixSocketChannel, get_peer_credentials
+)
+
+
+class TestUnixSocketChannel:
+    """Test cases for UnixSocketChannel"""
+
+    def test_messages_keep_boundaries(self, tmp_path):
+        """Test that back-to-back messages arrive as separate messages"""
+        socket_path = str(tmp_path / "channel.sock")
+        server = UnixSocketChannel(socket_path, is_server=True)
+        client = UnixSocketChannel(socket_path)
+        try:
+            for i in range(3):
+                client.send(AgentMessage(
+                    message_id=f"msg_{i}", sender_id="agent_000", receiver_id="orchestrator",
+                    message_type=MessageType.HEARTBEAT, payload={'i': i}, timestamp=time.time()
+                ))
+
+            received = [server.receive(timeout=2) for _ in range(3)]
+
+            assert [m.message_id for m in received] == ["msg_0", "msg_1", "msg_2"]
+        finally:
+            client.close()
+            server.close()
+
+    def test_peer_credentials_identify_process(self, tmp_path):
+        """Test that the server side can read the client's credentials"""
+        socket_path = str(tmp_path / "creds.sock")
+        server = UnixSocketChannel(socket_path, is_server=True)
+        client = UnixSocketChannel(socket_path)
+        try:
+            credentials = get_peer_credentials(client.socket)
+
+            assert credentials is None or credentials[:2] == (os.getpid(), os.getuid())
+        finally:
+            client.close()
+            server.close()
+
+    def test_client_refuses_server_of_another_user(self, tmp_path, monkeypatch):
+        """Test that a client does not talk to a server owned by a different uid"""
+        socket_path = str(tmp_path / "squatted.sock")
+        server = UnixSocketChannel(socket_path, is_server=True)
+        monkeypatch.setattr(agent_communication, "get_peer_credentials",
+                            lambda sock: (1, os.getuid() + 1, os.getgid()))
+        try:
+            with pytest.raises(PermissionError):
+                UnixSocketChannel(socket_path)
+        finally:
+            server.close()
+
+    @pytest.mark.skipif(not sys.platform.startswith('linux'), reason="abstract sockets are Linux-only")
+    def test_abstract_namespace_address(self):
+        """Test that a Linux abstract namespace address carries messages"""
+        socket_path = f"\0claude_test_{os.getpid()}_{time.monotonic_ns()}"
+        server = UnixSocketChannel(socket_path, is_server=True)
+        client = UnixSocketChannel(socket_path)
+        try:
+            client.send(AgentMessage(
+                message_id="msg", sender_id="agent_000", receiver_id="orchestrator",
+                message_type=MessageType.HEARTBEAT, payload={}, timestamp=time.time()
+            ))
+
+            assert server.receive(timeout=2).message_id == "msg"
+        finally:
+            client.close()
+            server.close()
+
+
+class TestBatchingChannel:
+    """Test cases for BatchingChannel"""
+
+    def test_batched_messages_arrive_in_order(self, tmp_path):
+        """Test that coalesced messages are split back out in send order"""
+        socket_path = str(tmp_path / "batch.sock")
+        server = UnixSocketChannel(socket_path, is_server=True)
+        client = BatchingChannel(UnixSocketChannel(socket_path), max_batch=4)
+        try:
+            for i in range(10):
+                client.send(AgentMessage(
+                    message_id=f"msg_{i}", sender_id="agent_000", receiver_id="orchestrator",
+                    message_type=MessageType.TASK_REQUEST, payload={'i': i}, timestamp=time.time()
+                ))
+            client.flush()
+
+            received = [server.receive(timeout=2) for _ in range(10)]
+
+            assert [m.message_id for m in received] == [f"msg_{i}" for i in range(10)]
+        finally:
+            client.close()
+            server.close()
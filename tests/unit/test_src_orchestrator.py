@@ -0,0 +1,598 @@
+"""
+Unit tests for the standalone orchestrator in src/
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from unittest.mock import MagicMock, patch
+
+from src.agent_communication import BatchingChannel
+from src.orchestrator import AsyncOrchestrator, ClaudeAgent, Orchestrator, Task, TaskResult, format_status_json
+
+
+def make_orchestrator(num_agents: int = 1, orchestrator_class=Orchestrator) -> Orchestrator:
+    """Create an orchestrator with mock agents and no containers"""
+    orchestrator = orchestrator_class()
+    for i in range(num_agents):
+        agent = MagicMock(agent_id=f"agent_{i:03d}", is_running=True, current_task=None)
+        agent.execute_task.side_effect = lambda task, agent_id=agent.agent_id: TaskResult(
+            task_id=task.task_id, agent_id=agent_id, status="success", result={}, execution_time=1.0
+        )
+        orchestrator.agents[agent.agent_id] = agent
+        orchestrator._start_agent_worker(agent)
+        orchestrator._register_capabilities(agent)
+        orchestrator._release_agent(agent)
+    return orchestrator
+
+
+class TestTask:
+    """Test cases for Task"""
+
+    def test_from_subtask_inherits_parent_defaults(self):
+        """Test that subtask definitions fall back to the parent's settings"""
+        parent = Task(task_id="parent", task_type="analysis", priority=8, timeout=60.0)
+
+        subtask = Task.from_subtask(parent, 2, {'description': 'part', 'files': ['a.py']})
+
+        assert subtask.task_id == "parent_sub2"
+        assert (subtask.task_type, subtask.priority, subtask.timeout) == ("analysis", 8, 60.0)
+        assert (subtask.description, subtask.files) == ("part", ['a.py'])
+
+    def test_from_subtask_passes_tasks_through(self):
+        """Test that ready-made tasks are used as they are"""
+        ready = Task(task_id="ready")
+
+        assert Task.from_subtask(Task(task_id="parent"), 0, ready) is ready
+
+
+class TestTaskQueue:
+    """Test cases for the orchestrator priority queue"""
+
+    def test_pending_tasks_in_priority_order(self):
+        """Test that pending tasks list by priority, FIFO within a priority"""
+        orchestrator = make_orchestrator()
+        entries = [
+            orchestrator._enqueue_task(Task(task_id=task_id, priority=priority))
+            for task_id, priority in [("a", 5), ("b", 9), ("c", 5), ("d", 1)]
+        ]
+
+        assert [t.task_id for t in orchestrator.task_queue] == ["b", "a", "c", "d"]
+
+        orchestrator._dequeue_task(entries[0])
+        assert [t.task_id for t in orchestrator.task_queue] == ["b", "c", "d"]
+
+        for entry in entries[1:]:
+            orchestrator._dequeue_task(entry)
+        assert not any(orchestrator._task_buckets)
+        orchestrator._stop_agent_workers()
+
+    def test_highest_priority_waiter_gets_the_next_agent(self):
+        """Test that a freed agent goes to the highest-priority queued task, not the longest waiting"""
+        orchestrator = make_orchestrator()
+        agent = orchestrator._get_available_agent(timeout=0)
+        ran = []
+        agent.execute_task.side_effect = lambda task: ran.append(task.task_id) or TaskResult(
+            task_id=task.task_id, agent_id=agent.agent_id, status="success", result={}
+        )
+        threads = []
+        for task_id, priority in [("low", 1), ("high", 9)]:
+            thread = threading.Thread(
+                target=orchestrator.execute_task,
+                args=(Task(task_id=task_id, description=task_id, priority=priority, timeout=5),)
+            )
+            thread.start()
+            threads.append(thread)
+            while task_id not in [t.task_id for t in orchestrator.task_queue]:
+                time.sleep(0.01)
+
+        assert len(orchestrator.task_queue) == 2
+        assert orchestrator.task_queue[0].task_id == "high"
+        orchestrator._release_agent(agent)
+        for thread in threads:
+            thread.join(5)
+
+        assert ran == ["high", "low"]
+        orchestrator._stop_agent_workers()
+
+    def test_executed_task_leaves_queue(self):
+        """Test that execute_task does not leave the task queued"""
+        orchestrator = make_orchestrator()
+
+        result = orchestrator.execute_task(Task(task_id="t1"))
+
+        assert result.status == "success"
+        assert list(orchestrator.task_queue) == []
+        assert orchestrator.get_task_result("t1") is result
+        orchestrator._stop_agent_workers()
+
+
+class TestAgentWorkers:
+    """Test cases for the per-agent task queues"""
+
+    def test_idle_agent_steals_queued_work(self):
+        """Test that batch tasks queued on a busy agent are run by an idle one"""
+        orchestrator = make_orchestrator(num_agents=2)
+        busy, idle = orchestrator.agents.values()
+        release = threading.Event()
+        busy.execute_task.side_effect = lambda task: release.wait(5) and TaskResult(
+            task_id=task.task_id, agent_id=busy.agent_id, status="success", result={}
+        )
+
+        try:
+            assert orchestrator._get_available_agent(timeout=0) is busy
+            blocker, queued = orchestrator._dispatch_batch(busy, [Task(task_id="blocker"), Task(task_id="queued")])
+
+            assert queued.result(timeout=2).agent_id == idle.agent_id
+        finally:
+            release.set()
+            blocker.result(timeout=2)
+            orchestrator._stop_agent_workers()
+        assert set(orchestrator._idle_agents) == {busy.agent_id, idle.agent_id}
+
+    def test_thief_leaves_idle_set_while_running_stolen_task(self):
+        """Test that an agent running stolen work cannot be acquired meanwhile"""
+        orchestrator = make_orchestrator(num_agents=2)
+        busy, thief = orchestrator.agents.values()
+        release, stolen = threading.Event(), threading.Event()
+        busy.execute_task.side_effect = lambda task: release.wait(5) and TaskResult(
+            task_id=task.task_id, agent_id=busy.agent_id, status="success", result={}
+        )
+        thief.execute_task.side_effect = lambda task: stolen.set() or release.wait(5) and TaskResult(
+            task_id=task.task_id, agent_id=thief.agent_id, status="success", result={}
+        )
+
+        try:
+            orchestrator._get_available_agent(timeout=0)
+            futures = orchestrator._dispatch_batch(busy, [Task(task_id="a"), Task(task_id="b")])
+            assert stolen.wait(2)
+
+            assert orchestrator._get_available_agent(timeout=0) is None
+        finally:
+            release.set()
+            for future in futures:
+                future.result(timeout=2)
+            orchestrator._stop_agent_workers()
+
+    def test_single_dispatch_is_not_stolen(self):
+        """Test that a single dispatched task runs on the agent it was given to"""
+        orchestrator = make_orchestrator(num_agents=2)
+        busy, idle = orchestrator.agents.values()
+        release = threading.Event()
+        busy.execute_task.side_effect = lambda task: release.wait(5) and TaskResult(
+            task_id=task.task_id, agent_id=busy.agent_id, status="success", result={}
+        )
+
+        try:
+            blocker = orchestrator._submit(busy, Task(task_id="blocker"))
+            assert orchestrator._get_available_agent(timeout=0) is busy
+            queued = orchestrator._dispatch(busy, Task(task_id="queued"))
+
+            assert not queued.done()
+            assert idle.execute_task.call_count == 0
+            assert orchestrator._get_available_agent(timeout=0) is idle
+            release.set()
+            assert blocker.result(timeout=2).agent_id == busy.agent_id
+            assert queued.result(timeout=2).agent_id == busy.agent_id
+        finally:
+            release.set()
+            orchestrator._stop_agent_workers()
+
+    def test_stop_cancels_queued_tasks(self):
+        """Test that tasks still queued at stop are cancelled"""
+        orchestrator = make_orchestrator(num_agents=0)
+        agent = MagicMock(agent_id="agent_000")
+        orchestrator._agent_queues[agent.agent_id] = deque()
+        orchestrator._agent_signals[agent.agent_id] = threading.Semaphore(0)
+
+        future = orchestrator._submit(agent, Task(task_id="never_run"))
+        orchestrator._stop_agent_workers()
+
+        assert future.cancelled()
+
+
+class TestClaudeAgent:
+    """Test cases for ClaudeAgent"""
+
+    @patch('src.orchestrator.threading.Thread')
+    @patch('src.orchestrator.UnixSocketChannel')
+    @patch('src.orchestrator.ClaudeCodeWrapper')
+    def test_control_messages_sent_in_batches(self, mock_wrapper, mock_channel, mock_thread):
+        """Test that the agent's protocol sends through a BatchingChannel"""
+        agent = ClaudeAgent("agent_000", Orchestrator())
+        agent.start()
+
+        assert isinstance(agent.channel, BatchingChannel)
+        assert agent.channel.channel is mock_channel.return_value
+        assert agent.protocol.channel is agent.channel
+
+        agent.protocol.send_task_request("agent_001", {"task": "t1"})
+        agent.channel.flush()
+        mock_channel.return_value.send_batch.assert_called_once()
+        mock_channel.return_value.send.assert_not_called()
+
+
+class TestAgentSelection:
+    """Test cases for idle agent acquisition"""
+
+    def test_agent_not_handed_out_twice(self):
+        """Test that an acquired agent is unavailable until its task finishes"""
+        orchestrator = make_orchestrator(num_agents=1)
+
+        agent = orchestrator._get_available_agent(timeout=0)
+        assert agent is not None
+        assert orchestrator._get_available_agent(timeout=0.01) is None
+
+        orchestrator._dispatch(agent, Task(task_id="t1")).result(timeout=2)
+        assert orchestrator._get_available_agent(timeout=2) is agent
+        orchestrator._stop_agent_workers()
+
+    def test_stopped_agents_are_skipped(self):
+        """Test that agents no longer running are not returned"""
+        orchestrator = make_orchestrator(num_agents=2)
+        stopped, running = orchestrator.agents.values()
+        stopped.is_running = False
+
+        assert orchestrator._get_available_agent(timeout=0) is running
+        assert orchestrator._get_available_agent(timeout=0) is None
+        orchestrator._stop_agent_workers()
+
+    def test_capable_agent_preferred_for_task_type(self):
+        """Test that typed tasks go to agents with a matching capability first"""
+        orchestrator = Orchestrator()
+        for agent_id, capabilities in [("agent_000", []), ("agent_001", ["review"])]:
+            agent = MagicMock(agent_id=agent_id, is_running=True)
+            agent.config.capabilities = capabilities
+            orchestrator.agents[agent_id] = agent
+            orchestrator._register_capabilities(agent)
+            orchestrator._release_agent(agent)
+
+        assert orchestrator._get_available_agent(timeout=0, task_type="review").agent_id == "agent_001"
+        assert orchestrator._get_available_agent(timeout=0, task_type="review").agent_id == "agent_000"
+        assert orchestrator._get_available_agent(timeout=0, task_type="review") is None
+
+    def test_parallel_subtasks_share_available_agents(self):
+        """Test that more subtasks than agents all run on the acquired agents"""
+        orchestrator = make_orchestrator(num_agents=2)
+        task = Task(task_id="parent", subtasks=[{'type': 'analysis'} for _ in range(5)])
+
+        results = orchestrator.execute_parallel_task(task)
+
+        assert [r.task_id for r in results] == [f"parent_sub{i}" for i in range(5)]
+        assert all(r.status == "success" for r in results)
+        assert len(orchestrator._idle_agents) == 2
+        orchestrator._stop_agent_workers()
+
+    def test_parallel_subtasks_share_one_deadline(self):
+        """Test that unfinished subtasks time out together at the parent deadline"""
+        orchestrator = make_orchestrator(num_agents=2)
+        slow, fast = orchestrator.agents.values()
+        release = threading.Event()
+        slow.execute_task.side_effect = lambda task: release.wait(5) and None
+        fast.execute_task.side_effect = lambda task: TaskResult(
+            task_id=task.task_id, agent_id=fast.agent_id, status="failed", result={}, error="boom"
+        )
+        task = Task(task_id="parent", timeout=0.2, subtasks=[{}, {}])
+
+        try:
+            results = orchestrator.execute_parallel_task(task)
+        finally:
+            release.set()
+            orchestrator._stop_agent_workers()
+
+        assert sorted(r.status for r in results) == ["failed", "timeout"]
+        assert [r.task_id for r in results] == ["parent_sub0", "parent_sub1"]
+
+
+class TestAsyncOrchestrator:
+    """Test cases for AsyncOrchestrator"""
+
+    def test_execute_task_stores_result(self):
+        """Test that an awaited task runs on an agent and is stored"""
+        orchestrator = make_orchestrator(orchestrator_class=AsyncOrchestrator)
+
+        result = asyncio.run(orchestrator.execute_task(Task(task_id="t1")))
+
+        assert result.status == "success"
+        assert orchestrator.get_task_result("t1") is result
+        assert list(orchestrator.task_queue) == []
+        orchestrator._stop_agent_workers()
+
+    def test_parallel_subtasks_wait_for_busy_agents(self):
+        """Test that subtasks beyond the agent count wait for an agent to free up"""
+        orchestrator = make_orchestrator(num_agents=2, orchestrator_class=AsyncOrchestrator)
+        task = Task(task_id="parent", subtasks=[{} for _ in range(5)])
+
+        results = asyncio.run(orchestrator.execute_parallel_task(task))
+
+        assert [r.task_id for r in results] == [f"parent_sub{i}" for i in range(5)]
+        assert all(r.status == "success" for r in results)
+        assert len(orchestrator._idle_agents) == 2
+        orchestrator._stop_agent_workers()
+
+    def test_execute_task_times_out(self):
+        """Test that a slow agent produces a timeout result without blocking the loop"""
+        orchestrator = make_orchestrator(orchestrator_class=AsyncOrchestrator)
+        agent, = orchestrator.agents.values()
+        release = threading.Event()
+        agent.execute_task.side_effect = lambda task: release.wait(5) and None
+
+        try:
+            result = asyncio.run(orchestrator.execute_task(Task(task_id="slow", timeout=0.05)))
+        finally:
+            release.set()
+            orchestrator._stop_agent_workers()
+
+        assert result.status == "timeout"
+        assert result.agent_id == agent.agent_id
+
+    def test_waiter_woken_by_release(self):
+        """Test that an async waiter gets an agent as soon as it is released"""
+        orchestrator = make_orchestrator(orchestrator_class=AsyncOrchestrator)
+        agent = orchestrator._get_available_agent(timeout=0)
+
+        async def wait_for_agent():
+            waiting = asyncio.ensure_future(orchestrator._get_available_agent_async(Task(task_id="t", timeout=5)))
+            while not orchestrator._agent_waiters:
+                await asyncio.sleep(0)
+            threading.Timer(0.01, orchestrator._release_agent, args=(agent,)).start()
+            return await waiting
+
+        assert asyncio.run(wait_for_agent()) is agent
+        assert not orchestrator._agent_waiters
+        orchestrator._stop_agent_workers()
+
+    def test_release_skips_waiters_that_already_gave_up(self):
+        """Test that a timed-out waiter still registered does not swallow the wake-up"""
+        orchestrator = make_orchestrator(orchestrator_class=AsyncOrchestrator)
+        agent = orchestrator._get_available_agent(timeout=0)
+
+        async def wait_for_agent():
+            loop = asyncio.get_running_loop()
+            expired = loop.create_future()
+            expired.cancel()
+            orchestrator._agent_waiters.append((loop, expired))
+            waiting = asyncio.ensure_future(orchestrator._get_available_agent_async(Task(task_id="t", timeout=5)))
+            while len(orchestrator._agent_waiters) < 2:
+                await asyncio.sleep(0)
+            threading.Timer(0.01, orchestrator._release_agent, args=(agent,)).start()
+            return await asyncio.wait_for(waiting, 1)
+
+        assert asyncio.run(wait_for_agent()) is agent
+        orchestrator._stop_agent_workers()
+
+    def test_waiter_times_out_without_agent(self):
+        """Test that an async waiter gives up at the task timeout and unregisters"""
+        orchestrator = make_orchestrator(orchestrator_class=AsyncOrchestrator)
+        orchestrator._get_available_agent(timeout=0)
+
+        assert asyncio.run(orchestrator._get_available_agent_async(Task(task_id="t", timeout=0.05))) is None
+        assert not orchestrator._agent_waiters
+        orchestrator._stop_agent_workers()
+
+
+class TestResultCache:
+    """Test cases for the task result cache"""
+
+    def test_cache_is_disabled_by_default(self):
+        """Test that repeated tasks run again unless a cache TTL is configured"""
+        orchestrator = make_orchestrator()
+        agent = orchestrator.agents["agent_000"]
+
+        orchestrator.execute_task(Task(task_id="t1", task_type="analysis", description="same"))
+        orchestrator.execute_task(Task(task_id="t2", task_type="analysis", description="same"))
+
+        assert agent.execute_task.call_count == 2
+        assert not orchestrator._result_cache
+        assert (orchestrator.stats["cache_hits"], orchestrator.stats["cache_misses"]) == (0, 0)
+        orchestrator._stop_agent_workers()
+
+    def test_identical_task_served_from_cache(self):
+        """Test that a repeated task reuses the previous successful result"""
+        orchestrator = make_orchestrator()
+        orchestrator.config["result_cache_ttl"] = 3600
+        agent = orchestrator.agents["agent_000"]
+
+        first = orchestrator.execute_task(Task(task_id="t1", task_type="analysis", description="same"))
+        second = orchestrator.execute_task(Task(task_id="t2", task_type="analysis", description="same"))
+
+        assert agent.execute_task.call_count == 1
+        assert second.task_id == "t2"
+        assert second.result == first.result
+        assert (orchestrator.stats["cache_hits"], orchestrator.stats["cache_misses"]) == (1, 1)
+        orchestrator._stop_agent_workers()
+
+    def test_changed_file_misses_cache(self, tmp_path):
+        """Test that editing an input file invalidates the cached result"""
+        orchestrator = make_orchestrator()
+        source = tmp_path / "module.py"
+        source.write_text("x = 1\n")
+        task = Task(task_type="code_review", files=[str(source)])
+        key = orchestrator._task_cache_key(task)
+
+        source.write_text("x = 22\n")
+
+        assert orchestrator._task_cache_key(task) != key
+        orchestrator._stop_agent_workers()
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache keeps at most result_cache_size entries"""
+        orchestrator = make_orchestrator(num_agents=0)
+        orchestrator.config["result_cache_ttl"] = 3600
+        orchestrator.config["result_cache_size"] = 2
+        result = TaskResult(task_id="t", agent_id="agent_000", status="success", result={})
+        for key in ("a", "b"):
+            orchestrator._cache_result(key, result)
+        orchestrator._get_cached_result("a")
+        orchestrator._cache_result("c", result)
+
+        assert list(orchestrator._result_cache) == ["a", "c"]
+
+    def test_concurrent_identical_tasks_run_once(self):
+        """Test that identical tasks submitted together share one execution"""
+        orchestrator = make_orchestrator(num_agents=2)
+        release = threading.Event()
+        for agent in orchestrator.agents.values():
+            agent.execute_task.side_effect = lambda task, agent_id=agent.agent_id: release.wait(5) and TaskResult(
+                task_id=task.task_id, agent_id=agent_id, status="success", result={'shared': True}
+            )
+        results = {}
+
+        def run(task_id):
+            results[task_id] = orchestrator.execute_task(Task(task_id=task_id, description="dup"))
+
+        threads = [threading.Thread(target=run, args=(f"t{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        while not orchestrator._inflight:
+            pass
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        calls = sum(a.execute_task.call_count for a in orchestrator.agents.values())
+        assert calls == 1
+        assert sorted(r.task_id for r in results.values()) == ["t0", "t1", "t2", "t3"]
+        assert all(r.result == {'shared': True} for r in results.values())
+        assert orchestrator._inflight == {}
+        orchestrator._stop_agent_workers()
+
+
+class TestStatsReporting:
+    """Test cases for event-driven stats reporting"""
+
+    def test_stats_logged_at_most_once_per_interval(self, caplog):
+        """Test that stats updates log only after the interval has passed"""
+        orchestrator = make_orchestrator(num_agents=0)
+        result = TaskResult(task_id="t", agent_id="agent_000", status="success", result={})
+
+        with caplog.at_level("INFO", logger="src.orchestrator"):
+            orchestrator._update_stats(result)
+            orchestrator._last_stats_log -= orchestrator.STATS_LOG_INTERVAL
+            orchestrator._update_stats(result)
+            orchestrator._update_stats(result)
+
+        assert sum("Stats - Completed" in r.message for r in caplog.records) == 1
+        assert orchestrator.stats["tasks_completed"] == 3
+
+    def test_average_execution_time_tracks_updates(self):
+        """Test that the average execution time follows each stats update"""
+        orchestrator = make_orchestrator(num_agents=0)
+        assert orchestrator._get_avg_execution_time() == 0.0
+
+        for status, execution_time in [("success", 1.0), ("failed", 2.0), ("success", 6.0)]:
+            orchestrator._update_stats(TaskResult(
+                task_id="t", agent_id="x", status=status, result={}, execution_time=execution_time
+            ))
+
+        assert orchestrator._get_avg_execution_time() == 3.0
+
+    def test_concurrent_updates_are_not_lost(self):
+        """Test that stats updates from many threads are all counted"""
+        orchestrator = make_orchestrator(num_agents=0)
+        result = TaskResult(task_id="t", agent_id="x", status="success", result={}, execution_time=1.0)
+
+        def update():
+            for _ in range(1000):
+                orchestrator._update_stats(result)
+
+        threads = [threading.Thread(target=update) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert orchestrator.stats["tasks_completed"] == 8000
+        assert orchestrator.stats["total_execution_time"] == 8000.0
+
+    def test_agent_status_formats_as_indented_json(self):
+        """Test that agent status renders as indented JSON for the REPL"""
+        status = {"agent_000": {"running": True, "current_task": None, "health_check_failed": False}}
+
+        text = format_status_json(status)
+
+        assert json.loads(text) == status
+        assert '\n  "agent_000": {' in text
+
+
+class TestResultStore:
+    """Test cases for the bounded task result store"""
+
+    def test_results_evict_least_recently_used(self):
+        """Test that results are capped and lookups refresh recency"""
+        orchestrator = make_orchestrator(num_agents=0)
+        orchestrator._results_max = 2
+        for task_id in ("a", "b"):
+            orchestrator._store_result(task_id, TaskResult(task_id=task_id, agent_id="x", status="success", result={}))
+
+        assert orchestrator.get_task_result("a") is not None
+        orchestrator._store_result("c", TaskResult(task_id="c", agent_id="x", status="success", result={}))
+
+        assert orchestrator.get_task_result("b") is None
+        assert list(orchestrator.results) == ["a", "c"]
+
+
+class TestConfigLoading:
+    """Test cases for orchestrator configuration loading"""
+
+    def test_user_config_overrides_defaults(self, tmp_path):
+        """Test that YAML settings are merged over the defaults"""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("num_agents: 5\nresult_cache_ttl: 60\n")
+
+        orchestrator = Orchestrator(str(config_path))
+
+        assert orchestrator.config["num_agents"] == 5
+        assert orchestrator.config["result_cache_ttl"] == 60
+        assert orchestrator.config["task_timeout"] == 300
+
+    def test_missing_config_uses_defaults(self, tmp_path):
+        """Test that a nonexistent config path falls back to the defaults"""
+        orchestrator = Orchestrator(str(tmp_path / "missing.yaml"))
+
+        assert orchestrator.config["num_agents"] == 3
+
+
+class TestPeriodicTasks:
+    """Test cases for the shared periodic task scheduler"""
+
+    def test_periodic_task_repeats_while_active(self):
+        """Test that a periodic task re-runs until it is no longer active"""
+        orchestrator = make_orchestrator(num_agents=0)
+        calls = []
+        orchestrator._schedule_periodic(0.01, lambda: calls.append(1), lambda: len(calls) < 3)
+
+        orchestrator._scheduler.run()
+
+        assert len(calls) == 3
+        assert orchestrator._scheduler.empty()
+
+    def test_stuck_executor_task_does_not_block_others(self):
+        """Test that a blocked check neither delays other checks nor piles up"""
+        orchestrator = make_orchestrator(num_agents=0)
+        release = threading.Event()
+        stuck_calls, other_calls = [], []
+
+        def stuck():
+            stuck_calls.append(1)
+            release.wait(timeout=5)
+
+        orchestrator._schedule_periodic(
+            0.01, stuck, lambda: len(other_calls) < 3, executor=orchestrator._health_check_executor
+        )
+        orchestrator._schedule_periodic(
+            0.01, lambda: other_calls.append(1), lambda: len(other_calls) < 3,
+            executor=orchestrator._health_check_executor
+        )
+
+        scheduler = threading.Thread(target=orchestrator._scheduler.run)
+        scheduler.start()
+        scheduler.join(timeout=2)
+        release.set()
+
+        assert not scheduler.is_alive()
+        assert len(other_calls) == 3
+        assert len(stuck_calls) == 1
+        orchestrator._health_check_executor.shutdown()
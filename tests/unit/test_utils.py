@@ -470,4 +470,136 @@ class TestCacheUtilities:
         
         # Second call should hit function again
         result2 = short_lived_cache(1)
-        assert call_count == 2
\ No newline at end of file
+        assert call_count == 2
+
+class TestRWLock:
+    """Test readers-writer lock"""
+
+    def test_readers_share_lock(self):
+        """Test that readers do not block each other"""
+        from conductor.utils import RWLock
+        import threading
+
+        lock = RWLock()
+        inside = threading.Barrier(2, timeout=5)
+
+        def reader():
+            with lock.read_lock():
+                inside.wait()
+
+        threads = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert not inside.broken
+
+    def test_writer_excludes_readers(self):
+        """Test that a writer holds the lock exclusively"""
+        from conductor.utils import RWLock
+        import threading
+
+        lock = RWLock()
+        events = []
+
+        def reader():
+            with lock.read_lock():
+                events.append("read")
+
+        with lock.write_lock():
+            thread = threading.Thread(target=reader)
+            thread.start()
+            time.sleep(0.05)
+            events.append("write")
+        thread.join(timeout=5)
+
+        assert events == ["write", "read"]
+
+
+class TestWorkStealingExecutor:
+    """Test work-stealing executor"""
+
+    def test_idle_worker_steals_from_busy_worker(self):
+        """Test that work queued behind a blocked worker still runs"""
+        from conductor.utils import WorkStealingExecutor
+        import threading
+
+        executor = WorkStealingExecutor(max_workers=2)
+        release = threading.Event()
+        try:
+            blocker = executor.submit(release.wait, 5)
+            results = [executor.submit(lambda i=i: i * 2) for i in range(6)]
+
+            assert sorted(f.result(timeout=5) for f in results) == [0, 2, 4, 6, 8, 10]
+            assert not blocker.done()
+        finally:
+            release.set()
+            executor.shutdown(wait=True)
+
+    def test_submit_unparks_idle_worker(self):
+        """Test that work dealt to a busy worker wakes a parked worker to steal it"""
+        from conductor.utils import WorkStealingExecutor
+        import threading
+
+        executor = WorkStealingExecutor(max_workers=2)
+        release = threading.Event()
+        try:
+            executor.submit(release.wait, 5)
+            executor.submit(int).result(timeout=5)
+            time.sleep(0.05)  # let the second worker park
+
+            # Dealt to the blocked first worker
+            start = time.time()
+            assert executor.submit(lambda: 42).result(timeout=5) == 42
+            assert time.time() - start < 1
+        finally:
+            release.set()
+            executor.shutdown(wait=True)
+
+    def test_concurrent_submits_keep_park_list_consistent(self):
+        """Test that submits from many threads all run and leave the park list intact"""
+        from conductor.utils import WorkStealingExecutor
+        import threading
+
+        executor = WorkStealingExecutor(max_workers=4)
+        futures = []
+
+        def submitter():
+            for _ in range(200):
+                futures.append(executor.submit(int, "1"))
+
+        threads = [threading.Thread(target=submitter) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        try:
+            assert sum(f.result(timeout=5) for f in futures) == 800
+            with executor._park_lock:
+                assert sorted(executor._parked) == sorted(executor._parked_set)
+        finally:
+            executor.shutdown(wait=True)
+
+    def test_shutdown_runs_queued_work(self):
+        """Test that shutdown waits for queued work and then rejects new work"""
+        from conductor.utils import WorkStealingExecutor
+
+        executor = WorkStealingExecutor(max_workers=1)
+        futures = [executor.submit(time.sleep, 0.01) for _ in range(3)]
+        executor.shutdown(wait=True)
+
+        assert all(f.done() and f.exception() is None for f in futures)
+        with pytest.raises(RuntimeError):
+            executor.submit(time.sleep, 0)
+
+    def test_exceptions_reach_future(self):
+        """Test that errors raised by submitted work are set on the future"""
+        from conductor.utils import WorkStealingExecutor
+
+        executor = WorkStealingExecutor(max_workers=1)
+        future = executor.submit(int, "not a number")
+        executor.shutdown(wait=True)
+
+        assert isinstance(future.exception(), ValueError)
+